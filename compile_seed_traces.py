@@ -0,0 +1,56 @@
+import argparse
+from typing import List, Tuple
+
+from game.core.replay import save_replay
+from game.core.timeline import TimelineManager
+
+
+def parse_trace(text: str) -> List[Tuple[int, int]]:
+    """Parse lines printed as "pyxel.mouse_x=86pyxel.mouse_y=96"."""
+    coords: List[Tuple[int, int]] = []
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or "pyxel.mouse_x=" not in line:
+            continue
+        try:
+            left, ypart = line.split("pyxel.mouse_y=")
+            x = int(left.split("pyxel.mouse_x=")[1])
+            y = int(ypart)
+            coords.append((x, y))
+        except Exception:
+            # ignore malformed lines
+            pass
+    # drop trailing (0,0) spam
+    while coords and coords[-1] == (0, 0):
+        coords.pop()
+    return coords
+
+
+def main():
+    p = argparse.ArgumentParser(
+        description="Compile a printed mouse trace into a binary seed-ghost asset."
+    )
+    p.add_argument("infile", help="Path to the raw trace text")
+    p.add_argument("outfile", help="Path to write the replay asset (.rpl)")
+    p.add_argument("--level", "-l", required=True, help="Level name for the header")
+    p.add_argument("--fps", type=int, default=30, help="Frames per second")
+    p.add_argument(
+        "--seed", type=int, default=0, help="RNG seed recorded in the header"
+    )
+    args = p.parse_args()
+
+    with open(args.infile, encoding="utf-8") as f:
+        coords = parse_trace(f.read())
+
+    tm = TimelineManager(max_frames=len(coords))
+    tm.start_run()
+    for x, y in coords:
+        tm.record_frame(x, y, False, False, False, False)
+    tm.end_run()
+
+    save_replay(args.outfile, tm, args.level, args.fps, args.seed)
+    print(f"Compiled {len(coords)} frames to {args.outfile}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+from __future__ import annotations
+from typing import Dict, Final, List, Tuple
+
+# Cell size in pixels (about a button's diameter)
+CELL: Final[int] = 16
+
+_Cell = Tuple[str, int, int]  # (room, cx, cy)
+
+
+class ActorGrid:
+    """
+    Where the actors holding a mouse button are this tick: a spatial hash keyed
+    by (room, cell). The simulation rebuilds it once per tick from the
+    dispatched actors' effective positions, so hold-driven objects ask "who is
+    holding inside me" without testing every cursor against every object.
+    """
+
+    def __init__(self) -> None:
+        self._cells: Dict[_Cell, List[Tuple[int, int, int]]] = {}
+
+    def clear(self) -> None:
+        self._cells.clear()
+
+    def add(self, actor_id: int, x: int, y: int, room_id: str) -> None:
+        key = (room_id, x // CELL, y // CELL)
+        cell = self._cells.get(key)
+        if cell is None:
+            self._cells[key] = [(actor_id, x, y)]
+        else:
+            cell.append((actor_id, x, y))
+
+    def holders_in_circle(self, room_id: str, cx: int, cy: int, r: int) -> List[int]:
+        """Ids of the actors holding within r of (cx, cy) in room_id."""
+        out: List[int] = []
+        r2 = r * r
+        for gy in range((cy - r) // CELL, (cy + r) // CELL + 1):
+            for gx in range((cx - r) // CELL, (cx + r) // CELL + 1):
+                for actor_id, x, y in self._cells.get((room_id, gx, gy), ()):
+                    dx, dy = x - cx, y - cy
+                    if dx * dx + dy * dy <= r2:
+                        out.append(actor_id)
+        return out
@@ -0,0 +1,66 @@
+from __future__ import annotations
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+
+from game.core.render import gfx
+from game.core.sprites import SPRITES, Pattern, Rect, Sprite, pattern_spans
+
+
+class BigText:
+    """
+    Blocky text from a pattern font (char -> rows of '#'/'.'), drawn at an
+    integer scale. Each glyph is rasterized once per scale into the sprite bank
+    and drawn with a blt; if the bank is full, glyphs fall back to merged
+    spans (one rect per run of lit cells). The layout of the last string drawn
+    is kept, so redrawing unchanged text does no per-character work.
+    Unknown characters use `fallback`.
+    """
+
+    def __init__(
+        self,
+        font: Mapping[str, Sequence[str]],
+        scale: int,
+        color: int = 7,
+        gap: Optional[int] = None,
+        fallback: str = "0",
+    ) -> None:
+        self.font = font
+        self.scale = scale
+        self.color = color
+        self.gap = scale if gap is None else gap
+        self.fallback = fallback
+        self.glyph_w = max(len(row) for pat in font.values() for row in pat) * scale
+
+        self._glyphs: Dict[str, Tuple[Optional[Sprite], Tuple[Rect, ...]]] = {}
+        self._text: Optional[str] = None
+        self._layout: List[Tuple[int, Optional[Sprite], Tuple[Rect, ...]]] = []
+
+    def width(self, text: str) -> int:
+        if not text:
+            return 0
+        return len(text) * self.glyph_w + (len(text) - 1) * self.gap
+
+    def _glyph(self, ch: str) -> Tuple[Optional[Sprite], Tuple[Rect, ...]]:
+        g = self._glyphs.get(ch)
+        if g is None:
+            pat: Pattern = tuple(self.font.get(ch, self.font[self.fallback]))
+            try:
+                g = (SPRITES.get(((pat, self.color),), self.scale), ())
+            except RuntimeError:  # sprite bank full
+                g = (None, pattern_spans(pat, self.scale))
+            self._glyphs[ch] = g
+        return g
+
+    def draw(self, x: int, y: int, text: str) -> None:
+        if text != self._text:
+            step = self.glyph_w + self.gap
+            self._layout = [(i * step, *self._glyph(ch)) for i, ch in enumerate(text)]
+            self._text = text
+
+        for dx, spr, spans in self._layout:
+            if spr is not None:
+                u, v, w, h, colkey = spr
+                gfx.blt(x + dx, y, SPRITES.bank, u, v, w, h, colkey)
+            else:
+                for sx, sy, sw, sh in spans:
+                    gfx.rect(x + dx + sx, y + sy, sw, sh, self.color)
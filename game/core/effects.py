@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import Any, Final, List, Optional, Sequence, Tuple
 
-import pyxel
+import numpy as np
+
+from game.core.render import gfx
+
+# Bright colors used by celebrations
+FIREWORK_PALETTE: Final[Tuple[int, ...]] = (7, 8, 9, 10, 11, 12, 13, 14)
 
 
 @dataclass(slots=True)
@@ -22,21 +27,212 @@ class Ripple:
     def draw(self) -> None:
         r = int(self.max_radius * self.age / self.max_age)
         if r > 0:
-            pyxel.circb(self.x, self.y, r, self.color)
+            gfx.circb(self.x, self.y, r, self.color)
 
 
 class Effects:
-    """Lightweight VFX manager (background layer)."""
+    """
+    Lightweight VFX manager (background layer).
+
+    Ripples live in a fixed ring preallocated up front: add_click() takes a
+    slot from the free list and update() ages live ones in place, returning
+    expired slots. clear() recycles everything, so one instance can be kept
+    across loops. When the ring is full new clicks are dropped (counted).
+    """
 
-    def __init__(self) -> None:
-        self._ripples: List[Ripple] = []
+    def __init__(self, capacity: int = 128) -> None:
+        self.capacity = capacity
+        self._pool: List[Ripple] = [Ripple(0, 0) for _ in range(capacity)]
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+        self._live: List[int] = []  # slot indices, oldest first
+        self.peak = 0
+        self.dropped = 0
+
+    @property
+    def live(self) -> int:
+        return len(self._live)
+
+    def clear(self) -> None:
+        self._free.extend(self._live)
+        self._live.clear()
 
     def add_click(self, x: int, y: int, color: int) -> None:
-        self._ripples.append(Ripple(x, y, age=0, max_age=8, max_radius=12, color=color))
+        if not self._free:
+            self.dropped += 1
+            return
+        i = self._free.pop()
+        r = self._pool[i]
+        r.x, r.y, r.color = x, y, color
+        r.age, r.max_age, r.max_radius = 0, 8, 12
+        self._live.append(i)
+        if len(self._live) > self.peak:
+            self.peak = len(self._live)
+
+    def update(self) -> None:
+        pool, live = self._pool, self._live
+        keep = 0
+        for i in live:
+            if pool[i].update():
+                live[keep] = i
+                keep += 1
+            else:
+                self._free.append(i)
+        del live[keep:]
+
+    def draw(self) -> None:
+        pool = self._pool
+        for i in self._live:
+            pool[i].draw()
+
+
+class ParticleSystem:
+    """
+    Fixed-capacity particle pool stored as NumPy arrays (struct of arrays).
+    Live particles occupy [0, n); update() integrates them all at once and
+    fills holes left by dead ones with particles from the tail (swap-remove).
+
+    Per frame: vy += gravity, v *= drag, p += v, age += 1. Radius shrinks
+    linearly over life; radii <= pixel_radius are drawn as a single pixel.
+    With flicker > 0, each particle shows a random palette color that share
+    of frames (from the pool's own seeded generator, never the game RNG).
+    Emitting past capacity drops the extra particles.
+    """
+
+    _FIELDS: Final[Tuple[str, ...]] = (
+        "x",
+        "y",
+        "vx",
+        "vy",
+        "age",
+        "max_age",
+        "color",
+        "radius",
+    )
+
+    def __init__(
+        self,
+        capacity: int = 4096,
+        gravity: float = 0.0,
+        drag: float = 1.0,
+        pixel_radius: int = 1,
+        flicker: float = 0.0,
+        palette: Sequence[int] = FIREWORK_PALETTE,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.capacity = capacity
+        self.gravity = gravity
+        self.drag = drag
+        self.pixel_radius = pixel_radius
+        self.flicker = flicker
+        self.palette = np.asarray(palette, dtype=np.int16)
+        self._gen = np.random.default_rng(seed)
+        self.n = 0
+
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.vx = np.zeros(capacity, dtype=np.float64)
+        self.vy = np.zeros(capacity, dtype=np.float64)
+        self.age = np.zeros(capacity, dtype=np.int32)
+        self.max_age = np.ones(capacity, dtype=np.int32)
+        self.color = np.zeros(capacity, dtype=np.int16)
+        self.radius = np.zeros(capacity, dtype=np.int16)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def clear(self) -> None:
+        self.n = 0
+
+    def reseed(self, seed: Optional[int]) -> None:
+        self._gen = np.random.default_rng(seed)
+
+    def emit(
+        self,
+        x: Any,
+        y: Any,
+        vx: Any,
+        vy: Any,
+        color: Any,
+        max_age: Any,
+        radius: Any,
+    ) -> int:
+        """Add particles; scalars broadcast against arrays. Returns how many fit."""
+        cols = [
+            np.ravel(a)
+            for a in np.broadcast_arrays(x, y, vx, vy, color, max_age, radius)
+        ]
+        k = min(len(cols[0]), self.capacity - self.n)
+        if k <= 0:
+            return 0
+        x, y, vx, vy, color, max_age, radius = (c[:k] for c in cols)
+        s = slice(self.n, self.n + k)
+        self.x[s], self.y[s] = x, y
+        self.vx[s], self.vy[s] = vx, vy
+        self.age[s] = 0
+        self.max_age[s] = np.maximum(1, max_age)
+        self.color[s] = color
+        self.radius[s] = radius
+        self.n += k
+        return k
 
     def update(self) -> None:
-        self._ripples = [r for r in self._ripples if r.update()]
+        n = self.n
+        if n == 0:
+            return
+        vx, vy = self.vx[:n], self.vy[:n]
+        vy += self.gravity
+        if self.drag != 1.0:
+            vx *= self.drag
+            vy *= self.drag
+        self.x[:n] += vx
+        self.y[:n] += vy
+        self.age[:n] += 1
+
+        dead = self.age[:n] >= self.max_age[:n]
+        if not dead.any():
+            return
+        m = n - int(dead.sum())
+        holes = np.flatnonzero(dead[:m])
+        movers = m + np.flatnonzero(~dead[m:])
+        for a in self._arrays():
+            a[holes] = a[movers]
+        self.n = m
 
     def draw(self) -> None:
-        for r in self._ripples:
-            r.draw()
+        n = self.n
+        if n == 0:
+            return
+        t = self.age[:n] / self.max_age[:n]
+        r = np.maximum(1, (self.radius[:n] * (1.0 - t)).astype(np.int32))
+        ix = self.x[:n].astype(np.int32)
+        iy = self.y[:n].astype(np.int32)
+        col = self.color[:n]
+        if self.flicker > 0.0:
+            swap = self._gen.random(n) < self.flicker
+            picks = self._gen.integers(0, len(self.palette), n)
+            col = np.where(swap, self.palette[picks], col)
+        vis = (ix >= 0) & (ix < gfx.width) & (iy >= 0) & (iy < gfx.height)
+        if not vis.all():
+            ix, iy, r, col = ix[vis], iy[vis], r[vis], col[vis]
+
+        pixel_r = self.pixel_radius
+        for px, py, rad, c in zip(ix.tolist(), iy.tolist(), r.tolist(), col.tolist()):
+            if rad <= pixel_r:
+                gfx.pset(px, py, c)
+            else:
+                gfx.circ(px, py, rad, c)
+
+    def _arrays(self) -> List[np.ndarray]:
+        return [getattr(self, f) for f in self._FIELDS]
+
+    # Keyframe support: live particles + the flicker generator
+    def snapshot_state(self) -> Tuple[Any, ...]:
+        n = self.n
+        return n, [a[:n].copy() for a in self._arrays()], self._gen.bit_generator.state
+
+    def restore_state(self, state: Tuple[Any, ...]) -> None:
+        n, arrays, gen_state = state
+        for a, saved in zip(self._arrays(), arrays):
+            a[:n] = saved
+        self.n = n
+        self._gen.bit_generator.state = gen_state
@@ -0,0 +1,74 @@
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from game.objects.pickable import Pickable
+
+
+class Inventory:
+    """
+    Who holds which pickables: holder -> items and (holder, key_id) -> count.
+    Tracked pickables report every held_by change (Pickable.__setattr__), so
+    ownership checks (KeyGate/KeyWall can_open) are O(1) and carrying items
+    along only touches what that actor holds.
+    """
+
+    def __init__(self, items: Iterable[Pickable] = ()) -> None:
+        self._tracked: List[Pickable] = []
+        self._items: Dict[int, List[Pickable]] = {}
+        self._keys: Dict[Tuple[int, int], int] = {}
+        self.track(items)
+
+    def track(self, items: Iterable[Pickable]) -> None:
+        """Index exactly these pickables (any others are let go)."""
+        for p in self._tracked:
+            p.inventory = None
+        self._tracked = []
+        self._items = {}
+        self._keys = {}
+        for p in items:
+            self.add(p)
+
+    def add(self, item: Pickable) -> None:
+        item.inventory = self
+        self._tracked.append(item)
+        self._hold(item, item.held_by)
+
+    def clear(self) -> None:
+        self.track(())
+
+    def moved(self, item: Pickable, old: Optional[int]) -> None:
+        """item.held_by changed from old (called by Pickable)."""
+        if old is not None:
+            items = self._items[old]
+            items.remove(item)
+            if not items:
+                del self._items[old]
+            kid = getattr(item, "key_id", None)
+            if kid is not None:
+                n = self._keys[(old, kid)] - 1
+                if n:
+                    self._keys[(old, kid)] = n
+                else:
+                    del self._keys[(old, kid)]
+        self._hold(item, item.held_by)
+
+    def _hold(self, item: Pickable, holder: Optional[int]) -> None:
+        if holder is None:
+            return
+        self._items.setdefault(holder, []).append(item)
+        kid = getattr(item, "key_id", None)
+        if kid is not None:
+            self._keys[(holder, kid)] = self._keys.get((holder, kid), 0) + 1
+
+    # ----- queries -----
+    def holding(self, actor_id: int) -> Tuple[Pickable, ...]:
+        """Items actor_id holds, in the order picked up."""
+        return tuple(self._items.get(actor_id, ()))
+
+    def has_key(self, actor_id: int, key_id: int) -> bool:
+        return (actor_id, key_id) in self._keys
+
+    def follow(self, actor_id: int, x: int, y: int, room_id: str) -> None:
+        """Move what actor_id carries along with it (Pickable.on_actor_frame)."""
+        for p in self._items.get(actor_id, ()):
+            p.on_actor_frame(actor_id, x, y, room_id)
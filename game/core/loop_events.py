@@ -0,0 +1,33 @@
+from __future__ import annotations
+from typing import Callable, Dict, List, Literal
+
+# started   -- a loop has begun (after LevelBase.on_loop_start)
+# last_loop -- right after "started" when it is the level's last loop
+# committed -- the loop ran out / was finished and its run became a ghost
+# discarded -- the loop was restarted and its run thrown away
+LoopEvent = Literal["started", "last_loop", "committed", "discarded"]
+
+# Handlers get the loops left, counting the loop the event is about
+LoopHandler = Callable[[int], None]
+
+
+class LoopEvents:
+    """
+    Loop lifecycle bus. The Simulation emits; levels and objects subscribe to
+    react once per loop boundary instead of polling every frame.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: Dict[str, List[LoopHandler]] = {}
+
+    def subscribe(self, event: LoopEvent, fn: LoopHandler) -> None:
+        self._handlers.setdefault(event, []).append(fn)
+
+    def unsubscribe(self, event: LoopEvent, fn: LoopHandler) -> None:
+        handlers = self._handlers.get(event)
+        if handlers and fn in handlers:
+            handlers.remove(fn)
+
+    def emit(self, event: LoopEvent, loops_left: int) -> None:
+        for fn in list(self._handlers.get(event, ())):
+            fn(loops_left)
@@ -0,0 +1,294 @@
+from __future__ import annotations
+import ctypes
+import math
+import struct
+import zlib
+from typing import Any, Dict, Final, List, Optional
+
+import numpy as np
+import pyxel
+
+from game.core.render import RenderBackend
+
+FONT_W: Final[int] = 4
+FONT_H: Final[int] = 6
+_FIRST_CHAR: Final[int] = 32
+_LAST_CHAR: Final[int] = 127
+
+
+def _round(v: float) -> int:
+    # pyxel rounds coordinates half away from zero
+    if type(v) is int:
+        return v
+    n = math.trunc(v)
+    if abs(v - n) >= 0.5:
+        n += 1 if v > 0 else -1
+    return n
+
+
+# Lines step along the major axis from the lower endpoint; the offset on the
+# minor axis is computed in float32, as pyxel does
+def _steps(n: int) -> np.ndarray:
+    return np.arange(n + 1, dtype=np.float32)
+
+
+def _slope(num: int, den: int) -> np.float32:
+    return np.float32(num) / np.float32(den)
+
+
+def _round_away(a: np.ndarray) -> np.ndarray:
+    # Like _round, elementwise; adding 0.5 first would round 0.49999997 up
+    n = np.trunc(a)
+    return (n + np.sign(a) * (np.abs(a - n) >= 0.5)).astype(np.int64)
+
+
+def pixels(img: pyxel.Image) -> np.ndarray:
+    """Writable (height, width) uint8 view of a pyxel.Image's pixel data."""
+    ptr = ctypes.cast(img.data_ptr(), ctypes.POINTER(ctypes.c_uint8))
+    return np.ctypeslib.as_array(ptr, shape=(img.height, img.width))
+
+
+def _trace(draw: Any, w: int, h: int) -> np.ndarray:
+    # Let pyxel rasterize once into a scratch image; keep the coverage mask
+    img = pyxel.Image(w, h)
+    img.cls(0)
+    draw(img)
+    return pixels(img) != 0
+
+
+class NumpyBackend(RenderBackend):
+    """
+    Software rasterizer: draws into `fb`, a (height, width) uint8 array of
+    palette indices, so frames render without a window (golden images,
+    thumbnails). Primitives are whole-array NumPy operations; circle and
+    font masks come from pyxel's own rasterizer, traced once and cached.
+    Everything the game draws matches the window pixel for pixel; tri() uses
+    plain rounded scanlines and can differ from pyxel along an edge.
+    """
+
+    def __init__(self, width: int = 300, height: int = 200) -> None:
+        self.width = width
+        self.height = height
+        self.fb = np.zeros((height, width), np.uint8)
+        self._pal = np.arange(256, dtype=np.uint8)  # pal() remap, applied on write
+        self._colors: List[int] = list(pyxel.colors)
+        self._discs: Dict[int, np.ndarray] = {}
+        self._rings: Dict[int, np.ndarray] = {}
+        self._font: Optional[np.ndarray] = None
+        self._cols = np.arange(width)
+
+    # ----- helpers -----
+    def _fill(self, x0: int, y0: int, x1: int, y1: int, col: int) -> None:
+        # Half-open box, clipped to the screen
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, self.width), min(y1, self.height)
+        if x0 < x1 and y0 < y1:
+            self.fb[y0:y1, x0:x1] = self._pal[col]
+
+    def _stamp(self, x: int, y: int, mask: np.ndarray, col: int) -> None:
+        # Set the pixels of `mask` placed with its top-left at (x, y)
+        h, w = mask.shape
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w, self.width), min(y + h, self.height)
+        if x0 < x1 and y0 < y1:
+            sub = mask[y0 - y : y1 - y, x0 - x : x1 - x]
+            self.fb[y0:y1, x0:x1][sub] = self._pal[col]
+
+    def _points(self, xs: np.ndarray, ys: np.ndarray, col: int) -> None:
+        keep = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        self.fb[ys[keep], xs[keep]] = self._pal[col]
+
+    def _disc(self, r: int) -> np.ndarray:
+        mask = self._discs.get(r)
+        if mask is None:
+            s = 2 * r + 1
+            mask = _trace(lambda img: img.circ(r, r, r, 1), s, s)
+            self._discs[r] = mask
+        return mask
+
+    def _ring(self, r: int) -> np.ndarray:
+        mask = self._rings.get(r)
+        if mask is None:
+            s = 2 * r + 1
+            mask = _trace(lambda img: img.circb(r, r, r, 1), s, s)
+            self._rings[r] = mask
+        return mask
+
+    def _glyphs(self) -> np.ndarray:
+        # (char, FONT_H, FONT_W) masks of the builtin font, printable ASCII only
+        if self._font is None:
+            chars = "".join(map(chr, range(_FIRST_CHAR, _LAST_CHAR)))
+            strip = _trace(
+                lambda img: img.text(0, 0, chars, 1), len(chars) * FONT_W, FONT_H
+            )
+            glyphs = strip.reshape(FONT_H, len(chars), FONT_W).transpose(1, 0, 2)
+            blank = np.zeros((1, FONT_H, FONT_W), bool)
+            self._font = np.concatenate([glyphs, blank])
+        return self._font
+
+    # ----- primitives -----
+    def cls(self, col: int) -> None:
+        self.fb[:] = self._pal[col]
+
+    def rect(self, x: float, y: float, w: float, h: float, col: int) -> None:
+        x, y, w, h = _round(x), _round(y), _round(w), _round(h)
+        if w > 0 and h > 0:
+            self._fill(x, y, x + w, y + h, col)
+
+    def rectb(self, x: float, y: float, w: float, h: float, col: int) -> None:
+        x, y, w, h = _round(x), _round(y), _round(w), _round(h)
+        if w <= 0 or h <= 0:
+            return
+        self._fill(x, y, x + w, y + 1, col)
+        self._fill(x, y + h - 1, x + w, y + h, col)
+        self._fill(x, y, x + 1, y + h, col)
+        self._fill(x + w - 1, y, x + w, y + h, col)
+
+    def circ(self, x: float, y: float, r: float, col: int) -> None:
+        x, y, r = _round(x), _round(y), _round(r)
+        self._stamp(x - r, y - r, self._disc(r), col)
+
+    def circb(self, x: float, y: float, r: float, col: int) -> None:
+        x, y, r = _round(x), _round(y), _round(r)
+        self._stamp(x - r, y - r, self._ring(r), col)
+
+    def tri(
+        self,
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float,
+        x3: float,
+        y3: float,
+        col: int,
+    ) -> None:
+        xs = map(_round, (x1, x2, x3))
+        ys = map(_round, (y1, y2, y3))
+        p1, p2, p3 = sorted(zip(xs, ys), key=lambda p: p[1])
+        top = p1[1]
+        rows = np.arange(top, p3[1] + 1)
+        lo = np.full(len(rows), self.width)
+        hi = np.full(len(rows), -1)
+        # Each row spans the extremes of the edges crossing it
+        for (xa, ya), (xb, yb) in ((p1, p2), (p2, p3), (p1, p3)):
+            span = slice(ya - top, yb - top + 1)
+            if ya == yb:
+                e_lo, e_hi = min(xa, xb), max(xa, xb)
+            else:
+                t = rows[span] - ya
+                e_lo = e_hi = _round_away(xa + t * (xb - xa) / (yb - ya))
+            lo[span] = np.minimum(lo[span], e_lo)
+            hi[span] = np.maximum(hi[span], e_hi)
+        keep = (rows >= 0) & (rows < self.height)
+        rows, lo, hi = rows[keep], lo[keep], hi[keep]
+        if len(rows):
+            cols = self._cols
+            mask = (cols >= lo[:, None]) & (cols <= hi[:, None])
+            self.fb[rows[0] : rows[-1] + 1][mask] = self._pal[col]
+
+    def line(self, x1: float, y1: float, x2: float, y2: float, col: int) -> None:
+        x1, y1, x2, y2 = _round(x1), _round(y1), _round(x2), _round(y2)
+        if abs(x2 - x1) >= abs(y2 - y1):
+            if x1 == x2:
+                self.pset(x1, y1, col)
+                return
+            if x1 > x2:
+                x1, y1, x2, y2 = x2, y2, x1, y1
+            xs = np.arange(x1, x2 + 1)
+            ys = y1 + _round_away(_steps(x2 - x1) * _slope(y2 - y1, x2 - x1))
+        else:
+            if y1 > y2:
+                x1, y1, x2, y2 = x2, y2, x1, y1
+            ys = np.arange(y1, y2 + 1)
+            xs = x1 + _round_away(_steps(y2 - y1) * _slope(x2 - x1, y2 - y1))
+        self._points(xs, ys, col)
+
+    def pset(self, x: float, y: float, col: int) -> None:
+        x, y = _round(x), _round(y)
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.fb[y, x] = self._pal[col]
+
+    def text(self, x: float, y: float, s: str, col: int) -> None:
+        x, y = _round(x), _round(y)
+        glyphs = self._glyphs()
+        blank = len(glyphs) - 1
+        for i, line in enumerate(s.split("\n")):
+            if not line:
+                continue
+            codes = np.frombuffer(line.encode("utf-32-le"), np.uint32) - _FIRST_CHAR
+            idx = np.where(codes < blank, codes, blank)
+            mask = glyphs[idx].transpose(1, 0, 2).reshape(FONT_H, -1)
+            self._stamp(x, y + i * FONT_H, mask, col)
+
+    def blt(
+        self,
+        x: float,
+        y: float,
+        img: Any,
+        u: float,
+        v: float,
+        w: float,
+        h: float,
+        colkey: Optional[int] = None,
+    ) -> None:
+        src = pixels(pyxel.images[img] if isinstance(img, int) else img)
+        x, y, u, v = _round(x), _round(y), _round(u), _round(v)
+        w, h = _round(w), _round(h)
+        # Negative sizes flip; keep only cells inside both source and screen
+        dx = np.arange(abs(w))
+        dy = np.arange(abs(h))
+        us = u + (dx if w > 0 else dx[::-1])
+        vs = v + (dy if h > 0 else dy[::-1])
+        kx = (us >= 0) & (us < src.shape[1]) & (x + dx >= 0) & (x + dx < self.width)
+        ky = (vs >= 0) & (vs < src.shape[0]) & (y + dy >= 0) & (y + dy < self.height)
+        if not kx.any() or not ky.any():
+            return
+        block = src[np.ix_(vs[ky], us[kx])]
+        dst = np.ix_(y + dy[ky], x + dx[kx])
+        if colkey is None:
+            self.fb[dst] = self._pal[block]
+        else:
+            opaque = block != colkey
+            view = self.fb[dst]
+            view[opaque] = self._pal[block[opaque]]
+            self.fb[dst] = view
+
+    def pal(self, col1: Optional[int] = None, col2: Optional[int] = None) -> None:
+        if col1 is None or col2 is None:
+            self._pal = np.arange(256, dtype=np.uint8)
+        else:
+            self._pal[col1] = col2
+
+    def colors(self) -> List[int]:
+        return list(self._colors)
+
+    def set_colors(self, colors: List[int]) -> None:
+        self._colors = list(colors)
+
+    def copy_screen(self, img: pyxel.Image) -> None:
+        pixels(img)[: self.height, : self.width] = self.fb
+
+    # ----- output -----
+    def to_rgb(self) -> np.ndarray:
+        """(height, width, 3) uint8 frame in the current display palette."""
+        lut = np.array(self._colors, np.uint32)
+        rgb = np.stack([(lut >> 16) & 0xFF, (lut >> 8) & 0xFF, lut & 0xFF], axis=1)
+        return rgb.astype(np.uint8)[self.fb]
+
+    def save_png(self, path: str) -> None:
+        """Write the frame as an 8-bit RGB PNG."""
+        rgb = self.to_rgb()
+        h, w = rgb.shape[:2]
+        # Filter type 0 (none) in front of every scanline
+        raw = np.concatenate([np.zeros((h, 1), np.uint8), rgb.reshape(h, -1)], axis=1)
+
+        def chunk(tag: bytes, data: bytes) -> bytes:
+            body = tag + data
+            crc = struct.pack(">I", zlib.crc32(body))
+            return struct.pack(">I", len(data)) + body + crc
+
+        with open(path, "wb") as f:
+            f.write(b"\x89PNG\r\n\x1a\n")
+            f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 2, 0, 0, 0)))
+            f.write(chunk(b"IDAT", zlib.compress(raw.tobytes())))
+            f.write(chunk(b"IEND", b""))
@@ -0,0 +1,245 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Final, List, Optional, Tuple
+
+import pyxel
+
+# Screen primitives the game draws with. Everything in game/objects, game/levels
+# and the scenes calls gfx.<name>(...) instead of pyxel.<name>(...).
+PRIMITIVES: Final[Tuple[str, ...]] = (
+    "cls",
+    "rect",
+    "rectb",
+    "circ",
+    "circb",
+    "tri",
+    "line",
+    "pset",
+    "text",
+    "blt",
+    "pal",
+    "colors",
+    "set_colors",
+    "copy_screen",
+)
+
+Command = Tuple[str, Tuple[Any, ...]]
+
+
+class RenderBackend(ABC):
+    """
+    Same signatures as the pyxel functions of the same name, plus:
+      colors()/set_colors() -- read/replace the 16-entry display palette (RGB ints)
+      copy_screen(img)       -- copy the current frame into a pyxel.Image
+    """
+
+    width: int
+    height: int
+
+    @abstractmethod
+    def cls(self, col: int) -> None: ...
+    @abstractmethod
+    def rect(self, x: float, y: float, w: float, h: float, col: int) -> None: ...
+    @abstractmethod
+    def rectb(self, x: float, y: float, w: float, h: float, col: int) -> None: ...
+    @abstractmethod
+    def circ(self, x: float, y: float, r: float, col: int) -> None: ...
+    @abstractmethod
+    def circb(self, x: float, y: float, r: float, col: int) -> None: ...
+    @abstractmethod
+    def tri(
+        self,
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float,
+        x3: float,
+        y3: float,
+        col: int,
+    ) -> None: ...
+    @abstractmethod
+    def line(self, x1: float, y1: float, x2: float, y2: float, col: int) -> None: ...
+    @abstractmethod
+    def pset(self, x: float, y: float, col: int) -> None: ...
+    @abstractmethod
+    def text(self, x: float, y: float, s: str, col: int) -> None: ...
+    @abstractmethod
+    def blt(
+        self,
+        x: float,
+        y: float,
+        img: Any,
+        u: float,
+        v: float,
+        w: float,
+        h: float,
+        colkey: Optional[int] = None,
+    ) -> None: ...
+    @abstractmethod
+    def pal(self, col1: Optional[int] = None, col2: Optional[int] = None) -> None: ...
+    @abstractmethod
+    def colors(self) -> List[int]: ...
+    @abstractmethod
+    def set_colors(self, colors: List[int]) -> None: ...
+    @abstractmethod
+    def copy_screen(self, img: pyxel.Image) -> None: ...
+
+
+class PyxelBackend(RenderBackend):
+    """Draws to the pyxel window. Primitives are pyxel's own functions (no wrapper)."""
+
+    cls = staticmethod(pyxel.cls)
+    rect = staticmethod(pyxel.rect)
+    rectb = staticmethod(pyxel.rectb)
+    circ = staticmethod(pyxel.circ)
+    circb = staticmethod(pyxel.circb)
+    tri = staticmethod(pyxel.tri)
+    line = staticmethod(pyxel.line)
+    pset = staticmethod(pyxel.pset)
+    text = staticmethod(pyxel.text)
+    blt = staticmethod(pyxel.blt)
+    pal = staticmethod(pyxel.pal)
+
+    @property  # type: ignore[override]
+    def width(self) -> int:
+        return pyxel.width
+
+    @property  # type: ignore[override]
+    def height(self) -> int:
+        return pyxel.height
+
+    def colors(self) -> List[int]:
+        return list(pyxel.colors)
+
+    def set_colors(self, colors: List[int]) -> None:
+        pyxel.colors[:] = colors
+
+    def copy_screen(self, img: pyxel.Image) -> None:
+        img.blt(0, 0, pyxel.screen, 0, 0, pyxel.width, pyxel.height)
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    return None
+
+
+class NullBackend(RenderBackend):
+    """Discards everything; lets scenes run draw() headless at no cost."""
+
+    cls = rect = rectb = circ = circb = tri = line = pset = staticmethod(_noop)
+    text = blt = pal = copy_screen = staticmethod(_noop)
+
+    def __init__(self, width: int = 300, height: int = 200) -> None:
+        self.width = width
+        self.height = height
+        self._colors: List[int] = list(pyxel.colors)
+
+    def colors(self) -> List[int]:
+        return list(self._colors)
+
+    def set_colors(self, colors: List[int]) -> None:
+        self._colors = list(colors)
+
+
+def _recorder(name: str) -> Callable[..., Any]:
+    def record(self: "RecordingBackend", *args: Any) -> Any:
+        self.frame.append((name, args))
+        self.counts[name] = self.counts.get(name, 0) + 1
+        if self.inner is not None:
+            return getattr(self.inner, name)(*args)
+        return None
+
+    record.__name__ = name
+    return record
+
+
+class RecordingBackend(RenderBackend):
+    """
+    Captures every call of the current frame as (name, args) plus per-primitive
+    counts, optionally passing the calls on to another backend. end_frame()
+    hands back the frame's commands and starts a new one; `totals` keeps
+    counting across frames.
+    """
+
+    cls = _recorder("cls")
+    rect = _recorder("rect")
+    rectb = _recorder("rectb")
+    circ = _recorder("circ")
+    circb = _recorder("circb")
+    tri = _recorder("tri")
+    line = _recorder("line")
+    pset = _recorder("pset")
+    text = _recorder("text")
+    blt = _recorder("blt")
+    pal = _recorder("pal")
+    set_colors = _recorder("set_colors")
+    copy_screen = _recorder("copy_screen")
+
+    def __init__(
+        self,
+        inner: Optional[RenderBackend] = None,
+        width: int = 300,
+        height: int = 200,
+    ) -> None:
+        self.inner = inner
+        self.width = inner.width if inner is not None else width
+        self.height = inner.height if inner is not None else height
+        self.frame: List[Command] = []
+        self.counts: Dict[str, int] = {}
+        self.totals: Dict[str, int] = {}
+        self.frames = 0
+
+    def colors(self) -> List[int]:
+        return self.inner.colors() if self.inner is not None else list(pyxel.colors)
+
+    def end_frame(self) -> Tuple[List[Command], Dict[str, int]]:
+        frame, counts = self.frame, self.counts
+        for name, n in counts.items():
+            self.totals[name] = self.totals.get(name, 0) + n
+        self.frame, self.counts = [], {}
+        self.frames += 1
+        return frame, counts
+
+
+class Graphics:
+    """
+    The draw entry point (`gfx`). use() rebinds every primitive to the given
+    backend's callable, so a draw call costs the same as calling it directly.
+    """
+
+    cls: Callable[..., None]
+    rect: Callable[..., None]
+    rectb: Callable[..., None]
+    circ: Callable[..., None]
+    circb: Callable[..., None]
+    tri: Callable[..., None]
+    line: Callable[..., None]
+    pset: Callable[..., None]
+    text: Callable[..., None]
+    blt: Callable[..., None]
+    pal: Callable[..., None]
+    colors: Callable[[], List[int]]
+    set_colors: Callable[[List[int]], None]
+    copy_screen: Callable[[pyxel.Image], None]
+
+    def __init__(self, backend: RenderBackend) -> None:
+        self.backend = backend
+        self.use(backend)
+
+    def use(self, backend: RenderBackend) -> RenderBackend:
+        """Switch backends; returns the previous one."""
+        prev = self.backend
+        self.backend = backend
+        for name in PRIMITIVES:
+            setattr(self, name, getattr(backend, name))
+        return prev
+
+    @property
+    def width(self) -> int:
+        return self.backend.width
+
+    @property
+    def height(self) -> int:
+        return self.backend.height
+
+
+gfx = Graphics(PyxelBackend())
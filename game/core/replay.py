@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import mmap
+import struct
+from dataclasses import dataclass, field
+from typing import Final, List, Optional, Tuple, Union
+
+import numpy as np
+
+from game.core.timeline import Timeline, TimelineManager
+
+# Layout (little endian):
+#   header : magic "GMRP" | version u8 | fps u16 | loop_frames u32 | seed u32 |
+#            name_len u8 | name utf-8 | run_count u16
+#            (version 1 has no seed field)
+#   per run: frame_count varint |
+#            x0, y0, then dx, dy per frame as zigzag varints |
+#            rle_count varint | rle_count x (run_length varint, bits varint)
+# Button bits are < 0x80, so everything after the header is one varint stream
+# and decodes in a single vectorized pass.
+MAGIC: Final[bytes] = b"GMRP"
+VERSION: Final[int] = 2
+_HEADER: Final[struct.Struct] = struct.Struct("<4sBHIIB")
+_HEADER_V1: Final[struct.Struct] = struct.Struct("<4sBHIB")
+_RUN_COUNT: Final[struct.Struct] = struct.Struct("<H")
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+@dataclass(slots=True)
+class ReplayHeader:
+    level_name: str
+    fps: int
+    loop_frames: int
+    version: int = VERSION
+    seed: Optional[int] = None  # RNG seed of the recorded session (None in v1 files)
+
+
+@dataclass(slots=True)
+class Replay:
+    header: ReplayHeader
+    runs: List[Timeline] = field(default_factory=list)
+
+    def apply_to(self, tm: TimelineManager) -> None:
+        """Replace the manager's past runs with the loaded ones."""
+        tm.past_runs = list(self.runs)
+
+
+# ----- varints -----
+def _zigzag(n: int) -> int:
+    return (n << 1) ^ (n >> 63)
+
+
+def _put_varint(out: bytearray, n: int) -> None:
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _decode_varints(raw: np.ndarray) -> np.ndarray:
+    """Decode a whole stream of unsigned varints at once."""
+    ends = np.flatnonzero(raw < 0x80)
+    if len(ends) == 0:
+        return np.zeros(0, dtype=np.int64)
+    if ends[-1] != len(raw) - 1:
+        raise ValueError("replay ends inside a varint")
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    owner = np.repeat(np.arange(len(ends)), ends - starts + 1)
+    shift = 7 * (np.arange(len(raw)) - starts[owner])
+    parts = (raw & 0x7F).astype(np.int64) << shift
+    return np.add.reduceat(parts, starts)
+
+
+# ----- timelines -----
+def encode_timeline(tl: Timeline, out: bytearray) -> None:
+    n = len(tl)
+    _put_varint(out, n)
+
+    px = py = 0
+    xs, ys = tl.xs, tl.ys
+    for i in range(n):
+        x, y = xs[i], ys[i]
+        _put_varint(out, _zigzag(x - px))
+        _put_varint(out, _zigzag(y - py))
+        px, py = x, y
+
+    runs: List[Tuple[int, int]] = []
+    bits = tl.bits
+    for i in range(n):
+        b = bits[i]
+        if runs and runs[-1][1] == b:
+            runs[-1] = (runs[-1][0] + 1, b)
+        else:
+            runs.append((1, b))
+    _put_varint(out, len(runs))
+    for length, b in runs:
+        _put_varint(out, length)
+        _put_varint(out, b)
+
+
+def decode_timeline(
+    values: np.ndarray, pos: int, max_frames: int
+) -> Tuple[Timeline, int]:
+    """Rebuild one run from the decoded varint stream; returns it and the next offset."""
+    n = int(values[pos])
+    pos += 1
+
+    deltas = values[pos : pos + 2 * n]
+    pos += 2 * n
+    deltas = (deltas >> 1) ^ -(deltas & 1)  # zigzag
+    xs = np.cumsum(deltas[0::2]).astype(np.int16)
+    ys = np.cumsum(deltas[1::2]).astype(np.int16)
+
+    rle_count = int(values[pos])
+    pos += 1
+    pairs = values[pos : pos + 2 * rle_count]
+    pos += 2 * rle_count
+    bits = np.repeat(pairs[1::2].astype(np.uint8), pairs[0::2])
+    if len(bits) != n:
+        raise ValueError(f"replay run has {len(bits)} button frames, expected {n}")
+
+    return Timeline.from_columns(max_frames, xs, ys, bits), pos
+
+
+# ----- whole replays -----
+def dump_replay(tm: TimelineManager, level_name: str, fps: int, seed: int) -> bytes:
+    """Encode tm's past runs; seed is the Rng seed of the recorded session."""
+    name = level_name.encode("utf-8")[:255]
+    out = bytearray(
+        _HEADER.pack(MAGIC, VERSION, fps, tm.max_frames, seed & 0xFFFFFFFF, len(name))
+    )
+    out += name
+    out += _RUN_COUNT.pack(len(tm.past_runs))
+    for tl in tm.past_runs:
+        encode_timeline(tl, out)
+    return bytes(out)
+
+
+def load_replay(data: Buffer) -> Replay:
+    """
+    Decode a replay from any buffer. The varint stream is scanned through a
+    view of the buffer; the decoded columns are copied into new Timelines.
+    """
+    with memoryview(data) as buf:
+        if len(buf) < _HEADER_V1.size:
+            raise ValueError("replay too short")
+        magic, version = buf[:4].tobytes(), buf[4]
+        if magic != MAGIC:
+            raise ValueError("not a replay file")
+        seed: Optional[int] = None
+        if version == 1:
+            _, _, fps, loop_frames, name_len = _HEADER_V1.unpack_from(buf, 0)
+            pos = _HEADER_V1.size
+        elif version == VERSION:
+            if len(buf) < _HEADER.size:
+                raise ValueError("replay too short")
+            _, _, fps, loop_frames, seed, name_len = _HEADER.unpack_from(buf, 0)
+            pos = _HEADER.size
+        else:
+            raise ValueError(f"unsupported replay version {version}")
+        if len(buf) < pos + name_len + _RUN_COUNT.size:
+            raise ValueError("replay header is truncated")
+        name = str(buf[pos : pos + name_len], "utf-8")
+        pos += name_len
+        (run_count,) = _RUN_COUNT.unpack_from(buf, pos)
+        pos += _RUN_COUNT.size
+
+        replay = Replay(ReplayHeader(name, fps, loop_frames, version, seed))
+        raw = np.frombuffer(buf, dtype=np.uint8, offset=pos)
+        values = _decode_varints(raw)
+        del raw  # release the view before the buffer is closed
+        pos = 0
+        try:
+            for _ in range(run_count):
+                tl, pos = decode_timeline(values, pos, loop_frames)
+                replay.runs.append(tl)
+        except IndexError:
+            raise ValueError("replay is truncated") from None
+    return replay
+
+
+def save_replay(
+    path: str, tm: TimelineManager, level_name: str, fps: int, seed: int
+) -> None:
+    with open(path, "wb") as f:
+        f.write(dump_replay(tm, level_name, fps, seed))
+
+
+def open_replay(path: str) -> Replay:
+    """Memory-map a replay file and decode it without reading it into memory first."""
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return load_replay(mm)
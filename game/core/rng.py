@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import random
+from typing import Any, Final, Optional, Tuple
+
+# Keeps the cosmetic stream from mirroring the gameplay one for the same seed
+_COSMETIC_SALT: Final[int] = 0x5EEDC0DE
+
+
+class Rng:
+    """
+    Seeded random streams for one simulation.
+      gameplay -- anything that changes level state (key shuffles, secret codes)
+      cosmetic -- visuals only (fireworks, particles); never feeds back into logic
+    Same seed + same inputs => same run.
+    """
+
+    __slots__ = ("seed", "gameplay", "cosmetic")
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        if seed is None:
+            seed = random.getrandbits(32)
+        self.seed: int = seed
+        self.gameplay = random.Random(seed)
+        self.cosmetic = random.Random(seed ^ _COSMETIC_SALT)
+
+    def getstate(self) -> Tuple[Any, Any]:
+        return self.gameplay.getstate(), self.cosmetic.getstate()
+
+    def setstate(self, state: Tuple[Any, Any]) -> None:
+        self.gameplay.setstate(state[0])
+        self.cosmetic.setstate(state[1])
@@ -0,0 +1,66 @@
+from __future__ import annotations
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import pyxel
+
+from game.core.render import gfx
+from game.objects.base import LevelObject
+
+# (objects baked into the layer, their versions at bake time, the layer image)
+_Entry = Tuple[Tuple[LevelObject, ...], Tuple[int, ...], pyxel.Image]
+
+
+class RoomLayerCache:
+    """
+    Keeps an off-screen copy of each room's background + static objects.
+    A room is re-rendered only when its object list or one of their versions
+    changed; otherwise drawing it is a single full-screen blt.
+
+    Objects are drawn in list order. Everything from the first non-CACHEABLE
+    object onwards (buttons, pickables, ...) is drawn live on top of the layer,
+    so the final image is the same as drawing the whole list every frame.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, _Entry] = {}
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def draw(
+        self,
+        room_id: str,
+        bg: int,
+        objs: Sequence[LevelObject],
+        underlay: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """cls(bg), underlay(), then draw objs -- from the cache when still valid."""
+        n = 0
+        for o in objs:
+            if not o.CACHEABLE:
+                break
+            n += 1
+        baked = tuple(objs[:n])
+        versions = tuple([o.version for o in baked])
+
+        w, h = gfx.width, gfx.height
+        entry = self._entries.get(room_id)
+        if (
+            entry is not None
+            and entry[1] == versions
+            and len(entry[0]) == n
+            and all(a is b for a, b in zip(entry[0], baked))
+        ):
+            gfx.blt(0, 0, entry[2], 0, 0, w, h)
+        else:
+            gfx.cls(bg)
+            if underlay is not None:
+                underlay()
+            for o in baked:
+                o.draw()
+            img = entry[2] if entry is not None else pyxel.Image(w, h)
+            gfx.copy_screen(img)
+            self._entries[room_id] = (baked, versions, img)
+
+        for o in objs[n:]:
+            o.draw()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+from typing import Any, Dict, Final, Iterable, List, SupportsIndex, Tuple
+
+from game.objects.base import LevelObject
+
+# Grid cell size in pixels; rooms hold a handful of 16-32px objects
+CELL: Final[int] = 32
+
+_Cell = Tuple[int, int]
+
+
+class RoomObjects(List[LevelObject]):
+    """
+    A room's objects in draw order, plus a uniform grid over their hit areas
+    (LevelObject.bounds()). at(px, py) returns just the objects whose area
+    overlaps the cell under the point, still in draw order, so interact()
+    only asks those to handle_input().
+
+    It is a list: append/remove/... keep the grid in sync (appends and removals
+    incrementally, anything that reorders by rebuilding it). Objects must not
+    move or resize while they are in the room.
+    """
+
+    def __init__(self, objs: Iterable[LevelObject] = ()) -> None:
+        super().__init__(objs)
+        self._grid: Dict[_Cell, List[LevelObject]] = {}
+        self._reindex()
+
+    @staticmethod
+    def _cells(obj: LevelObject) -> List[_Cell]:
+        x, y, w, h = obj.bounds()
+        if w <= 0 or h <= 0:
+            return []
+        return [
+            (cx, cy)
+            for cy in range(y // CELL, (y + h - 1) // CELL + 1)
+            for cx in range(x // CELL, (x + w - 1) // CELL + 1)
+        ]
+
+    def _index(self, obj: LevelObject) -> None:
+        for c in self._cells(obj):
+            self._grid.setdefault(c, []).append(obj)
+
+    def _unindex(self, obj: LevelObject) -> None:
+        for c in self._cells(obj):
+            cell = self._grid[c]
+            cell.remove(obj)
+            if not cell:
+                del self._grid[c]
+
+    def _reindex(self) -> None:
+        self._grid = {}
+        for obj in self:
+            self._index(obj)
+
+    def at(self, px: int, py: int) -> List[LevelObject]:
+        """Objects that may react to a point, in draw order (a fresh list)."""
+        cell = self._grid.get((px // CELL, py // CELL))
+        return list(cell) if cell else []
+
+    # ----- list mutators -----
+    def append(self, obj: LevelObject) -> None:
+        super().append(obj)
+        self._index(obj)
+
+    def extend(self, objs: Iterable[LevelObject]) -> None:
+        for obj in objs:
+            self.append(obj)
+
+    def __iadd__(  # type: ignore[override]
+        self, objs: Iterable[LevelObject]
+    ) -> RoomObjects:
+        self.extend(objs)
+        return self
+
+    def remove(self, obj: LevelObject) -> None:
+        super().remove(obj)
+        self._unindex(obj)
+
+    def pop(self, i: SupportsIndex = -1) -> LevelObject:
+        obj = super().pop(i)
+        self._unindex(obj)
+        return obj
+
+    def clear(self) -> None:
+        super().clear()
+        self._grid = {}
+
+    def insert(self, i: SupportsIndex, obj: LevelObject) -> None:
+        super().insert(i, obj)
+        self._reindex()
+
+    def __setitem__(self, i: Any, value: Any) -> None:
+        super().__setitem__(i, value)
+        self._reindex()
+
+    def __delitem__(self, i: Any) -> None:
+        super().__delitem__(i)
+        self._reindex()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._reindex()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._reindex()
@@ -0,0 +1,430 @@
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Final, List, Optional, Tuple
+
+import numpy as np
+
+from game.core.actor_grid import ActorGrid
+from game.core.cursor import CursorCtx
+from game.core.loop_events import LoopEvent
+from game.core.replay import save_replay
+from game.core.rng import Rng
+from game.core.timeline import (
+    BIT_LEFT_H,
+    BIT_LEFT_P,
+    BIT_RIGHT_H,
+    BIT_RIGHT_P,
+    GhostBatch,
+    GhostFrame,
+    TimelineManager,
+)
+from game.levels.level_base import ActorInput, LevelBase
+
+# Keyframes: one level snapshot every KEYFRAME_INTERVAL ticks, newest kept in a ring
+KEYFRAME_INTERVAL: Final[int] = 30
+KEYFRAME_CAPACITY: Final[int] = 128
+
+
+@dataclass(slots=True)
+class FrameInput:
+    """Raw player input for one tick (mouse position + button press/hold state)."""
+
+    mouse_x: int = 0
+    mouse_y: int = 0
+    left_p: bool = False
+    right_p: bool = False
+    left_h: bool = False
+    right_h: bool = False
+
+
+@dataclass(slots=True)
+class Keyframe:
+    """State needed to resume the current loop at `tick` (before that tick is simulated)."""
+
+    tick: int
+    level_state: Any
+    player_ctx: CursorCtx
+    ghost_ctxs: List[CursorCtx]
+    player_x: int
+    player_y: int
+    player_pos: Tuple[int, int]
+    rng_state: Tuple[Any, Any]
+
+
+def _copy_ctx(ctx: CursorCtx) -> CursorCtx:
+    return CursorCtx(ctx.room, ctx.offset_x, ctx.offset_y)
+
+
+class Simulation:
+    """
+    The game loop without a window: drives the level hooks, the TimelineManager and
+    the per-cursor contexts from explicit FrameInput records. Never touches pyxel,
+    so it can run headless (replay validation, benchmarks, bots). All randomness
+    comes from `rng` (seeded by `seed`), so the same seed and inputs replay exactly.
+
+    Cosmetic hooks:
+      on_click(actor_id, x, y, color)  -- a visible click (ghosts only in the player's room)
+      on_loop_started()                -- a new loop has begun (cursor consumed)
+
+    Loop boundaries are also emitted on level.loop_events, after the level's own
+    on_loop_start()/reset_level().
+    """
+
+    def __init__(
+        self,
+        level: LevelBase,
+        width: int,
+        height: int,
+        fps: int,
+        loop_seconds: int,
+        on_level_completed: Callable[[str], None] | None = None,
+        on_click: Callable[[int, int, int, int], None] | None = None,
+        on_loop_started: Callable[[], None] | None = None,
+        keyframe_interval: int = KEYFRAME_INTERVAL,
+        keyframe_capacity: int = KEYFRAME_CAPACITY,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.level = level
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.loop_frames = loop_seconds * fps
+
+        self.on_level_completed = on_level_completed
+        self.on_click = on_click
+        self.on_loop_started = on_loop_started
+
+        # Only filled for levels that opt in via LevelBase.STATE_FIELDS
+        self.keyframe_interval = max(1, keyframe_interval)
+        self._keyframes: Deque[Keyframe] = deque(maxlen=keyframe_capacity)
+
+        # Seeded streams: bind them, then reset so level state derives from the seed
+        self.rng = Rng(seed)
+        level.set_rng(self.rng)
+        level.reset_level()
+
+        # One stacked row per loop the level allows
+        self.timelines = TimelineManager(
+            max_frames=self.loop_frames,
+            max_runs=getattr(level, "max_cursors", 10),
+        )
+        self._maybe_seed_timelines()
+
+        self.tick = 0
+        self.render_tick = 0
+        # Effective ghost state of the last simulated tick (shared with the renderer)
+        self._ghost_frame: GhostFrame | None = None
+
+        # Player effective (offset + clamped) position of the last tick
+        self.player_x = 0
+        self.player_y = 0
+
+        # Positions of this tick's holding actors (see LevelBase.update_holds)
+        self._holds = ActorGrid()
+
+        # Per-cursor contexts
+        self.player_ctx: CursorCtx = CursorCtx(room=getattr(level, "start_room", "A"))
+        self.ghost_ctxs: List[CursorCtx] = []
+
+        # Cursors (lives)
+        self.max_cursors: int = getattr(level, "max_cursors", 10)
+        self.cursors_left: int = self.max_cursors
+
+        # Start first loop (consumes a cursor)
+        self._consume_and_start_new_loop()
+        # Provide levels with "loops left" (including current loop)
+        if hasattr(self.level, "set_loops_left_provider"):
+            self.level.set_loops_left_provider(lambda: self.cursors_left + 1)
+
+    @property
+    def completed(self) -> bool:
+        return getattr(self.level, "completed", False)
+
+    # ----- lifecycle -----
+    def _maybe_seed_timelines(self) -> None:
+        seed = getattr(self.level, "seed_timelines", None)
+        if callable(seed):
+            seed(self.timelines)
+
+    def restart_full(self) -> None:
+        """Completely restart the level: reset level state, ghosts, and lives."""
+        self.timelines.reset_all()
+        self.level.reset_level()
+        self._maybe_seed_timelines()
+        self.cursors_left = self.max_cursors
+        self._consume_and_start_new_loop()
+
+    def _start_new_loop_core(self) -> None:
+        self.level.on_loop_start()
+        if hasattr(self.level, "seed_timelines") and len(self.timelines.past_runs) == 0:
+            self.level.seed_timelines(self.timelines)
+        self.timelines.start_run()
+        self.tick = 0
+        self.render_tick = 0
+        self._ghost_frame = None
+        self._keyframes.clear()
+        self.player_ctx = CursorCtx(room=getattr(self.level, "start_room", "A"))
+        self.ghost_ctxs = [
+            CursorCtx(room=self.player_ctx.room) for _ in self.timelines.past_runs
+        ]
+
+    def _consume_and_start_new_loop(self) -> None:
+        # If out of cursors, reset level & timelines and refill
+        if self.cursors_left <= 0:
+            self.timelines.reset_all()
+            self.level.reset_level()
+            self.cursors_left = self.max_cursors
+
+        self.cursors_left -= 1
+        self._start_new_loop_core()
+        self._emit("started")
+        if self.cursors_left == 0:
+            self._emit("last_loop")
+        if self.on_loop_started:
+            self.on_loop_started()
+
+    def commit_and_start_next(self) -> None:
+        self.timelines.end_run()
+        self._emit("committed")
+        self._consume_and_start_new_loop()
+
+    def restart_discard_current(self) -> None:
+        self.timelines.discard_run()
+        self._emit("discarded")
+        self._consume_and_start_new_loop()
+
+    def _emit(self, event: LoopEvent) -> None:
+        # Loops left including the current one (what set_loops_left_provider reports)
+        self.level.loop_events.emit(event, self.cursors_left + 1)
+
+    # ----- stepping -----
+    def _clamp_x(self, x: int) -> int:
+        return max(0, min(self.width - 1, x))
+
+    def _clamp_y(self, y: int) -> int:
+        return max(0, min(self.height - 1, y))
+
+    def _advance(self) -> None:
+        self.render_tick = self.tick
+        self.tick += 1
+        if self.tick >= self.loop_frames:
+            self.commit_and_start_next()
+
+    def step_idle(self, mouse_x: int, mouse_y: int) -> None:
+        """Record a frame with no buttons and advance time without dispatching to the level."""
+        self._maybe_keyframe()
+        self.timelines.record_frame(
+            self._clamp_x(int(mouse_x)),
+            self._clamp_y(int(mouse_y)),
+            False,
+            False,
+            False,
+            False,
+        )
+        self._advance()
+
+    def step(self, inp: FrameInput, render: bool = True) -> None:
+        """
+        Simulate one tick: record the player, replay ghosts, dispatch the player.
+        With render=False (fast-forward ticks that are never drawn) click FX and
+        the ghost snapshot are skipped; game state is identical either way.
+        """
+        mx = self._clamp_x(int(inp.mouse_x))
+        my = self._clamp_y(int(inp.mouse_y))
+        left_p, right_p = inp.left_p, inp.right_p
+        left_h, right_h = inp.left_h, inp.right_h
+        level = self.level
+        self._maybe_keyframe()
+
+        # Record frame (raw)
+        self.timelines.record_frame(mx, my, left_p, right_p, left_h, right_h)
+
+        # --- GHOSTS ---
+        batch: GhostBatch = self.timelines.ghost_batch_for_frame(self.tick)
+        while len(self.ghost_ctxs) < len(batch):
+            self.ghost_ctxs.append(CursorCtx(room=self.player_ctx.room))
+
+        # Only ghosts with input or movement this frame need level dispatch;
+        # idle ones keep their state from the last frame they were active.
+        if getattr(level, "report_idle_ghosts", False):
+            acting = range(len(batch))
+        else:
+            acting = np.flatnonzero(batch.active).tolist()
+        xs_all = batch.x.tolist()
+        ys_all = batch.y.tolist()
+        bits_all = batch.bits.tolist()
+        colors = batch.color.tolist()
+
+        # Everyone who acts this tick, dispatched to the level in one call
+        actors: List[ActorInput] = []
+        for idx in acting:
+            rx, ry, bits = xs_all[idx], ys_all[idx], bits_all[idx]
+            ctx = self.ghost_ctxs[idx]
+            gx = self._clamp_x(rx + ctx.offset_x)
+            gy = self._clamp_y(ry + ctx.offset_y)
+            g_left_p = bool(bits & BIT_LEFT_P)
+            g_right_p = bool(bits & BIT_RIGHT_P)
+
+            # FX only if visible in the same room as the player
+            if (
+                render
+                and (g_left_p or g_right_p)
+                and ctx.room == self.player_ctx.room
+                and self.on_click
+            ):
+                self.on_click(idx, gx, gy, colors[idx])
+
+            actors.append(
+                ActorInput(
+                    idx,
+                    gx,
+                    gy,
+                    ctx,
+                    rx,
+                    ry,
+                    g_left_p,
+                    g_right_p,
+                    bool(bits & BIT_LEFT_H),
+                    bool(bits & BIT_RIGHT_H),
+                )
+            )
+
+        # --- PLAYER ---
+        pctx = self.player_ctx
+        px_eff = self._clamp_x(mx + pctx.offset_x)
+        py_eff = self._clamp_y(my + pctx.offset_y)
+        self.player_x, self.player_y = px_eff, py_eff
+
+        if (left_p or right_p) and render and self.on_click:
+            self.on_click(-1, px_eff, py_eff, 7)
+        actors.append(
+            ActorInput(
+                -1, px_eff, py_eff, pctx, mx, my, left_p, right_p, left_h, right_h
+            )
+        )
+
+        # Hold state first, then inputs (may change rooms), then frame reports
+        holds = self._holds
+        holds.clear()
+        for a in actors:
+            if a.left_h or a.right_h:
+                holds.add(a.actor_id, a.x, a.y, a.ctx.room)
+        level.update_holds(holds)
+        level.interact_batch(actors)
+
+        # Snapshot the effective state of all ghosts for the renderer
+        if render:
+            self._ghost_frame = self._build_ghost_frame(self.tick, batch)
+
+        # Completion? (time stops on the winning tick)
+        if self.completed and self.on_level_completed:
+            self.on_level_completed(getattr(level, "name", "Level"))
+            return
+
+        self._advance()
+
+    # ----- keyframes / seek -----
+    def _maybe_keyframe(self) -> None:
+        if self.tick % self.keyframe_interval:
+            return
+        kfs = self._keyframes
+        if kfs and kfs[-1].tick >= self.tick:
+            return  # already have one (e.g. re-simulating after a seek)
+        state = self.level.snapshot_state()
+        if state is None:
+            return
+        kfs.append(
+            Keyframe(
+                tick=self.tick,
+                level_state=state,
+                player_ctx=_copy_ctx(self.player_ctx),
+                ghost_ctxs=[_copy_ctx(c) for c in self.ghost_ctxs],
+                player_x=self.player_x,
+                player_y=self.player_y,
+                player_pos=self.timelines.player_pos,
+                rng_state=self.rng.getstate(),
+            )
+        )
+
+    @property
+    def seekable(self) -> bool:
+        return len(self._keyframes) > 0
+
+    def seek(self, tick: int) -> bool:
+        """
+        Rewind the current loop to `tick`: restore the nearest keyframe at or before
+        it, then re-simulate the player's recorded input up to `tick` (at most
+        keyframe_interval ticks). Frames recorded after `tick` are dropped, so play
+        continues from there. Returns False if no keyframe covers `tick`.
+        Recorded frames are replayed through step(), including those that step_idle()
+        recorded for nav clicks.
+        """
+        cur = self.timelines.current
+        if cur is None or not (0 <= tick <= self.tick):
+            return False
+        kf: Optional[Keyframe] = None
+        for k in reversed(self._keyframes):
+            if k.tick <= tick:
+                kf = k
+                break
+        if kf is None:
+            return False
+
+        redo = [cur.sample(i) for i in range(kf.tick, tick)]
+        # Keyframes past the restore point belong to the abandoned future
+        while self._keyframes[-1].tick > kf.tick:
+            self._keyframes.pop()
+
+        self.level.restore_state(kf.level_state)
+        self.player_ctx = _copy_ctx(kf.player_ctx)
+        self.ghost_ctxs = [_copy_ctx(c) for c in kf.ghost_ctxs]
+        self.player_x, self.player_y = kf.player_x, kf.player_y
+        self.timelines.player_pos = kf.player_pos
+        self.rng.setstate(kf.rng_state)
+        cur.truncate(kf.tick)
+        self.tick = kf.tick
+        self.render_tick = max(0, kf.tick - 1)
+        self._ghost_frame = None
+
+        last = len(redo) - 1
+        for i, rec in enumerate(redo):
+            if rec is None:
+                break
+            self.step(
+                FrameInput(
+                    rec.x, rec.y, rec.left_p, rec.right_p, rec.left_h, rec.right_h
+                ),
+                render=(i == last),
+            )
+        return True
+
+    # ----- ghost snapshots -----
+    def _build_ghost_frame(self, tick: int, batch: GhostBatch) -> GhostFrame:
+        n = min(len(batch), len(self.ghost_ctxs))
+        ctxs = self.ghost_ctxs[:n]
+        fxs = [rx + c.offset_x for rx, c in zip(batch.x.tolist(), ctxs)]
+        fys = [ry + c.offset_y for ry, c in zip(batch.y.tolist(), ctxs)]
+        w, h = self.width, self.height
+        return GhostFrame(
+            tick=tick,
+            xs=[max(0, min(w - 1, fx)) for fx in fxs],
+            ys=[max(0, min(h - 1, fy)) for fy in fys],
+            rooms=[c.room for c in ctxs],
+            colors=batch.color.tolist()[:n],
+            on_screen=[0 <= fx < w and 0 <= fy < h for fx, fy in zip(fxs, fys)],
+        )
+
+    def ghost_frame_for(self, tick: int) -> GhostFrame:
+        """Reuse the snapshot taken by step(); rebuild it only for ticks step() skipped."""
+        frame = self._ghost_frame
+        if frame is None or frame.tick != tick:
+            batch = self.timelines.ghost_batch_for_frame(tick)
+            frame = self._ghost_frame = self._build_ghost_frame(tick, batch)
+        return frame
+
+    # ----- replays -----
+    def save_replay(self, path: str) -> None:
+        """Write the committed runs to path, with this session's seed in the header."""
+        name = getattr(self.level, "name", "Level")
+        save_replay(path, self.timelines, name, self.fps, self.rng.seed)
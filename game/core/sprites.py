@@ -0,0 +1,295 @@
+from __future__ import annotations
+import math
+from typing import Callable, Dict, Final, Iterable, List, Optional, Sequence, Tuple
+
+import pyxel
+
+from game.core.render import gfx
+
+# Image bank reserved for rasterized icons (Door Maze loads its picture into bank 2)
+SPRITE_BANK: Final[int] = 1
+_BANK_SIZE: Final[int] = 256
+
+Pattern = Tuple[str, ...]  # rows of '#' (pixel) / '.' (transparent)
+Layer = Tuple[Pattern, int]  # (pattern, color); later layers paint over earlier ones
+Sprite = Tuple[int, int, int, int, int]  # u, v, w, h, colkey
+Rect = Tuple[int, int, int, int]  # x, y, w, h relative to the pattern's top-left
+
+# Shared icon art
+ARROW_UP: Final[Pattern] = (
+    "..##..",
+    ".####.",
+    "######",
+    "..##..",
+    "..##..",
+    "..##..",
+)
+LOCK_ICON: Final[Pattern] = (
+    "...######...",
+    "..#......#..",  # shackle top
+    ".#........#.",
+    "############",
+    "####....####",  # body top
+    "####....####",  # keyhole column
+    "#####..#####",
+    "#####..#####",
+    "############",  # body bottom
+)
+HOURGLASS: Final[Pattern] = (
+    ".##########.",
+    ".#........#.",
+    "..#......#..",
+    "...##..##...",
+    ".....##.....",
+    "...##..##...",
+    "..#......#..",
+    ".#........#.",
+    ".##########.",
+)
+
+
+def row_spans(mask: List[bool], scale: int, j: int) -> List[Rect]:
+    """Merge runs of set cells in one pattern row into scale-tall rects."""
+    spans: List[Rect] = []
+    i, n = 0, len(mask)
+    while i < n:
+        if mask[i]:
+            start = i
+            while i < n and mask[i]:
+                i += 1
+            spans.append((start * scale, j * scale, (i - start) * scale, scale))
+        else:
+            i += 1
+    return spans
+
+
+def pattern_spans(pattern: Pattern, scale: int = 1) -> Tuple[Rect, ...]:
+    """The '#' cells of a pattern as merged horizontal rects (rect-drawing path)."""
+    spans: List[Rect] = []
+    for j, row in enumerate(pattern):
+        spans.extend(row_spans([ch == "#" for ch in row], scale, j))
+    return tuple(spans)
+
+
+class SpriteCache:
+    """
+    Rasterizes ASCII patterns into the reserved image bank on first use and then
+    draws them with a single blt. Entries are keyed by content (layers + scale),
+    so identical icons on different objects share one slot. Once the bank is
+    full, draw() plots the cells of a pattern that no longer fits directly.
+    """
+
+    def __init__(self, bank: int = SPRITE_BANK) -> None:
+        self.bank = bank
+        self._entries: Dict[Tuple[Tuple[Layer, ...], int], Sprite] = {}
+        # Shelf packer state
+        self._x = 0
+        self._y = 0
+        self._row_h = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _alloc(self, w: int, h: int) -> Tuple[int, int]:
+        if self._x + w > _BANK_SIZE:
+            self._x, self._y, self._row_h = 0, self._y + self._row_h, 0
+        if w > _BANK_SIZE or self._y + h > _BANK_SIZE:
+            raise RuntimeError("sprite bank is full")
+        u, v = self._x, self._y
+        self._x += w
+        self._row_h = max(self._row_h, h)
+        return u, v
+
+    def _rasterize(self, layers: Tuple[Layer, ...], scale: int) -> Sprite:
+        h = max(len(pat) for pat, _ in layers)
+        w = max(len(row) for pat, _ in layers for row in pat)
+        sw, sh = w * scale, h * scale
+        u, v = self._alloc(sw, sh)
+
+        # Transparent key: any palette index the sprite itself doesn't use
+        used = {col for _, col in layers}
+        colkey = next(c for c in range(16) if c not in used)
+
+        grid = [[colkey] * w for _ in range(h)]
+        for pat, col in layers:
+            for j, row in enumerate(pat):
+                for i, ch in enumerate(row):
+                    if ch == "#":
+                        grid[j][i] = col
+
+        rows = []
+        for line in grid:
+            hex_row = "".join(f"{c:x}" * scale for c in line)
+            rows.extend([hex_row] * scale)
+        pyxel.images[self.bank].set(u, v, rows)
+        return u, v, sw, sh, colkey
+
+    def get(self, layers: Sequence[Layer], scale: int = 1) -> Sprite:
+        """The cached sprite for layers; raises RuntimeError if the bank is full."""
+        key = (tuple(layers), scale)
+        spr = self._entries.get(key)
+        if spr is None:
+            spr = self._entries[key] = self._rasterize(key[0], scale)
+        return spr
+
+    def draw(self, x: int, y: int, layers: Sequence[Layer], scale: int = 1) -> None:
+        try:
+            u, v, w, h, colkey = self.get(layers, scale)
+        except RuntimeError:  # sprite bank full: plot the cells directly
+            for pat, col in layers:
+                for j, row in enumerate(pat):
+                    for i, ch in enumerate(row):
+                        if ch == "#":
+                            gfx.rect(x + i * scale, y + j * scale, scale, scale, col)
+            return
+        gfx.blt(x, y, self.bank, u, v, w, h, colkey)
+
+
+SPRITES = SpriteCache()
+
+
+def draw_pattern(x: int, y: int, pattern: Pattern, color: int, scale: int = 1) -> None:
+    """Draw a one-color pattern with its top-left at (x, y)."""
+    SPRITES.draw(x, y, ((pattern, color),), scale)
+
+
+# Cursor arrow: traced once with pyxel's own tri/line into fill/outline masks, so
+# the baked sprite matches the old per-frame drawing pixel for pixel.
+POINTER_EDGE: Final[int] = 20
+_pointer_masks: Optional[Tuple[Pattern, Pattern]] = None
+_pointer_sprites: Dict[Tuple[int, int], Sprite] = {}
+
+
+def _trace(img: pyxel.Image, col: int) -> Pattern:
+    """Pattern of the pixels of img drawn in col."""
+    return tuple(
+        "".join("#" if img.pget(i, j) == col else "." for i in range(img.width))
+        for j in range(img.height)
+    )
+
+
+def _trace_pointer() -> Tuple[Pattern, Pattern]:
+    e = POINTER_EDGE
+    x1, y1 = e * 0.25, int(e * 0.75)
+    x3, y3 = e * 0.75, e * 0.25
+    size = int(max(x1, x3, y1, y3)) + 1
+    img = pyxel.Image(size, size)
+    img.cls(0)
+    img.tri(x1, y1, 0, 0, x3, y3, 1)
+    img.line(x1, y1, 0, 0, 2)
+    img.line(0, 0, x3, y3, 2)
+    img.line(x3, y3, x1, y1, 2)
+    return _trace(img, 1), _trace(img, 2)
+
+
+def pointer_sprite(fill: int, outline: int) -> Sprite:
+    global _pointer_masks
+    spr = _pointer_sprites.get((fill, outline))
+    if spr is None:
+        if _pointer_masks is None:
+            _pointer_masks = _trace_pointer()
+        body, edge = _pointer_masks
+        spr = SPRITES.get(((body, fill), (edge, outline)))
+        _pointer_sprites[(fill, outline)] = spr
+    return spr
+
+
+def bake_pointers(pairs: Iterable[Tuple[int, int]]) -> None:
+    """Rasterize the given (fill, outline) cursors up front."""
+    for fill, outline in pairs:
+        pointer_sprite(fill, outline)
+
+
+def draw_pointer(x: int, y: int, fill: int, outline: int) -> None:
+    """Draw the cursor arrow with its tip at (x, y)."""
+    u, v, w, h, colkey = pointer_sprite(fill, outline)
+    gfx.blt(x, y, SPRITES.bank, u, v, w, h, colkey)
+
+
+class ProgressFrames:
+    """
+    A progress overlay (0..1) baked into a fixed set of sprites. render(img, step)
+    draws step 1..steps in color 1 on a blank size x size scratch image. Progress
+    is quantized to `frames` evenly spaced steps (default: every step), and all
+    of them are traced into SPRITES in the overlay's color up front, so every
+    frame of the overlay is a single blt. A frame the sprite bank has no room
+    for is plotted cell by cell instead.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        steps: int,
+        render: Callable[[pyxel.Image, int], None],
+        color: int,
+        frames: Optional[int] = None,
+    ) -> None:
+        self.size = size
+        self.steps = max(1, steps)
+        self.frames = self.steps if frames is None else max(1, min(frames, self.steps))
+        self.color = color
+        self._layers: List[Tuple[Layer, ...]] = []
+        self._sprites: List[Optional[Sprite]] = []
+        for frame in range(1, self.frames + 1):
+            img = pyxel.Image(size, size)
+            img.cls(0)
+            render(img, self.step_of(frame))
+            layers = ((_trace(img, 1), color),)
+            try:
+                spr: Optional[Sprite] = SPRITES.get(layers)
+            except RuntimeError:  # sprite bank full
+                spr = None
+            self._layers.append(layers)
+            self._sprites.append(spr)
+
+    def step_of(self, frame: int) -> int:
+        """The render step shown by frame 1..frames."""
+        return -(-frame * self.steps // self.frames)
+
+    def frame_for(self, progress: float) -> int:
+        # ceil so the first frame appears immediately; the epsilon keeps
+        # progress = k / frames (give or take float error) on frame k
+        return max(1, min(self.frames, math.ceil(progress * self.frames - 1e-9)))
+
+    def draw(self, cx: int, cy: int, progress: float) -> None:
+        """Draw the overlay centered on (cx, cy); nothing at progress <= 0."""
+        if progress <= 0.0:
+            return
+        i = self.frame_for(min(1.0, progress)) - 1
+        half = self.size // 2
+        spr = self._sprites[i]
+        if spr is None:
+            SPRITES.draw(cx - half, cy - half, self._layers[i])
+            return
+        u, v, w, h, colkey = spr
+        gfx.blt(cx - half, cy - half, SPRITES.bank, u, v, w, h, colkey)
+
+
+def ring_offsets(radius: int, count: int) -> List[Tuple[int, int]]:
+    """Integer offsets of count points on a circle, clockwise from the top."""
+    start = -math.pi / 2.0
+    return [
+        (
+            int(round(radius * math.cos(start + 2.0 * math.pi * (i / count)))),
+            int(round(radius * math.sin(start + 2.0 * math.pi * (i / count)))),
+        )
+        for i in range(count)
+    ]
+
+
+def dotted_ring(
+    radius: int, dot_r: int, dots: int, color: int, frames: Optional[int] = None
+) -> ProgressFrames:
+    """
+    Ring of dots that fills clockwise from the top as progress goes 0 -> 1,
+    baked into `frames` sprites (default: one per dot).
+    """
+    offsets = ring_offsets(radius, dots)
+    size = 2 * (radius + dot_r) + 1
+    c = size // 2
+
+    def render(img: pyxel.Image, step: int) -> None:
+        for dx, dy in offsets[:step]:
+            img.circ(c + dx, c + dy, dot_r, 1)
+
+    return ProgressFrames(size, dots, render, color, frames)
@@ -1,8 +1,26 @@
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
 from typing import Final, List, Optional, Tuple
 
+import numpy as np
+
+# Button state is packed into one byte per recorded frame
+BIT_LEFT_P: Final[int] = 1 << 0
+BIT_RIGHT_P: Final[int] = 1 << 1
+BIT_LEFT_H: Final[int] = 1 << 2
+BIT_RIGHT_H: Final[int] = 1 << 3
+
+
+def pack_buttons(left_p: bool, right_p: bool, left_h: bool, right_h: bool) -> int:
+    return (
+        (BIT_LEFT_P if left_p else 0)
+        | (BIT_RIGHT_P if right_p else 0)
+        | (BIT_LEFT_H if left_h else 0)
+        | (BIT_RIGHT_H if right_h else 0)
+    )
+
 
 @dataclass(frozen=True, slots=True)
 class FrameRecord:
@@ -13,6 +31,17 @@ class FrameRecord:
     left_h: bool
     right_h: bool
 
+    @classmethod
+    def from_packed(cls, x: int, y: int, bits: int) -> "FrameRecord":
+        return cls(
+            x,
+            y,
+            bool(bits & BIT_LEFT_P),
+            bool(bits & BIT_RIGHT_P),
+            bool(bits & BIT_LEFT_H),
+            bool(bits & BIT_RIGHT_H),
+        )
+
 
 @dataclass(slots=True)
 class GhostSample:
@@ -25,22 +54,204 @@ class GhostSample:
     color: int
 
 
+@dataclass(slots=True)
+class GhostBatch:
+    """All ghosts for one frame as parallel arrays, indexed by ghost id."""
+
+    x: np.ndarray  # int16
+    y: np.ndarray  # int16
+    bits: np.ndarray  # uint8, packed BIT_* flags
+    color: np.ndarray  # uint8
+    active: np.ndarray  # bool, has input or moved this frame
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    @property
+    def left_p(self) -> np.ndarray:
+        return (self.bits & BIT_LEFT_P) != 0
+
+    @property
+    def right_p(self) -> np.ndarray:
+        return (self.bits & BIT_RIGHT_P) != 0
+
+    @property
+    def left_h(self) -> np.ndarray:
+        return (self.bits & BIT_LEFT_H) != 0
+
+    @property
+    def right_h(self) -> np.ndarray:
+        return (self.bits & BIT_RIGHT_H) != 0
+
+
+@dataclass(slots=True)
+class TimelineIndex:
+    """
+    Activity index of a finished run:
+    - input_frames: sorted frames that have any button bit set
+    - still_starts/still_ends: half-open spans of frames whose position equals the
+      previous frame's (run-length encoded)
+    """
+
+    input_frames: np.ndarray  # uint16
+    still_starts: np.ndarray  # uint16
+    still_ends: np.ndarray  # uint16
+
+    def has_input(self, frame_index: int) -> bool:
+        i = int(np.searchsorted(self.input_frames, frame_index))
+        return i < len(self.input_frames) and int(self.input_frames[i]) == frame_index
+
+    def is_still(self, frame_index: int) -> bool:
+        i = int(np.searchsorted(self.still_starts, frame_index, side="right")) - 1
+        return i >= 0 and frame_index < int(self.still_ends[i])
+
+    def active_mask(self, length: int) -> np.ndarray:
+        """Per-frame flags: input pressed/held, or moved since the previous frame."""
+        active = np.ones(length, dtype=bool)
+        for start, end in zip(self.still_starts.tolist(), self.still_ends.tolist()):
+            active[start:end] = False
+        active[self.input_frames] = True
+        if length:
+            active[0] = True  # first frame of a loop always reports
+        return active
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            self.input_frames.nbytes + self.still_starts.nbytes + self.still_ends.nbytes
+        )
+
+
+@dataclass(slots=True)
+class GhostFrame:
+    """
+    Effective ghost state for one tick, after offsets and room changes were applied.
+    Built once in update() and reused by draw().
+    """
+
+    tick: int
+    xs: List[int]  # clamped to the screen
+    ys: List[int]
+    rooms: List[str]
+    colors: List[int]
+    on_screen: List[bool]  # unclamped position lies inside the screen
+
+
 class Timeline:
+    """
+    One recorded run, stored column-wise in arrays preallocated to max_frames:
+    int16 x/y positions plus one packed byte of button bits per frame.
+    """
+
+    __slots__ = ("max_frames", "xs", "ys", "bits", "_length", "_index")
+
     def __init__(self, max_frames: int) -> None:
         self.max_frames: int = max_frames
-        self.frames: List[FrameRecord] = []
+        self.xs: array = array("h", bytes(2 * max_frames))
+        self.ys: array = array("h", bytes(2 * max_frames))
+        self.bits: bytearray = bytearray(max_frames)
+        self._length: int = 0
+        self._index: Optional[TimelineIndex] = None
+
+    def __len__(self) -> int:
+        return self._length
+
+    @classmethod
+    def from_columns(
+        cls, max_frames: int, xs: np.ndarray, ys: np.ndarray, bits: np.ndarray
+    ) -> "Timeline":
+        """Build a finished run from int16 x/y columns and packed bits (one copy each)."""
+        n = len(xs)
+        if len(ys) != n or len(bits) != n:
+            raise ValueError("timeline columns differ in length")
+        tl = cls(max(max_frames, n))
+        np.frombuffer(tl.xs, dtype=np.int16)[:n] = xs
+        np.frombuffer(tl.ys, dtype=np.int16)[:n] = ys
+        np.frombuffer(tl.bits, dtype=np.uint8)[:n] = bits
+        tl._length = n
+        return tl
+
+    @classmethod
+    def from_buffer(cls, max_frames: int, data: bytes | memoryview) -> "Timeline":
+        """
+        Bulk constructor from the packed layout written by to_buffer():
+        n int16 xs | n int16 ys | n button bytes. Frames beyond max_frames are dropped.
+        """
+        with memoryview(data) as buf:
+            n = len(buf) // 5
+            if n * 5 != len(buf):
+                raise ValueError("timeline buffer size is not a multiple of 5")
+            m = min(n, max_frames)
+            tl = cls(max_frames)
+            packed = buf.cast("B")
+            with memoryview(tl.xs) as xs, memoryview(tl.ys) as ys:
+                xs.cast("B")[: 2 * m] = packed[: 2 * m]
+                ys.cast("B")[: 2 * m] = packed[2 * n : 2 * n + 2 * m]
+            tl.bits[:m] = packed[4 * n : 4 * n + m]
+            tl._length = m
+        return tl
+
+    def to_buffer(self) -> bytes:
+        n = self._length
+        return self.xs[:n].tobytes() + self.ys[:n].tobytes() + bytes(self.bits[:n])
 
     def record(
         self, x: int, y: int, left_p: bool, right_p: bool, left_h: bool, right_h: bool
     ) -> None:
-        if len(self.frames) < self.max_frames:
-            self.frames.append(FrameRecord(x, y, left_p, right_p, left_h, right_h))
+        i = self._length
+        if i < self.max_frames:
+            self.xs[i] = x
+            self.ys[i] = y
+            self.bits[i] = pack_buttons(left_p, right_p, left_h, right_h)
+            self._length = i + 1
+            self._index = None
+
+    def truncate(self, length: int) -> None:
+        """Drop recorded frames from `length` on (rewind); capacity is kept."""
+        if length < self._length:
+            self._length = max(0, length)
+            self._index = None
+
+    def index(self) -> TimelineIndex:
+        """Build (once per finished run) the input/stillness index of the recorded frames."""
+        if self._index is None:
+            n = self._length
+            xs = np.frombuffer(self.xs, dtype=np.int16, count=n)
+            ys = np.frombuffer(self.ys, dtype=np.int16, count=n)
+            bits = np.frombuffer(self.bits, dtype=np.uint8, count=n)
+            still = np.zeros(n, dtype=np.int8)
+            if n > 1:
+                still[1:] = (xs[1:] == xs[:-1]) & (ys[1:] == ys[:-1])
+            edges = np.diff(np.concatenate(([0], still, [0])))
+            self._index = TimelineIndex(
+                input_frames=np.flatnonzero(bits).astype(np.uint16),
+                still_starts=np.flatnonzero(edges == 1).astype(np.uint16),
+                still_ends=np.flatnonzero(edges == -1).astype(np.uint16),
+            )
+        return self._index
 
     def sample(self, frame_index: int) -> Optional[FrameRecord]:
-        if 0 <= frame_index < len(self.frames):
-            return self.frames[frame_index]
+        if 0 <= frame_index < self._length:
+            return FrameRecord.from_packed(
+                self.xs[frame_index], self.ys[frame_index], self.bits[frame_index]
+            )
         return None
 
+    def last_position(self) -> Optional[Tuple[int, int]]:
+        if self._length == 0:
+            return None
+        i = self._length - 1
+        return self.xs[i], self.ys[i]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the frame columns (allocated capacity, not just used frames)."""
+        return (
+            self.xs.itemsize * len(self.xs)
+            + self.ys.itemsize * len(self.ys)
+            + len(self.bits)
+        )
+
 
 TIMELINE = Timeline
 
@@ -48,27 +259,78 @@ TIMELINE = Timeline
 class TimelineManager:
     _GHOST_COLORS: Final[tuple[int, ...]] = (12, 10, 11, 14, 8)
 
-    def __init__(self, max_frames: int) -> None:
+    def __init__(self, max_frames: int, max_runs: int = 1) -> None:
         self.max_frames: int = max_frames
-        self.past_runs: List[TIMELINE] = []
+        self._past_runs: List[TIMELINE] = []
         self._current: Optional[Timeline] = None
         self.player_pos: Tuple[int, int] = (80, 60)
 
+        # Past runs stacked into (max_runs, max_frames) matrices for batch
+        # sampling, allocated once; end_run() writes one row. Only a direct
+        # past_runs assignment restacks every row.
+        self._stack_dirty: bool = False
+        self._stack_count: int = 0
+        self._alloc_stack(max(1, max_runs))
+
+        # Last sampled frame; update() and draw() sample the same tick
+        self._batch_frame: Optional[int] = None
+        self._batch: Optional[GhostBatch] = None
+
+    @property
+    def past_runs(self) -> List[TIMELINE]:
+        return self._past_runs
+
+    @past_runs.setter
+    def past_runs(self, runs: List[TIMELINE]) -> None:
+        # Levels may seed ghosts by assigning a list directly
+        self._past_runs = runs
+        self._stack_dirty = True
+        self._invalidate_frame_cache()
+
+    @property
+    def current(self) -> Optional[Timeline]:
+        """The run being recorded this loop (None between loops)."""
+        return self._current
+
+    def _invalidate_frame_cache(self) -> None:
+        self._batch_frame = None
+        self._batch = None
+
     def start_run(self) -> None:
         self._current = Timeline(self.max_frames)
+        self._invalidate_frame_cache()
 
     def end_run(self) -> None:
         if self._current is not None:
-            self.past_runs.append(self._current)
+            self._current.index()
+            self._past_runs.append(self._current)
+            if not self._stack_dirty:
+                self._stack_run(len(self._past_runs) - 1, self._current)
         self._current = None
+        self._invalidate_frame_cache()
 
     def discard_run(self) -> None:
         self._current = None
+        self._invalidate_frame_cache()
 
     def reset_all(self) -> None:
-        self.past_runs.clear()
+        self._past_runs.clear()
         self._current = None
         self.player_pos = (80, 60)
+        self._stack_dirty = False
+        self._stack_count = 0
+        self._invalidate_frame_cache()
+
+    @property
+    def nbytes(self) -> int:
+        """Total frame-storage footprint of all runs plus the sampling stack."""
+        total = sum(tl.nbytes for tl in self._past_runs)
+        if self._current is not None:
+            total += self._current.nbytes
+        total += self._xs.nbytes + self._ys.nbytes + self._bits.nbytes
+        total += self._active.nbytes
+        total += self._lengths.nbytes + self._colors.nbytes
+        return total
 
     def record_frame(
         self, x: int, y: int, left_p: bool, right_p: bool, left_h: bool, right_h: bool
@@ -77,34 +339,99 @@ class TimelineManager:
         if self._current is not None:
             self._current.record(x, y, left_p, right_p, left_h, right_h)
 
+    def _alloc_stack(self, rows: int) -> None:
+        """(Re)allocate the stack with room for `rows` runs, keeping filled rows."""
+        f, n = self.max_frames, self._stack_count
+        xs = np.zeros((rows, f), dtype=np.int16)
+        ys = np.zeros((rows, f), dtype=np.int16)
+        bits = np.zeros((rows, f), dtype=np.uint8)
+        active = np.zeros((rows, f), dtype=bool)
+        lengths = np.zeros(rows, dtype=np.int32)
+        if n:
+            xs[:n], ys[:n], bits[:n] = self._xs[:n], self._ys[:n], self._bits[:n]
+            active[:n] = self._active[:n]
+            lengths[:n] = self._lengths[:n]
+        palette = np.asarray(self._GHOST_COLORS, dtype=np.uint8)
+        self._xs, self._ys, self._bits = xs, ys, bits
+        self._active = active
+        self._lengths = lengths
+        self._colors = palette[np.arange(rows) % len(palette)]
+
+    def _stack_run(self, row: int, tl: TIMELINE) -> None:
+        if row >= len(self._lengths):
+            # more runs than max_runs (e.g. seeded ghosts): grow geometrically
+            self._alloc_stack(max(row + 1, 2 * len(self._lengths)))
+        m = min(len(tl), self.max_frames)
+        self._lengths[row] = m
+        if m:
+            self._xs[row, :m] = np.frombuffer(tl.xs, dtype=np.int16, count=m)
+            self._ys[row, :m] = np.frombuffer(tl.ys, dtype=np.int16, count=m)
+            self._bits[row, :m] = np.frombuffer(tl.bits, dtype=np.uint8, count=m)
+            self._active[row, :m] = tl.index().active_mask(len(tl))[:m]
+        self._stack_count = row + 1
+
+    def _ensure_stack(self) -> None:
+        if not self._stack_dirty:
+            return
+        self._stack_count = 0
+        for row, tl in enumerate(self._past_runs):
+            self._stack_run(row, tl)
+        self._stack_dirty = False
+
+    def ghost_batch_for_frame(self, frame_index: int) -> GhostBatch:
+        """
+        Sample every past run at frame_index in one pass.
+        Runs that already ended idle at their last position with no inputs;
+        empty runs park at the last known player position.
+        The result is cached until another frame is sampled or the runs change;
+        treat its arrays as read-only.
+        """
+        if (
+            self._batch is not None
+            and self._batch_frame == frame_index
+            and not self._stack_dirty
+            and self._stack_count == len(self._past_runs)
+        ):
+            return self._batch
+        self._ensure_stack()
+        n = self._stack_count
+        lengths = self._lengths[:n]
+        rows = np.arange(n)
+        col = np.clip(frame_index, 0, np.maximum(lengths - 1, 0))
+        x = self._xs[rows, col]
+        y = self._ys[rows, col]
+        live = (frame_index >= 0) & (frame_index < lengths)
+        bits = np.where(live, self._bits[rows, col], 0).astype(np.uint8)
+        active = live & self._active[rows, col]
+
+        empty = lengths == 0
+        if empty.any():
+            # parked ghosts follow the player position, so they report every frame
+            x[empty], y[empty] = self.player_pos
+            active[empty] = True
+
+        self._batch = GhostBatch(
+            x=x, y=y, bits=bits, color=self._colors[:n].copy(), active=active
+        )
+        self._batch_frame = frame_index
+        return self._batch
+
     def ghosts_for_frame(self, frame_index: int) -> List[GhostSample]:
         """
         For each past run, return a GhostSample every frame.
         - While within the recorded run: replay inputs and position.
         - After the run ends: keep the ghost at its last position, with no inputs (idle).
         """
-        samples: List[GhostSample] = []
-        for idx, tl in enumerate(self.past_runs):
-            if tl.frames:
-                if 0 <= frame_index < len(tl.frames):
-                    fr = tl.frames[frame_index]
-                    left_p, right_p, left_h, right_h = (
-                        fr.left_p,
-                        fr.right_p,
-                        fr.left_h,
-                        fr.right_h,
-                    )
-                    x, y = fr.x, fr.y
-                else:
-                    # idle at final recorded position, no inputs
-                    fr = tl.frames[-1]
-                    x, y = fr.x, fr.y
-                    left_p = right_p = left_h = right_h = False
-            else:
-                # empty timeline: park at last known player position, no inputs
-                x, y = self.player_pos
-                left_p = right_p = left_h = right_h = False
-
-            color: int = self._GHOST_COLORS[idx % len(self._GHOST_COLORS)]
-            samples.append(GhostSample(x, y, left_p, right_p, left_h, right_h, color))
-        return samples
+        batch = self.ghost_batch_for_frame(frame_index)
+        return [
+            GhostSample(x, y, lp, rp, lh, rh, color)
+            for x, y, lp, rp, lh, rh, color in zip(
+                batch.x.tolist(),
+                batch.y.tolist(),
+                batch.left_p.tolist(),
+                batch.right_p.tolist(),
+                batch.left_h.tolist(),
+                batch.right_h.tolist(),
+                batch.color.tolist(),
+            )
+        ]
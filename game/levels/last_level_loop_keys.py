@@ -1,11 +1,12 @@
 # game/levels/level_last_loop_keys.py
 from __future__ import annotations
-from typing import Dict, List, Optional, Callable, Tuple
-import random
-import pyxel
+from typing import Dict, List, Optional, Tuple
 
+from game.core.render import gfx
 from game.levels.level_base import LevelBase
+from game.core.actor_grid import ActorGrid
 from game.core.cursor import CursorEvent
+from game.core.inventory import Inventory
 from game.objects.base import LevelObject, Which, Action
 from game.objects.door import Door
 from game.objects.flag import Flag
@@ -41,10 +42,21 @@ class LevelLastLoopKeys(LevelBase):
     start_room: str = "A"
     max_cursors: int = 6
     loop_seconds: int = 45
+    STATE_FIELDS = (
+        "completed",
+        "_rooms",
+        "_pickables",
+        "btn_R",
+        "btn_G",
+        "btn_B",
+        "_key_slot_idx",
+    )
 
     def __init__(self) -> None:
         self._rooms: Dict[str, List[LevelObject]] = {"A": [], "F": []}
         self.completed = False
+        # Who holds what (the gates ask it via can_open)
+        self._inventory = Inventory()
 
         # ---------- layout ----------
         W, H = 24, 24
@@ -82,6 +94,7 @@ class LevelLastLoopKeys(LevelBase):
         # FINAL (F)
         # Ghost wall guarding the switch (auto-opens on last loop)
         self.ghost = GhostWall(x=120, y=100, w=W, h=H, open_at_loops_left=1)
+        self.ghost.listen(self.loop_events)
         self.switch = ToggleSwitch(x=120, y=100, w=16, h=16, is_on=False)
 
         # Three colored gates with buttons behind them (same position)
@@ -119,7 +132,7 @@ class LevelLastLoopKeys(LevelBase):
 
         # wire gates to inventory check
         for g in (self.gate_R, self.gate_G, self.gate_B):
-            g.can_open = self._actor_has_key
+            g.can_open = self._inventory.has_key
 
         self._rooms["F"] = [
             self.ghost,
@@ -131,15 +144,7 @@ class LevelLastLoopKeys(LevelBase):
 
         # inventory list (shared)
         self._pickables: List[Key] = list(self._keys)
-
-        # loops-left provider (GameplayScene should set this; default = never open)
-        self._get_loops_left: Callable[[], int] = lambda: 999
-        self.ghost.set_loops_left_provider(self._get_loops_left)
-
-    # ----- glue for scene -----
-    def set_loops_left_provider(self, provider: Callable[[], int]) -> None:
-        self._get_loops_left = provider
-        self.ghost.set_loops_left_provider(provider)
+        self._inventory.track(self._pickables)
 
     # ----- LevelBase -----
     def reset_level(self) -> None:
@@ -189,12 +194,6 @@ class LevelLastLoopKeys(LevelBase):
     def _finish(self) -> None:
         self.completed = True
 
-    def _actor_has_key(self, actor_id: int, key_id: int) -> bool:
-        for k in self._pickables:
-            if k.held_by == actor_id and k.key_id == key_id:
-                return True
-        return False
-
     def _set_active_actor_on_gates(self, actor_id: int) -> None:
         for g in (self.gate_R, self.gate_G, self.gate_B):
             g.set_active_actor(actor_id)
@@ -206,7 +205,7 @@ class LevelLastLoopKeys(LevelBase):
     def _randomize_keys_each_loop(self) -> None:
         """Place the three keys at the three bottom slots in random order; drop them on the ground."""
         order = list(range(len(self._keys)))  # [0,1,2]
-        random.shuffle(order)
+        self.rng.gameplay.shuffle(order)
         for key, slot_idx in zip(self._keys, order):
             x, y = self._key_slots[slot_idx]
             key.held_by = None
@@ -222,21 +221,28 @@ class LevelLastLoopKeys(LevelBase):
 
     # ----- per-frame hooks -----
     def on_actor_frame(self, actor_id: int, x: int, y: int, room_id: str) -> None:
-        # 1) Ghost wall auto-open on last loop
-        self.ghost.update_auto_open()
+        # 1) Move any carried keys with their owner
+        self._inventory.follow(actor_id, x, y, room_id)
 
-        # 2) Move any carried keys with their owner
-        for k in self._pickables:
-            k.on_actor_frame(actor_id, x, y, room_id)
-
-        # 3) While all three buttons are held (in room F), keep the WIN wall open
-        all_held = self.btn_R.lit and self.btn_G.lit and self.btn_B.lit
-        self.win_wall.is_open = all_held
-
-        # 4) Instantly reflect the switch state in A (even if a ghost pressed it in F)
+        # 2) Instantly reflect the switch state in A (even if a ghost pressed it in F)
         for c in self._covers:
             c.is_open = self.switch.is_on
 
+    def update_holds(self, actors: ActorGrid) -> None:
+        # Buttons behind the gates are hold-only; only live when their gate is open
+        for gate, btn in (
+            (self.gate_R, self.btn_R),
+            (self.gate_G, self.btn_G),
+            (self.gate_B, self.btn_B),
+        ):
+            if gate.is_open:
+                btn.update_hold(actors, "F")
+            else:
+                btn.lit = False
+
+        # While all three buttons are held (in room F), keep the WIN wall open
+        self.win_wall.is_open = self.btn_R.lit and self.btn_G.lit and self.btn_B.lit
+
     # ----- input -----
     def interact(
         self, which: Which, action: Action, x: int, y: int, room_id: str
@@ -265,9 +271,8 @@ class LevelLastLoopKeys(LevelBase):
                         continue
                     if k.contains(x, y):
                         # drop any currently held item by this actor
-                        for other in self._pickables:
-                            if other.held_by == active_id:
-                                other.held_by = None
+                        for other in self._inventory.holding(active_id):
+                            other.held_by = None
                         # take this one
                         k.held_by = active_id
                         break
@@ -285,14 +290,6 @@ class LevelLastLoopKeys(LevelBase):
                     if evt is not None:
                         return evt
 
-            # Buttons behind the gates are hold-only; only handle when gate is open
-            if self.gate_R.is_open:
-                self.btn_R.handle_input(which, action, x, y)
-            if self.gate_G.is_open:
-                self.btn_G.handle_input(which, action, x, y)
-            if self.gate_B.is_open:
-                self.btn_B.handle_input(which, action, x, y)
-
             return None
 
         return None
@@ -300,7 +297,7 @@ class LevelLastLoopKeys(LevelBase):
     # ----- rendering -----
     def draw_room(self, room_id: str) -> None:
         if room_id == "A":
-            pyxel.cls(1)
+            gfx.cls(1)
             # top-left: door to F
             self.door_to_F.draw()
 
@@ -316,7 +313,7 @@ class LevelLastLoopKeys(LevelBase):
             return
 
         if room_id == "F":
-            pyxel.cls(1)
+            gfx.cls(1)
 
             # ghost or switch
             if not self.ghost._open:
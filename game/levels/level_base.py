@@ -1,9 +1,30 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Optional, Any
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
-from game.core.cursor import CursorEvent
-from game.objects.base import Which, Action
+from game.core.actor_grid import ActorGrid
+from game.core.cursor import CursorCtx, CursorEvent, apply_event
+from game.core.loop_events import LoopEvents
+from game.core.rng import Rng
+from game.core.room_cache import RoomLayerCache
+from game.objects.base import LevelObject, Which, Action
+
+
+@dataclass(slots=True)
+class ActorInput:
+    """One actor's input for a tick, as passed to LevelBase.interact_batch()."""
+
+    actor_id: int  # player=-1, ghosts=0..
+    x: int  # effective position (offset applied, clamped to the screen)
+    y: int
+    ctx: CursorCtx  # room + offset; room changes are applied to it
+    raw_x: int  # recorded position (apply_event keeps offsets relative to it)
+    raw_y: int
+    left_p: bool = False
+    right_p: bool = False
+    left_h: bool = False
+    right_h: bool = False
 
 
 class LevelBase(ABC):
@@ -13,6 +34,17 @@ class LevelBase(ABC):
     completed: bool = False
     max_cursors: int = 10
     loop_seconds: int = 10
+    # Ghosts with no input and no movement on a frame are normally skipped
+    # (no interact/on_actor_frame). Set True if on_actor_frame must see every ghost.
+    report_idle_ghosts: bool = False
+    # Keyframe support (opt-in): attributes holding this level's mutable state --
+    # scalars, objects, and lists/dicts of objects (e.g. rooms, pickables).
+    # Containers are copied shallowly; every object found in them is asked for
+    # its own snapshot_state(). Levels with an empty tuple cannot be seeked.
+    STATE_FIELDS: Tuple[str, ...] = ()
+    # Seeded random streams; the Simulation binds its own before reset_level().
+    # Unbound levels share this unseeded default.
+    rng: Rng = Rng()
 
     @abstractmethod
     def reset_level(self) -> None: ...
@@ -33,17 +65,124 @@ class LevelBase(ABC):
         """Called just before interact() for a given actor (player=-1, ghosts=0..)."""
         self._active_actor_id = actor_id  # type: ignore[attr-defined]
 
+    def update_holds(self, actors: ActorGrid) -> None:
+        """
+        Called once per tick before interact_batch(), with every actor holding a
+        mouse button. Hold-driven state (Button.update_hold) is evaluated here.
+        """
+        return None
+
+    def interact_batch(self, actors: Sequence[ActorInput]) -> None:
+        """
+        Every dispatched actor of a tick in one call, in order (acting ghosts, then
+        the player). The default is the per-call path: set_active_actor(), one
+        interact() per press/hold (L press, R press, L hold, R hold; a room change
+        applies to the actor's later calls), then on_actor_frame(). Override to
+        resolve all hits in one pass; the result must match this order.
+        """
+        for a in actors:
+            self.set_active_actor(a.actor_id)
+            x, y, ctx = a.x, a.y, a.ctx
+            if a.left_p:
+                evt = self.interact("L", "press", x, y, ctx.room)
+                if evt is not None:
+                    apply_event(ctx, evt, a.raw_x, a.raw_y)
+            if a.right_p:
+                evt = self.interact("R", "press", x, y, ctx.room)
+                if evt is not None:
+                    apply_event(ctx, evt, a.raw_x, a.raw_y)
+            if a.left_h:
+                evt = self.interact("L", "hold", x, y, ctx.room)
+                if evt is not None:
+                    apply_event(ctx, evt, a.raw_x, a.raw_y)
+            if a.right_h:
+                evt = self.interact("R", "hold", x, y, ctx.room)
+                if evt is not None:
+                    apply_event(ctx, evt, a.raw_x, a.raw_y)
+            self.on_actor_frame(a.actor_id, x, y, ctx.room)
+
     def on_actor_frame(self, actor_id: int, x: int, y: int, room_id: str) -> None:
-        """Called every frame for every actor with its effective position & room."""
+        """
+        Called every frame for the player and for every ghost that pressed, held or
+        moved, with its effective position & room (see report_idle_ghosts).
+        """
         return None
 
     def draw_room_overlay(self, room_id: str) -> None:
         """Draw extra elements that should appear above everything else (e.g., carried items)."""
         return None
 
+    @property
+    def loop_events(self) -> LoopEvents:
+        """Loop lifecycle bus (started/last_loop/committed/discarded), emitted by the Simulation."""
+        bus = getattr(self, "_loop_events", None)
+        if bus is None:
+            bus = self._loop_events = LoopEvents()  # type: ignore[attr-defined]
+        return bus
+
     def seed_timelines(self, tm: Any) -> None:
         return None
 
     def set_loops_left_provider(self, provider):  # type: ignore[no-redef]
         """GameplayScene calls this with a callable returning remaining loops (including current)."""
         return None
+
+    def set_rng(self, rng: Rng) -> None:
+        """Use rng.gameplay for anything that changes level state, rng.cosmetic for visuals."""
+        self.rng = rng
+
+    def draw_cached(
+        self,
+        room_id: str,
+        bg: int,
+        objs: Sequence[LevelObject],
+        underlay: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Same as cls(bg) + underlay() + drawing objs in order, but served from an
+        off-screen layer while none of the objects changed. underlay must only
+        draw static art for this room.
+        """
+        cache = getattr(self, "_room_layers", None)
+        if cache is None:
+            cache = self._room_layers = RoomLayerCache()  # type: ignore[attr-defined]
+        cache.draw(room_id, bg, objs, underlay)
+
+    def snapshot_state(self) -> Optional[Any]:
+        """Capture STATE_FIELDS and the state of every object they reach (None if not opted in)."""
+        if not self.STATE_FIELDS:
+            return None
+        values = {f: _copy_containers(getattr(self, f)) for f in self.STATE_FIELDS}
+        objs: Dict[int, Any] = {}
+        for v in values.values():
+            _collect_stateful(v, objs)
+        return values, [(o, o.snapshot_state()) for o in objs.values()]
+
+    def restore_state(self, state: Any) -> None:
+        values, objs = state
+        for f, v in values.items():
+            setattr(self, f, _copy_containers(v))
+        for o, st in objs:
+            o.restore_state(st)
+
+
+def _copy_containers(v: Any) -> Any:
+    # Fresh lists/dicts so later appends (spawned doors, keys) don't leak into a snapshot
+    # List subclasses (RoomObjects) are rebuilt as themselves.
+    if isinstance(v, list):
+        items = [_copy_containers(x) for x in v]
+        return items if type(v) is list else type(v)(items)
+    if isinstance(v, dict):
+        return {k: _copy_containers(x) for k, x in v.items()}
+    return v
+
+
+def _collect_stateful(v: Any, out: Dict[int, Any]) -> None:
+    if isinstance(v, (list, tuple)):
+        for x in v:
+            _collect_stateful(x, out)
+    elif isinstance(v, dict):
+        for x in v.values():
+            _collect_stateful(x, out)
+    elif hasattr(v, "snapshot_state") and not isinstance(v, LevelBase):
+        out[id(v)] = v
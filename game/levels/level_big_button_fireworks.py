@@ -1,73 +1,15 @@
 from __future__ import annotations
 from typing import List, Optional, Tuple
-import random
 import math
-import pyxel
 
+from game.core.render import gfx
 from game.levels.level_base import LevelBase
+from game.core.big_text import BigText
 from game.core.cursor import CursorEvent
+from game.core.effects import FIREWORK_PALETTE, ParticleSystem
 from game.objects.base import Which, Action
 
 
-class Firework:
-    """
-    A single burst. Runtime state is only `frame`.
-    Geometry/colors are precomputed constants; each draw() advances by 1 frame.
-    """
-
-    __slots__ = ("x", "y", "frame", "max_frames", "angles", "speeds", "r0", "base_col")
-
-    def __init__(self, x: int, y: int) -> None:
-        self.x, self.y = x, y
-        self.frame = 0
-        self.max_frames = random.randint(22, 34)
-
-        # Static burst design
-        n = random.randint(22, 36)
-        self.angles = [
-            (2.0 * math.pi * i / n) + random.uniform(-0.06, 0.06) for i in range(n)
-        ]
-        self.speeds = [random.uniform(1.2, 2.2) for _ in range(n)]  # px per frame
-        self.r0 = random.randint(2, 3)  # initial particle radius (pixels)
-        self.base_col = random.choice([7, 8, 9, 10, 11, 12, 13, 14])
-
-    @property
-    def alive(self) -> bool:
-        return self.frame < self.max_frames
-
-    def draw(self) -> None:
-        """Draw snapshot at current frame, then advance exactly one frame."""
-        if not self.alive:
-            return
-
-        t = self.frame / max(1, self.max_frames)  # 0..1
-        # simple downward gravity curve for all sparks (constant per frame)
-        gy = 0.04 * (self.frame * self.frame)
-
-        # core flash for the first few frames
-        if self.frame < 6:
-            pyxel.circ(self.x, self.y, self.r0 + 1, self.base_col)
-
-        # rings of sparks
-        for theta, spd in zip(self.angles, self.speeds):
-            r = spd * self.frame  # radial distance
-            px = int(self.x + math.cos(theta) * r)
-            py = int(self.y + math.sin(theta) * r + gy)
-            # fade size over life
-            pr = max(1, int(self.r0 * (1.0 - t)))
-            # small color flicker: 70% base, else pick another bright color
-            col = (
-                self.base_col
-                if random.random() < 0.7
-                else random.choice([7, 8, 9, 10, 11, 12, 13, 14])
-            )
-            if 0 <= px < pyxel.width and 0 <= py < pyxel.height:
-                pyxel.circ(px, py, pr, col)
-
-        # advance one frame *per draw*
-        self.frame += 1
-
-
 class LevelBigButtonFireworks(LevelBase):
     """
     One room:
@@ -83,6 +25,10 @@ class LevelBigButtonFireworks(LevelBase):
     start_room: str = "A"
     max_cursors: int = 99
     loop_seconds: int = 99
+    # Canvas size for spawn positions (logic must not query pyxel; see game/main.py)
+    SCREEN_W: int = 300
+    SCREEN_H: int = 200
+    STATE_FIELDS = ("completed", "_count", "_btn_flash", "_sparks")
 
     DIGITS: dict[str, List[str]] = {
         "0": ["###", "#.#", "#.#", "#.#", "###"],
@@ -103,19 +49,29 @@ class LevelBigButtonFireworks(LevelBase):
         self._btn_radius: int = 44
         self._btn_flash: int = 0
 
-        self._fireworks: List[Firework] = []
+        # All bursts share one pool. Sparks fly out radially under a little
+        # gravity, shrink over life and flicker to another bright color 30% of
+        # frames. They advance once per draw (see draw_room).
+        self._sparks = ParticleSystem(gravity=0.08, pixel_radius=0, flicker=0.3)
+
+        # Counter rendering; text and position are only recomputed on change
+        self._counter = BigText(self.DIGITS, scale=8, color=7)
+        self._counter_value: Optional[int] = None
+        self._counter_text = ""
+        self._counter_x = 0
 
     # --- LevelBase ---
     def reset_level(self) -> None:
         self.completed = False
         self._count = 0
         self._btn_flash = 0
-        self._fireworks.clear()
+        self._sparks.clear()
+        self._sparks.reseed(self.rng.cosmetic.getrandbits(32))
 
     def on_loop_start(self) -> None:
         self._count = 0
         self._btn_flash = 0
-        self._fireworks.clear()
+        self._sparks.clear()
 
     # --- helpers ---
     def _circ_contains(self, px: int, py: int, cx: int, cy: int, r: int) -> bool:
@@ -124,28 +80,43 @@ class LevelBigButtonFireworks(LevelBase):
 
     def _spawn_firework_random(self) -> None:
         margin = 16
-        x = random.randint(margin, pyxel.width - margin)
-        y = random.randint(24 + margin, pyxel.height - margin)  # avoid top nav bar
-        self._fireworks.append(Firework(x, y))
-
-    def _draw_big_number(self, value: int, x: int, y: int, scale: int = 8) -> None:
-        text = "1000" if value >= 1000 else f"{value:03d}"
-        digit_w = 3 * scale
-        gap = scale
-        for idx, ch in enumerate(text):
-            pat = self.DIGITS.get(ch, self.DIGITS["0"])
-            ox = x + idx * (digit_w + gap)
-            for j, row in enumerate(pat):
-                for i, c in enumerate(row):
-                    if c == "#":
-                        px = ox + i * scale
-                        py = y + j * scale
-                        pyxel.rect(px, py, scale, scale, 7)
+        rng = self.rng.cosmetic
+        x = rng.randint(margin, self.SCREEN_W - margin)
+        y = rng.randint(24 + margin, self.SCREEN_H - margin)  # avoid top nav bar
+
+        # Burst design: jittered spokes, per-spoke speed, one shared lifetime
+        max_frames = rng.randint(22, 34)
+        n = rng.randint(22, 36)
+        angles = [(2.0 * math.pi * i / n) + rng.uniform(-0.06, 0.06) for i in range(n)]
+        speeds = [rng.uniform(1.2, 2.2) for _ in range(n)]  # px per frame
+        r0 = rng.randint(2, 3)  # initial particle radius (pixels)
+        base_col = rng.choice(FIREWORK_PALETTE)
+
+        # core flash for the first few frames
+        self._sparks.emit(x, y, 0.0, 0.0, base_col, 6, r0 + 1)
+        self._sparks.emit(
+            x,
+            y,
+            [math.cos(a) * v for a, v in zip(angles, speeds)],
+            [math.sin(a) * v for a, v in zip(angles, speeds)],
+            base_col,
+            max_frames,
+            r0,
+        )
+
+    def _draw_counter(self, y: int) -> None:
+        if self._count != self._counter_value:
+            self._counter_value = self._count
+            text = "1000" if self._count >= 1000 else f"{self._count:03d}"
+            self._counter_text = text
+            self._counter_x = (gfx.width - self._counter.width(text)) // 2
+        self._counter.draw(self._counter_x, y, self._counter_text)
 
     # --- per-frame hooks ---
     def on_actor_frame(self, actor_id: int, x: int, y: int, room_id: str) -> None:
         # Button flash timer lives in update space; fireworks step during draw.
-        if self._btn_flash > 0:
+        # Tick it once per frame (on the player's report), not once per actor.
+        if actor_id == -1 and self._btn_flash > 0:
             self._btn_flash -= 1
 
     # --- input ---
@@ -169,33 +140,24 @@ class LevelBigButtonFireworks(LevelBase):
 
     # --- rendering ---
     def draw_room(self, room_id: str) -> None:
-        pyxel.cls(1)
+        gfx.cls(1)
 
-        pyxel.text(10, 4, "", 6)
+        gfx.text(10, 4, "", 6)
 
         # Counter centered
-        scale = 8
-        text = "1000" if self._count >= 1000 else f"{self._count:03d}"
-        digits_w = len(text) * (3 * scale) + (len(text) - 1) * scale
-        self._draw_big_number(
-            self._count, x=(pyxel.width - digits_w) // 2, y=26, scale=scale
-        )
+        self._draw_counter(y=26)
 
-        # Draw & advance ALL fireworks; keep only alive ones
-        alive: List[Firework] = []
-        for fw in self._fireworks:
-            fw.draw()  # advances exactly one frame
-            if fw.alive:
-                alive.append(fw)
-        self._fireworks = alive
+        # Draw & advance ALL fireworks (exactly one frame per draw)
+        self._sparks.draw()
+        self._sparks.update()
 
         # Big button
         cx, cy = self._btn_center
         r = self._btn_radius
         fill = 11 if self._btn_flash > 0 else 8
-        pyxel.circ(cx, cy, r, fill)
-        pyxel.circb(cx, cy, r, 7)
-        pyxel.text(cx - 18, cy - 3, "", 0)
+        gfx.circ(cx, cy, r, fill)
+        gfx.circb(cx, cy, r, 7)
+        gfx.text(cx - 18, cy - 3, "", 0)
 
     def draw_room_overlay(self, room_id: str) -> None:
         return None
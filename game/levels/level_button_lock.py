@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import Optional
 
 from game.levels.level_base import LevelBase
+from game.core.actor_grid import ActorGrid
 from game.core.cursor import CursorEvent
 from game.objects.base import Which, Action
 from game.objects.flag import Flag
@@ -15,6 +16,7 @@ class LevelButtonLock(LevelBase):
     start_room: str = "A"
     max_cursors: int = 2
     loop_seconds: int = 10
+    STATE_FIELDS = ("completed", "button", "wall")
 
     def __init__(self) -> None:
         # leave space for the top nav bar (y >= 24)
@@ -39,16 +41,15 @@ class LevelButtonLock(LevelBase):
         # keep per-level state across loops (nothing special here)
         pass
 
+    def update_holds(self, actors: ActorGrid) -> None:
+        # Button lit while held inside; the wall follows it
+        self.button.update_hold(actors, "A")
+        self.wall.is_open = self.button.lit
+
     def interact(
         self, which: Which, action: Action, x: int, y: int, room_id: str
     ) -> Optional[CursorEvent]:
-        # 1) Update button (lit=True while held inside)
-        self.button.handle_input(which, action, x, y)
-
-        # 2) Open/close wall immediately based on current hold state
-        self.wall.is_open = self.button.lit
-
-        # 3) Route click: wall blocks flag when closed, otherwise flag is clickable
+        # Route click: wall blocks flag when closed, otherwise flag is clickable
         if not self.wall.is_open:
             # absorbs clicks; returns nothing
             self.wall.handle_input(which, action, x, y)
@@ -58,13 +59,9 @@ class LevelButtonLock(LevelBase):
         return None
 
     def draw_room(self, room_id: str) -> None:
-        # Ensure visual matches current input state this frame
-        self.wall.is_open = self.button.lit
-
-        # Draw in this order so button.reset (inside draw) doesn't affect wall this frame
         if self.wall.is_open:
             self.flag.draw()
         else:
             self.wall.draw()
 
-        self.button.draw()  # Button.draw() resets .lit to False for next frame
+        self.button.draw()
@@ -3,7 +3,9 @@ from typing import Dict, List, Optional, Tuple
 
 import pyxel
 
+from game.core.render import gfx
 from game.levels.level_base import LevelBase
+from game.core.room_objects import RoomObjects
 from game.core.cursor import CursorEvent
 from game.objects.base import LevelObject, Which, Action
 from game.objects.door import Door
@@ -25,6 +27,7 @@ class LevelDoorMaze(LevelBase):
     start_room: str = "A"
     max_cursors: int = 10
     loop_seconds: int = 10
+    STATE_FIELDS = ("completed", "_rooms", "box")
 
     def __init__(self) -> None:
         # Where traps send the player back in Room A
@@ -42,10 +45,7 @@ class LevelDoorMaze(LevelBase):
         self._chill_u, self._chill_v = 0, 0
         self._chill_w, self._chill_h = 128 * 2, 86 * 2  # <-- set to actual image size
         self._chill_x, self._chill_y = 10, 30  # where to draw in room "C_t2"
-
-        pyxel.images[self._chill_bank].load(  # type: ignore
-            self._chill_u, self._chill_v, "assets/chill_bill_small.png"
-        )
+        self._chill_loaded: bool = False  # image bank is filled on first draw
 
         # Build rooms
         self._rooms: Dict[str, List[LevelObject]] = {}
@@ -185,6 +185,9 @@ class LevelDoorMaze(LevelBase):
         self.flag.on_finish = self._finish
         self._rooms["F"] = []  # drawn via custom logic below
 
+        # Index every room for hit-testing (interact only asks doors under the click)
+        self._rooms = {k: RoomObjects(v) for k, v in self._rooms.items()}
+
     def _finish(self) -> None:
         self.completed = True
 
@@ -208,8 +211,11 @@ class LevelDoorMaze(LevelBase):
                 self.flag.handle_input(which, action, x, y)
             return None
 
-        # Other rooms: pass click to each object; return the first room change
-        for obj in list(self._rooms.get(room_id, [])):
+        # Other rooms: pass click to the objects under it; return the first room change
+        room = self._rooms.get(room_id)
+        if room is None:
+            return None
+        for obj in room.at(x, y):
             spawned, evt = obj.handle_input(which, action, x, y)
             if spawned is not None:
                 self._rooms[room_id].append(spawned)
@@ -224,41 +230,44 @@ class LevelDoorMaze(LevelBase):
             self._restore_palette_if_needed()
 
         if room_id == "A":
-            pyxel.cls(1)
-        if room_id == "B" or room_id[:2] == "A_":
-            pyxel.cls(9)
-        if room_id == "C" or room_id[:2] == "B_":
-            pyxel.cls(2)
-        if room_id == "F" or room_id[:2] == "C_":
-            pyxel.cls(12)
-
-        if room_id == "C_t2":
-            pyxel.blt(
-                self._chill_x,
-                self._chill_y,
-                self._chill_bank,
-                self._chill_u,
-                self._chill_v,
-                self._chill_w,
-                self._chill_h,
-                0,  # colkey: treat palette color 0 as transparent (adjust if needed)
-            )
+            bg = 1
+        elif room_id == "B" or room_id[:2] == "A_":
+            bg = 9
+        elif room_id == "C" or room_id[:2] == "B_":
+            bg = 2
+        else:  # F, C_*
+            bg = 12
 
         if room_id == "F":
             # Draw box until destroyed; then draw flag
-            if not self.box.destroyed:
-                self.box.draw()
-            else:
-                self.flag.draw()
-            return
+            objs = [self.box] if not self.box.destroyed else [self.flag]
+        else:
+            objs = self._rooms.get(room_id, [])
 
-        for obj in self._rooms.get(room_id, []):
-            obj.draw()
+        underlay = self._draw_chill if room_id == "C_t2" else None
+        self.draw_cached(room_id, bg, objs, underlay)
+
+    def _draw_chill(self) -> None:
+        if not self._chill_loaded:
+            pyxel.images[self._chill_bank].load(  # type: ignore
+                self._chill_u, self._chill_v, "assets/chill_bill_small.png"
+            )
+            self._chill_loaded = True
+        gfx.blt(
+            self._chill_x,
+            self._chill_y,
+            self._chill_bank,
+            self._chill_u,
+            self._chill_v,
+            self._chill_w,
+            self._chill_h,
+            0,  # colkey: treat palette color 0 as transparent (adjust if needed)
+        )
 
     def _apply_room_palette(self) -> None:
         if self._pal_applied:
             return
-        self._saved_palette = pyxel.colors.to_list()
+        self._saved_palette = gfx.colors()
         custom = self._saved_palette.copy()
 
         custom[12] = 0x000000
@@ -266,11 +275,11 @@ class LevelDoorMaze(LevelBase):
         custom[2] = 0x8B4852
         custom[3] = 0xA9C1FF
 
-        pyxel.colors.from_list(custom)
+        gfx.set_colors(custom)
         self._pal_applied = True
 
     def _restore_palette_if_needed(self) -> None:
         if self._pal_applied and self._saved_palette is not None:
-            pyxel.colors.from_list(self._saved_palette)
+            gfx.set_colors(self._saved_palette)
         self._pal_applied = False
         self._saved_palette = None
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import Optional
 
 from game.levels.level_base import LevelBase
+from game.core.actor_grid import ActorGrid
 from game.core.cursor import CursorEvent
 from game.objects.base import Which, Action
 from game.objects.button import Button
@@ -16,6 +17,7 @@ class LevelFirstRoomButton(LevelBase):
     start_room: str = "A"
     max_cursors: int = 3
     loop_seconds: int = 10
+    STATE_FIELDS = ("completed", "button_a", "button_b", "wall_left", "wall_right")
 
     def __init__(self) -> None:
         # --- Room A layout (leave space for nav at y>=16) ---
@@ -36,12 +38,6 @@ class LevelFirstRoomButton(LevelBase):
     def _finish(self) -> None:
         self.completed = True
 
-    # Optional: per-frame prep so hold states are frame-accurate across rooms
-    def begin_frame(self) -> None:
-        # Clear 'lit' so any hold this frame must set it again via interact()
-        self.button_a.lit = False
-        self.button_b.lit = False
-
     # --- LevelBase ---
     def reset_level(self) -> None:
         self.completed = False
@@ -56,25 +52,25 @@ class LevelFirstRoomButton(LevelBase):
         self.wall_left.is_open = False
         self.wall_right.is_open = False
 
+    def update_holds(self, actors: ActorGrid) -> None:
+        # Left wall follows button A (room A); right wall follows button B (room B)
+        self.button_a.update_hold(actors, "A")
+        self.button_b.update_hold(actors, "B")
+        self.wall_left.is_open = self.button_a.lit
+        self.wall_right.is_open = self.button_b.lit
+
     def interact(
         self, which: Which, action: Action, x: int, y: int, room_id: str
     ) -> Optional[CursorEvent]:
         # Room A logic
         if room_id == "A":
-            # Update Button A
-            self.button_a.handle_input(which, action, x, y)
-            # Left wall follows button A hold
-            self.wall_left.is_open = self.button_a.lit
-
             # If open, the Door Left can be clicked to enter room B
             if self.wall_left.is_open:
                 spawned, evt = self.door_left.handle_input(which, action, x, y)
                 if evt is not None:
                     return evt
 
-            # Right side: opened by Button B (from room B) this frame
-            # (button_b.lit is set by room B interactions)
-            self.wall_right.is_open = self.button_b.lit
+            # Right side: opened by Button B (from room B) this tick
             if self.wall_right.is_open:
                 self.flag_right.handle_input(which, action, x, y)
             else:
@@ -82,12 +78,6 @@ class LevelFirstRoomButton(LevelBase):
 
             return None
 
-        # Room B logic
-        if room_id == "B":
-            # Button B controls right wall in Room A
-            self.button_b.handle_input(which, action, x, y)
-            return None
-
         return None
 
     def draw_room(self, room_id: str) -> None:
@@ -104,7 +94,7 @@ class LevelFirstRoomButton(LevelBase):
             else:
                 self.wall_right.draw()
 
-            self.button_a.draw()  # sets button_a.lit = False for next frame
+            self.button_a.draw()
 
         elif room_id == "B":
-            self.button_b.draw()  # sets button_b.lit = False for next frame
+            self.button_b.draw()
@@ -13,6 +13,7 @@ class LevelFlagOnly(LevelBase):
     start_room: str = "A"
     max_cursors = 1
     loop_seconds: int = 10
+    STATE_FIELDS = ("completed",)
 
     def __init__(self) -> None:
         self._flag = Flag(x=300 // 2 - 16, y=200 // 2, w=24, h=24)
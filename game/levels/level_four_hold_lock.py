@@ -1,15 +1,15 @@
 from __future__ import annotations
 from typing import Optional, List
 
+from game.core.render import gfx
 from game.levels.level_base import LevelBase
+from game.core.actor_grid import ActorGrid
 from game.core.cursor import CursorEvent
 from game.objects.base import Which, Action
 from game.objects.flag import Flag
 from game.objects.locked_wall import LockedWall
 from game.objects.button import Button
 
-import pyxel
-
 
 class LevelFourHoldLock(LevelBase):
     name: str = "Hold Four"
@@ -17,6 +17,7 @@ class LevelFourHoldLock(LevelBase):
     start_room: str = "A"
     max_cursors: int = 6
     loop_seconds: int = 12
+    STATE_FIELDS = ("completed", "buttons", "wall")
 
     def __init__(self) -> None:
         # Leave room for nav (y >= ~20)
@@ -48,16 +49,15 @@ class LevelFourHoldLock(LevelBase):
     def _all_held(self) -> bool:
         return all(b.lit for b in self.buttons)
 
-    def interact(
-        self, which: Which, action: Action, x: int, y: int, room_id: str
-    ) -> Optional[CursorEvent]:
-        # Update buttons first (Button.lit is true while held inside)
+    def update_holds(self, actors: ActorGrid) -> None:
+        # Open door only if all are held this tick
         for b in self.buttons:
-            b.handle_input(which, action, x, y)
-
-        # Open door only if all are held this frame
+            b.update_hold(actors, "A")
         self.wall.is_open = self._all_held()
 
+    def interact(
+        self, which: Which, action: Action, x: int, y: int, room_id: str
+    ) -> Optional[CursorEvent]:
         # Route click: wall blocks flag if closed
         if self.wall.is_open:
             self.flag.handle_input(which, action, x, y)
@@ -67,16 +67,13 @@ class LevelFourHoldLock(LevelBase):
         return None
 
     def draw_room(self, room_id: str) -> None:
-        # Ensure visuals match current state this frame
-        self.wall.is_open = self._all_held()
-
         if self.wall.is_open:
             self.flag.draw()
         else:
             self.wall.draw()
 
-        # Draw buttons last (note: Button.draw() resets .lit for next frame)
+        # Draw buttons last
         for b in self.buttons:
             b.draw()
 
-        pyxel.text(100, 20, "Press P to finish your loop quicker!", 7)
+        gfx.text(100, 20, "Press P to finish your loop quicker!", 7)
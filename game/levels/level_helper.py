@@ -1,9 +1,10 @@
 from __future__ import annotations
-from typing import Dict, List, Optional, Callable
-import random
-import pyxel
+from typing import Any, Dict, List, Optional
 
 from game.levels.level_base import LevelBase
+from game.core.actor_grid import ActorGrid
+from game.core.inventory import Inventory
+from game.core.room_objects import RoomObjects
 from game.core.cursor import CursorEvent
 from game.objects.base import LevelObject, Which, Action
 from game.objects.pickable import Key
@@ -25,10 +26,20 @@ class LevelHelper(LevelBase):
     start_room: str = "A"
     max_cursors: int = 4
     loop_seconds: int = 15
+    STATE_FIELDS = (
+        "completed",
+        "_rooms",
+        "_pickables",
+        "btn_R",
+        "btn_G",
+        "btn_B",
+        "_center_opened",
+    )
 
     def __init__(self) -> None:
         self._rooms: Dict[str, List[LevelObject]] = {"A": []}
         self._pickables: List[Key] = []
+        self._inventory = Inventory()  # tracks _pickables
 
         # --- Layout constants ---
         W, H = 24, 24
@@ -42,6 +53,9 @@ class LevelHelper(LevelBase):
         for gw in (self.gw_top, self.gw_mid, self.gw_bot):
             gw.spawn_room = "A"
             gw.spawn_pos = (gw.x, gw.y)  # spawn the key at the wall position
+            # open on the last loop's "started" event, handing us the key
+            gw.on_spawn = self._add_key
+            gw.listen(self.loop_events)
 
         # Center: golden wall + flag behind it
         self.center = LockedWall(
@@ -62,7 +76,7 @@ class LevelHelper(LevelBase):
             x=x_right, y=y_bot, w=W, h=H, required_key=KEY_BLUE, fill=12
         )
         for g in (self.gate_R, self.gate_G, self.gate_B):
-            g.can_open = self._actor_has_key
+            g.can_open = self._inventory.has_key
 
         # Buttons that are revealed exactly where the gates were
         # Button.x/y are top-left of its circle’s bounding box; radius 10 fits nicely in 24px cell
@@ -80,37 +94,31 @@ class LevelHelper(LevelBase):
         self.btn_B = Button(x=bbx, y=bby, w=0, h=0, radius=r)
 
         # Wire room objects (no buttons/keys here; those are conditional)
-        self._rooms["A"] = [
-            self.gw_top,
-            self.gw_mid,
-            self.gw_bot,
-            self.gate_R,
-            self.gate_G,
-            self.gate_B,
-            self.center,
-            self.flag,
-        ]
+        self._rooms["A"] = RoomObjects(
+            [
+                self.gw_top,
+                self.gw_mid,
+                self.gw_bot,
+                self.gate_R,
+                self.gate_G,
+                self.gate_B,
+                self.center,
+                self.flag,
+            ]
+        )
 
         # Randomize which key spawns behind each ghost wall
         self._randomize_ghost_keys()
 
-        # default provider; GameplayScene will set the real one
-        self._get_loops_left: Callable[[], int] = lambda: 999
-
         self._center_opened: bool = False
 
-    # --- wiring from scene (GameplayScene will call this once) ---
-    def set_loops_left_provider(self, provider: Callable[[], int]) -> None:
-        self._get_loops_left = provider
-        for gw in (self.gw_top, self.gw_mid, self.gw_bot):
-            gw.set_loops_left_provider(provider)
-
     # --- LevelBase ---
     def reset_level(self) -> None:
         self.completed = False
         for obj in self._rooms["A"]:
             obj.reset()
         self._pickables.clear()
+        self._inventory.clear()
         self.btn_R.reset()
         self.btn_G.reset()
         self.btn_B.reset()
@@ -127,12 +135,10 @@ class LevelHelper(LevelBase):
     def _finish(self) -> None:
         self.completed = True
 
-    # Inventory helpers
-    def _actor_has_key(self, actor_id: int, key_id: int) -> bool:
-        for k in self._pickables:
-            if k.held_by == actor_id and k.key_id == key_id:
-                return True
-        return False
+    def restore_state(self, state: Any) -> None:
+        super().restore_state(state)
+        # Keys spawned after the keyframe are gone from _pickables
+        self._inventory.track(self._pickables)
 
     def _set_active_actor_on_gates(self, actor_id: int) -> None:
         for g in (self.gate_R, self.gate_G, self.gate_B):
@@ -142,16 +148,35 @@ class LevelHelper(LevelBase):
         super().set_active_actor(actor_id)
         self._set_active_actor_on_gates(actor_id)
 
-    # Auto-open ghost walls even with no input; move any carried keys
+    def _add_key(self, key: Key) -> None:
+        # Ghost walls spawn their key when they open
+        self._pickables.append(key)
+        self._inventory.add(key)
+
+    # Move any carried keys
     def on_actor_frame(self, actor_id: int, x: int, y: int, room_id: str) -> None:
-        # open walls automatically at the last loop and spawn keys at wall positions
-        for gw in (self.gw_top, self.gw_mid, self.gw_bot):
-            spawned = gw.update_auto_open()
-            if isinstance(spawned, Key):
-                self._pickables.append(spawned)
+        self._inventory.follow(actor_id, x, y, room_id)
 
-        for k in self._pickables:
-            k.on_actor_frame(actor_id, x, y, room_id)
+    def update_holds(self, actors: ActorGrid) -> None:
+        # Buttons are only interactable when their gate is open
+        for gate, btn in (
+            (self.gate_R, self.btn_R),
+            (self.gate_G, self.btn_G),
+            (self.gate_B, self.btn_B),
+        ):
+            if gate.is_open:
+                btn.update_hold(actors, "A")
+            else:
+                btn.lit = False
+
+        # Latch the center wall open once all three are held in the same tick
+        if not self._center_opened and (
+            self.btn_R.lit and self.btn_G.lit and self.btn_B.lit
+        ):
+            self._center_opened = True
+
+        # Keep the wall visually gone once opened; otherwise closed
+        self.center.is_open = self._center_opened
 
     def interact(
         self, which: Which, action: Action, x: int, y: int, room_id: str
@@ -166,8 +191,8 @@ class LevelHelper(LevelBase):
                 if k.room_id == room_id and k.try_grab_or_steal(active_id, x, y):
                     return None
 
-        # Route to room objects (ghost walls, key gates, center, flag)
-        for obj in list(self._rooms.get(room_id, [])):
+        # Route to room objects under the click (ghost walls, key gates, center, flag)
+        for obj in self._rooms["A"].at(x, y):
             # Hide flag interaction until center is latched open
             if obj is self.flag and not self._center_opened:
                 continue
@@ -177,23 +202,6 @@ class LevelHelper(LevelBase):
             if evt is not None:
                 return evt
 
-        # Buttons are only interactable when their gate is open
-        if self.gate_R.is_open:
-            self.btn_R.handle_input(which, action, x, y)
-        if self.gate_G.is_open:
-            self.btn_G.handle_input(which, action, x, y)
-        if self.gate_B.is_open:
-            self.btn_B.handle_input(which, action, x, y)
-
-        # Latch the center wall open once all three are held in the same frame
-        if not self._center_opened and (
-            self.btn_R.lit and self.btn_G.lit and self.btn_B.lit
-        ):
-            self._center_opened = True
-
-        # Keep the wall visually gone once opened; otherwise closed
-        self.center.is_open = self._center_opened
-
         # Allow clicking the flag when latched open
         if self._center_opened:
             self.flag.handle_input(which, action, x, y)
@@ -201,12 +209,13 @@ class LevelHelper(LevelBase):
         return None
 
     def draw_room(self, room_id: str) -> None:
-        pyxel.cls(1)
-        for obj in self._rooms.get(room_id, []):
-            # Don't draw the flag until the center is latched open
-            if obj is self.flag and not self._center_opened:
-                continue
-            obj.draw()
+        # Don't draw the flag until the center is latched open
+        objs = [
+            o
+            for o in self._rooms.get(room_id, [])
+            if o is not self.flag or self._center_opened
+        ]
+        self.draw_cached(room_id, 1, objs)
 
         # Draw buttons exactly where the gates were, but only when opened
         if self.gate_R.is_open:
@@ -224,7 +233,7 @@ class LevelHelper(LevelBase):
 
     def _randomize_ghost_keys(self) -> None:
         colors = [KEY_RED, KEY_GREEN, KEY_BLUE]
-        random.shuffle(colors)
+        self.rng.gameplay.shuffle(colors)
         mapping = [
             (self.gw_top, colors[0]),
             (self.gw_mid, colors[1]),
@@ -1,7 +1,9 @@
 # game/levels/level_keys_demo.py
 from typing import Dict, List, Optional
-import pyxel
 from game.levels.level_base import LevelBase
+from game.core.actor_grid import ActorGrid
+from game.core.inventory import Inventory
+from game.core.room_objects import RoomObjects
 from game.core.cursor import CursorEvent
 from game.objects.base import LevelObject, Which, Action
 from game.objects.pickable import Pickable, Key
@@ -24,8 +26,12 @@ class LevelKeysDemo(LevelBase):
     start_room: str = "A"
     max_cursors: int = 7
     loop_seconds: int = 30
+    STATE_FIELDS = ("completed", "_rooms", "_pickables")
 
     def __init__(self) -> None:
+        # Who holds what (walls ask it via can_open; tracks _pickables below)
+        self._inventory = Inventory()
+
         # Rooms
         self._rooms: Dict[str, List[LevelObject]] = {
             "A": [],
@@ -41,7 +47,7 @@ class LevelKeysDemo(LevelBase):
         self.wall_y = KeyWall(
             x=140, y=80, w=24, h=24, target_room="B", required_key=KEY_Y, wall_fill=9
         )
-        self.wall_y.can_open = self._actor_has_key
+        self.wall_y.can_open = self._inventory.has_key
         self._rooms["A"] = [self.wall_y]
 
         # --- B: RGB walls, red key on ground ---
@@ -62,7 +68,7 @@ class LevelKeysDemo(LevelBase):
             wall_fill=12,
         )
         for w in (self.wall_r, self.wall_g, self.wall_b):
-            w.can_open = self._actor_has_key
+            w.can_open = self._inventory.has_key
         self._rooms["B"] = [self.wall_r, self.wall_g, self.wall_b]
 
         # --- R1: blue key + door back to B ---
@@ -97,7 +103,7 @@ class LevelKeysDemo(LevelBase):
             key_g=KEY_G,
             key_b=KEY_B,
         )
-        self.fc_wall.can_open = self._actor_has_key
+        self.fc_wall.can_open = self._inventory.has_key
         self.door_g_back = Door(
             x=40, y=30, w=24, h=24, target_room="B", color=11, label="Back"
         )
@@ -109,6 +115,9 @@ class LevelKeysDemo(LevelBase):
         self.flag.on_finish = self._finish
         self._rooms["F"] = [self.flag]  # <-- ensure it receives input
 
+        # Index every room for hit-testing (interact only asks objects under the click)
+        self._rooms = {k: RoomObjects(v) for k, v in self._rooms.items()}
+
         # Global pickables
         self._pickables: List[Pickable] = [
             self.key_y,
@@ -116,6 +125,7 @@ class LevelKeysDemo(LevelBase):
             self.key_b,
             self.key_g,
         ]
+        self._inventory.track(self._pickables)
 
         # --- add inside LevelKeysDemo.__init__ after building walls ---
         # Signatures of doors that KeyWalls spawn (per room)
@@ -158,21 +168,10 @@ class LevelKeysDemo(LevelBase):
         self.completed = True
 
     # ===== helpers =====
-    def _actor_has_key(self, actor_id: int, key_id: int) -> bool:
-        for p in self._pickables:
-            if isinstance(p, Key) and p.held_by == actor_id and p.key_id == key_id:
-                return True
-        return False
-
-    def _held_by(self, actor_id: int) -> Optional[Pickable]:
-        for p in self._pickables:
-            if p.held_by == actor_id:
-                return p
-        return None
-
     def _grab_with_swap(self, actor_id: int, new_item: Pickable) -> None:
-        old = self._held_by(actor_id)
-        if old is not None and old is not new_item:
+        for old in self._inventory.holding(actor_id):
+            if old is new_item:
+                continue
             old.held_by = None
             old.x, old.y = new_item.x, new_item.y
             old.room_id = new_item.room_id
@@ -205,23 +204,20 @@ class LevelKeysDemo(LevelBase):
                     obj.set_active_actor(actor_id)  # type: ignore # KeyWall, FourColorKeyWall
 
     def on_actor_frame(self, actor_id: int, x: int, y: int, room_id: str) -> None:
-        for p in self._pickables:
-            p.on_actor_frame(actor_id, x, y, room_id)
-        # BLUE room: button live control of the grey wall
-        # (safe to set every frame)
+        self._inventory.follow(actor_id, x, y, room_id)
+
+    def update_holds(self, actors: ActorGrid) -> None:
+        # BLUE room: the grey wall opens only while the button is held
+        self.btn_blue.update_hold(actors, "BLUE")
         self.grey_wall.is_open = self.btn_blue.lit
 
     def interact(
         self, which: Which, action: Action, x: int, y: int, room_id: str
     ) -> Optional[CursorEvent]:
-        # Update BLUE button each frame so .lit is accurate
-        if room_id == "BLUE":
-            self.btn_blue.handle_input(which, action, x, y)
-            # wall opens only while held
-            self.grey_wall.is_open = self.btn_blue.lit
-
-        # 1) Let room objects handle/block first (so walls can absorb clicks)
-        for obj in list(self._rooms.get(room_id, [])):
+        # 1) Let room objects under the click handle/block first (so walls can absorb clicks)
+        room = self._rooms.get(room_id)
+        hits = room.at(x, y) if room is not None else []
+        for obj in hits:
             spawned, evt = obj.handle_input(which, action, x, y)
             if evt is not None:
                 return evt
@@ -232,7 +228,7 @@ class LevelKeysDemo(LevelBase):
         if action == "press":
             blocked = any(
                 isinstance(o, LockedWall) and not o.is_open and o.contains(x, y)
-                for o in self._rooms.get(room_id, [])
+                for o in hits
             )
             if not blocked:
                 actor_id = getattr(self, "_active_actor_id", -999)
@@ -251,36 +247,35 @@ class LevelKeysDemo(LevelBase):
             if not sigs:
                 continue
             # keep original 'back' doors (their signatures won't match the wall slots)
-            self._rooms[room_id] = [
+            self._rooms[room_id] = RoomObjects(
                 o
                 for o in objs
                 if not (
                     isinstance(o, Door) and (o.x, o.y, o.w, o.h, o.target_room) in sigs
                 )
-            ]
+            )
 
     def draw_room(self, room_id: str) -> None:
         # Backgrounds: A dark, B normal, others slightly tinted for variety
         if room_id == "A":
-            pyxel.cls(1)
+            bg = 1
         elif room_id == "B":
-            pyxel.cls(10)  # “normal color”
+            bg = 10  # “normal color”
         elif room_id == "R1":
-            pyxel.cls(9)
+            bg = 9
         elif room_id == "BLUE":
-            pyxel.cls(6)
+            bg = 6
         elif room_id == "G1":
-            pyxel.cls(3)
+            bg = 3
         else:  # F
-            pyxel.cls(2)
+            bg = 2
 
-        # Draw room objects
+        # Draw room objects (static ones come from the cached room layer)
         if room_id == "F":
-            self.flag.draw()
+            self.draw_cached(room_id, bg, [self.flag])
         else:
-            for obj in self._rooms.get(room_id, []):
-                # In BLUE, draw wall after button so icon shows correctly
-                obj.draw()
+            # In BLUE, draw wall after button so icon shows correctly
+            self.draw_cached(room_id, bg, self._rooms.get(room_id, []))
 
     # game/levels/level_keys_demo.py  (draw_room_overlay)
     def draw_room_overlay(self, room_id: str) -> None:
@@ -3,6 +3,8 @@ from typing import Dict, List, Optional
 
 
 from game.levels.level_base import LevelBase
+from game.core.actor_grid import ActorGrid
+from game.core.room_objects import RoomObjects
 from game.core.cursor import CursorEvent
 from game.objects.base import LevelObject, Which, Action
 from game.objects.door import Door
@@ -38,12 +40,12 @@ class LevelRoomsDemo(LevelBase):
             spawn_door_factory=spawn_door_from_box,
         )
         sw = Switch(x=160, y=40, w=16, h=16)
-        btn = Button(x=180, y=80, w=0, h=0, radius=8)
-        self._rooms["A"] = [door_to_b, box, sw, btn]
+        self._button = Button(x=180, y=80, w=0, h=0, radius=8)
+        self._rooms["A"] = RoomObjects([door_to_b, box, sw, self._button])
 
         # Room B
         door_to_a = Door(x=40, y=30, w=24, h=24, target_room="A", color=6, label="To A")
-        self._rooms["B"] = [door_to_a]
+        self._rooms["B"] = RoomObjects([door_to_a])
 
     def reset_level(self) -> None:
         # Reset permanent stuff only when the level is reloaded from the menu
@@ -56,10 +58,16 @@ class LevelRoomsDemo(LevelBase):
         # Keep switch state across loops (do not call reset here)
         pass
 
+    def update_holds(self, actors: ActorGrid) -> None:
+        self._button.update_hold(actors, "A")
+
     def interact(
         self, which: Which, action: Action, x: int, y: int, room_id: str
     ) -> Optional[CursorEvent]:
-        for obj in list(self._rooms.get(room_id, [])):
+        room = self._rooms.get(room_id)
+        if room is None:
+            return None
+        for obj in room.at(x, y):
             spawned, evt = obj.handle_input(which, action, x, y)
             if spawned is not None:
                 self._rooms[room_id].append(spawned)
@@ -1,9 +1,8 @@
 # game/levels/level_secret_code.py
 from __future__ import annotations
 from typing import Dict, List, Optional, Tuple
-import random
-import pyxel
 
+from game.core.render import gfx
 from game.levels.level_base import LevelBase
 from game.core.cursor import CursorEvent
 from game.objects.base import LevelObject, Which, Action
@@ -19,6 +18,16 @@ class LevelSecretCode(LevelBase):
     start_room: str = "A"
     max_cursors: int = 2
     loop_seconds: int = 20
+    STATE_FIELDS = (
+        "completed",
+        "_rooms",
+        "_buttons",
+        "_btn_covers",
+        "_code_revealed",
+        "_secret_code",
+        "_input_order",
+        "_final_open",
+    )
 
     def __init__(self) -> None:
         self._rooms: Dict[str, List[LevelObject]] = {"A": [], "CODE": []}
@@ -152,7 +161,7 @@ class LevelSecretCode(LevelBase):
     # ----- LevelBase -----
     def reset_level(self) -> None:
         # New random permutation each time you enter from the menu
-        self._secret_code = random.sample([1, 2, 3, 4], 4)
+        self._secret_code = self.rng.gameplay.sample([1, 2, 3, 4], 4)
         self._final_open = False
         self.final_wall.is_open = False
 
@@ -239,7 +248,7 @@ class LevelSecretCode(LevelBase):
         return None
 
     def draw_room(self, room_id: str) -> None:
-        pyxel.cls(1)
+        gfx.cls(1)
 
         if room_id == "A":
             # Top-left: either wall or (when open) the door
@@ -261,25 +270,25 @@ class LevelSecretCode(LevelBase):
             for idx, bx, by, br, pressed in self._buttons:
                 cx, cy = bx + br, by + br
                 fill_col = 11 if pressed else 8  # green if on; red if off
-                pyxel.circ(cx, cy, br, fill_col)
-                pyxel.circb(cx, cy, br, 7)
-                pyxel.text(cx - 2, cy - 2, str(idx), 0)
+                gfx.circ(cx, cy, br, fill_col)
+                gfx.circb(cx, cy, br, 7)
+                gfx.text(cx - 2, cy - 2, str(idx), 0)
 
             # Draw covers last so they visually block buttons
             for cover in self._btn_covers:
                 cover.draw()
 
             # UI hints
-            pyxel.text(self._switch_x, self._switch_y - 10, "", 7)
-            pyxel.text(self._door_x, self._door_y - 10, "", 7)
-            pyxel.text(self._final_x - 8, self._final_y - 10, "", 7)
+            gfx.text(self._switch_x, self._switch_y - 10, "", 7)
+            gfx.text(self._door_x, self._door_y - 10, "", 7)
+            gfx.text(self._final_x - 8, self._final_y - 10, "", 7)
 
         elif room_id == "CODE":
             self.sw_reveal.draw()
-            pyxel.text(16, 24, "", 7)
+            gfx.text(16, 24, "", 7)
             if self._code_revealed:
                 code_str = "".join(str(d) for d in self._secret_code)
-                pyxel.text(16, 40, f"Secret code is: {code_str}", 12)
+                gfx.text(16, 40, f"Secret code is: {code_str}", 12)
 
     def draw_room_overlay(self, room_id: str) -> None:
         return None
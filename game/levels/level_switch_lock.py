@@ -15,6 +15,7 @@ class LevelSwitchLock(LevelBase):
     start_room: str = "A"
     max_cursors: int = 1
     loop_seconds: int = 10
+    STATE_FIELDS = ("completed", "switch", "wall")
 
     def __init__(self) -> None:
         # Positions (leave some space for your nav bar at y=0..16)
@@ -2,6 +2,8 @@ from __future__ import annotations
 from typing import Final, Dict
 import pyxel
 
+from game.core.sprites import bake_pointers, draw_pointer
+from game.core.timeline import TimelineManager
 from game.levels.level_base import LevelBase
 from game.levels.level_flag_only import LevelFlagOnly
 from game.scenes.level_select import LevelEntry, LevelSelectScene
@@ -26,21 +28,12 @@ LOOP_SECONDS: Final[int] = 20
 TITLE: Final[str] = "Loop Mouse (Demo)"
 
 
-def _draw_pointer(x: int, y: int, fill: int, outline: int) -> None:
-    SQUARE_EDGE = 20
-    x1, y1 = x + (SQUARE_EDGE * 0.25), y + int(SQUARE_EDGE * 0.75)
-    x2, y2 = x, y
-    x3, y3 = x + (SQUARE_EDGE * 0.75), y + (SQUARE_EDGE * 0.25)
-    pyxel.tri(x1, y1, x2, y2, x3, y3, fill)
-    pyxel.line(x1, y1, x2, y2, outline)
-    pyxel.line(x2, y2, x3, y3, outline)
-    pyxel.line(x3, y3, x1, y1, outline)
-
-
 class Game:
     def __init__(self) -> None:
         pyxel.init(WIDTH, HEIGHT, title=TITLE, fps=FPS)
         pyxel.mouse(False)
+        # Player (white) + every ghost color, all with a black outline
+        bake_pointers((c, 0) for c in (7,) + TimelineManager._GHOST_COLORS)
 
         self._entries = [
             LevelEntry(factory=LevelFlagOnly),
@@ -71,18 +64,17 @@ class Game:
         self._scene = LevelSelectScene(
             entries=self._entries,
             start_level=self._start_level,  # type: ignore
-            draw_pointer=_draw_pointer,
+            draw_pointer=draw_pointer,
             width=WIDTH,
             height=HEIGHT,
             is_completed=self._is_completed,
         )
 
     def _start_level(self, level: LevelBase) -> None:
-        # Reset the level when entering from menu
-        level.reset_level()
+        # The level is reset by the scene's Simulation once its RNG is bound
         self._scene = GameplayScene(
             level=level,
-            draw_pointer=_draw_pointer,
+            draw_pointer=draw_pointer,
             width=WIDTH,
             height=HEIGHT,
             fps=FPS,
@@ -1,12 +1,14 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Literal, Optional, Tuple
+from typing import Any, ClassVar, Literal, Optional, Tuple
 
 from game.core.cursor import CursorEvent
 
 Which = Literal["L", "R"]
 Action = Literal["press", "hold"]
 
+_UNSET = object()
+
 
 class LevelObject(ABC):
     x: int
@@ -14,6 +16,28 @@ class LevelObject(ABC):
     w: int
     h: int
 
+    # Keyframe support (opt-in): names of the mutable runtime fields. Static
+    # objects leave it empty; objects owning sub-objects extend restore_state().
+    STATE_FIELDS: ClassVar[Tuple[str, ...]] = ()
+
+    # Render caching: bumped whenever a STATE_FIELDS value actually changes, so a
+    # cached drawing is valid while the version is. Objects whose look changes
+    # without that (per-frame highlights, things that move) opt out.
+    CACHEABLE: ClassVar[bool] = True
+    version: int = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self.STATE_FIELDS and getattr(self, name, _UNSET) != value:
+            object.__setattr__(self, "version", self.version + 1)
+        object.__setattr__(self, name, value)
+
+    def snapshot_state(self) -> Tuple[Any, ...]:
+        return tuple([getattr(self, f) for f in self.STATE_FIELDS])
+
+    def restore_state(self, state: Tuple[Any, ...]) -> None:
+        for f, v in zip(self.STATE_FIELDS, state):
+            setattr(self, f, v)
+
     @abstractmethod
     def reset(self) -> None: ...
 
@@ -28,3 +52,8 @@ class LevelObject(ABC):
 
     def contains(self, px: int, py: int) -> bool:
         return self.x <= px < self.x + self.w and self.y <= py < self.y + self.h
+
+    # Hit area as (x, y, w, h): handle_input() ignores points outside it.
+    # Used by RoomObjects to skip objects that can't react to a point.
+    def bounds(self) -> Tuple[int, int, int, int]:
+        return self.x, self.y, self.w, self.h
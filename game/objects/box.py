@@ -1,8 +1,8 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Callable, ClassVar, Optional, Tuple
 
-import pyxel
+from game.core.render import gfx
 from game.objects.base import LevelObject, Which, Action
 
 
@@ -20,6 +20,8 @@ class Box(LevelObject):
     clicks: int = 0
     destroyed: bool = False
 
+    STATE_FIELDS: ClassVar[Tuple[str, ...]] = ("clicks", "destroyed")
+
     def reset(self) -> None:
         self.clicks = 0
         self.destroyed = False
@@ -38,13 +40,13 @@ class Box(LevelObject):
 
     def draw(self) -> None:
         if self.destroyed:
-            pyxel.rect(self.x, self.y, self.w, self.h, 0)
-            pyxel.rectb(self.x, self.y, self.w, self.h, 5)
+            gfx.rect(self.x, self.y, self.w, self.h, 0)
+            gfx.rectb(self.x, self.y, self.w, self.h, 5)
             return
-        pyxel.rect(self.x, self.y, self.w, self.h, self.color)
-        pyxel.rectb(self.x, self.y, self.w, self.h, self.border)
+        gfx.rect(self.x, self.y, self.w, self.h, self.color)
+        gfx.rectb(self.x, self.y, self.w, self.h, self.border)
         rem = max(0, self.clicks_needed - self.clicks)
         txt = str(rem)
         tw = len(txt) * 4
         tx = self.x + (self.w - tw) // 2
-        pyxel.text(tx, self.y - 8, txt, 7)
+        gfx.text(tx, self.y - 8, txt, 7)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from typing import ClassVar, Tuple
 
-import pyxel
-from game.objects.base import LevelObject, Which, Action
+from game.core.actor_grid import ActorGrid
+from game.core.render import gfx
+from game.objects.base import LevelObject
 
 
 @dataclass(slots=True)
@@ -18,26 +20,23 @@ class Button(LevelObject):
     color_on: int = 11  # green
     border: int = 7
 
+    STATE_FIELDS: ClassVar[Tuple[str, ...]] = ("lit",)
+    CACHEABLE: ClassVar[bool] = False  # lit is re-evaluated every tick
+
     def reset(self) -> None:
         self.lit = False  # not permanent
 
-    def _contains_circle(self, px: int, py: int) -> bool:
-        cx = self.x + self.radius
-        cy = self.y + self.radius
-        dx = px - cx
-        dy = py - cy
-        return dx * dx + dy * dy <= self.radius * self.radius
+    def bounds(self) -> Tuple[int, int, int, int]:
+        d = 2 * self.radius + 1
+        return self.x, self.y, d, d
 
-    def handle_input(self, which: Which, action: Action, px: int, py: int):
-        # lit while HELD inside
-        if action == "hold" and self._contains_circle(px, py):
-            self.lit = True
-        return None, None
+    def update_hold(self, actors: ActorGrid, room_id: str) -> None:
+        # lit while some actor in room_id HOLDS inside (levels call this every tick)
+        r = self.radius
+        self.lit = bool(actors.holders_in_circle(room_id, self.x + r, self.y + r, r))
 
     def draw(self) -> None:
         cx = self.x + self.radius
         cy = self.y + self.radius
-        pyxel.circ(cx, cy, self.radius, self.color_on if self.lit else self.color_off)
-        pyxel.circb(cx, cy, self.radius, self.border)
-        # reset lit for next frame (level will call interact again if held)
-        self.lit = False
+        gfx.circ(cx, cy, self.radius, self.color_on if self.lit else self.color_off)
+        gfx.circb(cx, cy, self.radius, self.border)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Callable, Literal, Optional
+from typing import Any, Callable, ClassVar, Literal, Optional, Tuple
 
-import pyxel
+
+from game.core.render import gfx
 
 Which = Literal["L", "R"]
 
@@ -21,10 +22,18 @@ class ClickPad:
     # runtime state
     count: int = 0  # clicks received this loop
 
+    STATE_FIELDS: ClassVar[Tuple[str, ...]] = ("count",)
+
     def reset(self) -> None:
         """Reset per-loop state (called every new timeline)."""
         self.count = 0
 
+    def snapshot_state(self) -> Tuple[Any, ...]:
+        return (self.count,)
+
+    def restore_state(self, state: Tuple[Any, ...]) -> None:
+        (self.count,) = state
+
     @property
     def remaining(self) -> int:
         return max(0, self.threshold - self.count)
@@ -49,12 +58,12 @@ class ClickPad:
     def draw(self) -> None:
         # Completed pads get a brighter fill
         fill = 11 if self.is_complete else self.color
-        pyxel.rect(self.x, self.y, self.w, self.h, fill)
-        pyxel.rectb(self.x, self.y, self.w, self.h, self.border)
+        gfx.rect(self.x, self.y, self.w, self.h, fill)
+        gfx.rectb(self.x, self.y, self.w, self.h, self.border)
 
         # Minimal, object-local display: remaining countdown centered above
         text = str(self.remaining)
         tw = len(text) * 4  # pyxel.text is 4px per char width
         tx = self.x + (self.w - tw) // 2
         ty = self.y - 8
-        pyxel.text(tx, ty, text, 7)
+        gfx.text(tx, ty, text, 7)
@@ -2,8 +2,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable, Optional, Tuple
 
-import pyxel
+from game.core.render import gfx
 from game.core.cursor import CursorEvent
+from game.core.sprites import ARROW_UP, draw_pattern
 from game.objects.base import LevelObject, Which, Action
 
 
@@ -17,15 +18,8 @@ class Door(LevelObject):
     color: int = 9
     border: int = 7
     label: str = ""
-    # 6×6 arrow sprite drawn with pset, centered on the door
-    pattern: Tuple[str, str, str, str, str, str] = (
-        "..##..",
-        ".####.",
-        "######",
-        "..##..",
-        "..##..",
-        "..##..",
-    )
+    # 6×6 arrow sprite (via the sprite cache), centered on the door
+    pattern: Tuple[str, str, str, str, str, str] = ARROW_UP  # type: ignore[assignment]
     icon_col: int = 7
     # Spawn point kept for compat; we currently don't teleport on enter
     on_enter: Optional[Callable[[str], None]] = None
@@ -43,15 +37,12 @@ class Door(LevelObject):
 
     def draw(self) -> None:
         # Door body
-        pyxel.rect(self.x, self.y, self.w, self.h, self.color)
-        pyxel.rectb(self.x, self.y, self.w, self.h, self.border)
+        gfx.rect(self.x, self.y, self.w, self.h, self.color)
+        gfx.rectb(self.x, self.y, self.w, self.h, self.border)
 
-        # Centered arrow icon (pixel-by-pixel)
+        # Centered arrow icon
         ih = len(self.pattern)
         iw = len(self.pattern[0]) if ih > 0 else 0
         ox = self.x + (self.w - iw) // 2
         oy = self.y + (self.h - ih) // 2
-        for j, row in enumerate(self.pattern):
-            for i, ch in enumerate(row):
-                if ch == "#":
-                    pyxel.pset(ox + i, oy + j, self.icon_col)
+        draw_pattern(ox, oy, self.pattern, self.icon_col)
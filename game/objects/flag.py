@@ -2,7 +2,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable, Optional
 
-import pyxel
+from game.core.render import gfx
 from game.objects.base import LevelObject, Which, Action
 
 
@@ -30,8 +30,8 @@ class Flag(LevelObject):
         return None, None
 
     def draw(self) -> None:
-        pyxel.rect(self.x, self.y, self.w, self.h, self.color)
-        pyxel.rectb(self.x, self.y, self.w, self.h, self.border)
+        gfx.rect(self.x, self.y, self.w, self.h, self.color)
+        gfx.rectb(self.x, self.y, self.w, self.h, self.border)
         tw = len(self.label) * 4
         tx = self.x + (self.w - tw) // 2
-        pyxel.text(tx, self.y + 9, self.label, 7)
+        gfx.text(tx, self.y + 9, self.label, 7)
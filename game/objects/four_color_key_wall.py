@@ -1,9 +1,10 @@
 # game/objects/four_color_key_wall.py
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Callable, Optional, List
-import pyxel
+from typing import Callable, ClassVar, Optional, Tuple
+from game.core.render import gfx
 from game.core.cursor import CursorEvent
+from game.core.sprites import ARROW_UP, LOCK_ICON, draw_pattern
 from game.objects.base import LevelObject, Which, Action
 
 
@@ -29,6 +30,14 @@ class FourColorKeyWall(LevelObject):
     border: int = 7
     icon_col: int = 7
 
+    STATE_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "used_y",
+        "used_r",
+        "used_g",
+        "used_b",
+        "_open",
+    )
+
     can_open: Optional[Callable[[int, int], bool]] = None
     _active_actor_id: Optional[int] = None
 
@@ -84,39 +93,21 @@ class FourColorKeyWall(LevelObject):
         return None, CursorEvent(room=self.target_room, teleport_to=None)
 
     def _draw_lock_icon(self, rx: int, ry: int, rw: int, rh: int) -> None:
-        pattern: List[str] = [
-            "...######...",
-            "..#......#..",
-            ".#........#.",
-            "############",
-            "####....####",
-            "####....####",
-            "#####..#####",
-            "#####..#####",
-            "############",
-        ]
-        iw, ih = len(pattern[0]), len(pattern)
+        iw, ih = len(LOCK_ICON[0]), len(LOCK_ICON)
         ox = rx + (rw - iw) // 2
         oy = ry + (rh - ih) // 2
-        for j, row in enumerate(pattern):
-            for i, ch in enumerate(row):
-                if ch == "#":
-                    pyxel.pset(ox + i, oy + j, self.icon_col)
+        draw_pattern(ox, oy, LOCK_ICON, self.icon_col)
 
     # game/objects/four_color_key_wall.py  (draw)
     def draw(self) -> None:
         if self._open:
             # big black panel + arrow
-            pyxel.rect(self.x, self.y, self.w, self.h, 0)
-            pyxel.rectb(self.x, self.y, self.w, self.h, self.border)
-            pattern = ("..##..", ".####.", "######", "..##..", "..##..", "..##..")
-            ih, iw = len(pattern), len(pattern[0])
+            gfx.rect(self.x, self.y, self.w, self.h, 0)
+            gfx.rectb(self.x, self.y, self.w, self.h, self.border)
+            ih, iw = len(ARROW_UP), len(ARROW_UP[0])
             ox = self.x + (self.w - iw) // 2
             oy = self.y + (self.h - ih) // 2
-            for j, row in enumerate(pattern):
-                for i, ch in enumerate(row):
-                    if ch == "#":
-                        pyxel.pset(ox + i, oy + j, self.border)
+            draw_pattern(ox, oy, ARROW_UP, self.border)
             return
 
         # (existing locked-state drawing with 4 colored tiles + tiny locks)
@@ -127,9 +118,9 @@ class FourColorKeyWall(LevelObject):
             (self.x, self.y + half_h, half_w, half_h, self.col_g, self.used_g),
             (self.x + half_w, self.y + half_h, half_w, half_h, self.col_b, self.used_b),
         ]
-        pyxel.rectb(self.x, self.y, self.w, self.h, self.border)
+        gfx.rectb(self.x, self.y, self.w, self.h, self.border)
         for rx, ry, rw, rh, col, used in quads:
-            pyxel.rect(rx, ry, rw, rh, col)
-            pyxel.rectb(rx, ry, rw, rh, self.border)
+            gfx.rect(rx, ry, rw, rh, col)
+            gfx.rectb(rx, ry, rw, rh, self.border)
             if not used:
                 self._draw_lock_icon(rx, ry, rw, rh)
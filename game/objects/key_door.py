@@ -1,9 +1,10 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Callable, ClassVar, Optional, Tuple
 
-import pyxel
+from game.core.render import gfx
 from game.core.cursor import CursorEvent
+from game.core.sprites import ARROW_UP, draw_pattern
 from game.objects.base import LevelObject, Which, Action
 
 
@@ -20,6 +21,8 @@ class KeyDoor(LevelObject):
     icon_col: int = 7
     is_open: bool = False
 
+    STATE_FIELDS: ClassVar[Tuple[str, ...]] = ("is_open",)
+
     # callback supplied by the level to ask: does actor_id hold required_key?
     can_open: Optional[Callable[[int, int], bool]] = None
     # level supplies set_active_actor; we read it through a setter the level calls:
@@ -48,26 +51,13 @@ class KeyDoor(LevelObject):
         return None, None
 
     def draw(self) -> None:
-        pyxel.rect(
-            self.x, self.y, self.w, self.h, self.color if not self.is_open else 1
-        )
-        pyxel.rectb(self.x, self.y, self.w, self.h, self.border)
+        gfx.rect(self.x, self.y, self.w, self.h, self.color if not self.is_open else 1)
+        gfx.rectb(self.x, self.y, self.w, self.h, self.border)
 
         # small arrow icon (like your Door) centered
-        pattern = (
-            "..##..",
-            ".####.",
-            "######",
-            "..##..",
-            "..##..",
-            "..##..",
-        )
-        ih = len(pattern)
-        iw = len(pattern[0])
+        ih = len(ARROW_UP)
+        iw = len(ARROW_UP[0])
         ox = self.x + (self.w - iw) // 2
         oy = self.y + (self.h - ih) // 2
         col = self.icon_col if not self.is_open else 5
-        for j, row in enumerate(pattern):
-            for i, ch in enumerate(row):
-                if ch == "#":
-                    pyxel.pset(ox + i, oy + j, col)
+        draw_pattern(ox, oy, ARROW_UP, col)
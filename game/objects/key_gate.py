@@ -1,6 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Any, Callable, ClassVar, Optional, Tuple
 
 from game.objects.base import LevelObject, Which, Action
 from game.objects.locked_wall import LockedWall
@@ -23,6 +23,8 @@ class KeyGate(LevelObject):
     _opened: bool = False
     _wall: LockedWall = None  # type: ignore[assignment]
 
+    STATE_FIELDS: ClassVar[Tuple[str, ...]] = ("_opened",)
+
     def __post_init__(self) -> None:
         self._wall = LockedWall(
             x=self.x,
@@ -42,6 +44,10 @@ class KeyGate(LevelObject):
     def set_active_actor(self, actor_id: int) -> None:
         self._active_actor_id = actor_id
 
+    def restore_state(self, state: Tuple[Any, ...]) -> None:
+        LevelObject.restore_state(self, state)
+        self._wall.is_open = self._opened  # inner wall mirrors the flag
+
     @property
     def is_open(self) -> bool:
         return self._opened
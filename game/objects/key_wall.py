@@ -1,8 +1,9 @@
 # game/objects/key_wall.py
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Callable, Optional
-import pyxel
+from typing import Any, Callable, ClassVar, Optional, Tuple
+from game.core.render import gfx
+from game.core.sprites import ARROW_UP, draw_pattern
 from game.objects.base import LevelObject, Which, Action
 from game.objects.locked_wall import LockedWall
 from game.objects.door import Door
@@ -27,6 +28,8 @@ class KeyWall(LevelObject):
     _wall: LockedWall = None  # type: ignore[assignment]
     _broken: bool = False
 
+    STATE_FIELDS: ClassVar[Tuple[str, ...]] = ("_broken",)
+
     def __post_init__(self) -> None:
         self._wall = LockedWall(
             x=self.x,
@@ -47,6 +50,10 @@ class KeyWall(LevelObject):
     def set_active_actor(self, actor_id: int) -> None:
         self._active_actor_id = actor_id
 
+    def restore_state(self, state: Tuple[Any, ...]) -> None:
+        LevelObject.restore_state(self, state)
+        self._wall.is_open = self._broken  # inner wall mirrors the flag
+
     def handle_input(self, which: Which, action: Action, px: int, py: int):
         if not self._broken:
             if action == "press" and self._wall.contains(px, py):
@@ -77,20 +84,9 @@ class KeyWall(LevelObject):
             return
 
         # Draw an “open passage” with a small arrow
-        pyxel.rect(self.x, self.y, self.w, self.h, 1)
-        pyxel.rectb(self.x, self.y, self.w, self.h, self.wall_border)
-        pattern = (
-            "..##..",
-            ".####.",
-            "######",
-            "..##..",
-            "..##..",
-            "..##..",
-        )
-        ih, iw = len(pattern), len(pattern[0])
+        gfx.rect(self.x, self.y, self.w, self.h, 1)
+        gfx.rectb(self.x, self.y, self.w, self.h, self.wall_border)
+        ih, iw = len(ARROW_UP), len(ARROW_UP[0])
         ox = self.x + (self.w - iw) // 2
         oy = self.y + (self.h - ih) // 2
-        for j, row in enumerate(pattern):
-            for i, ch in enumerate(row):
-                if ch == "#":
-                    pyxel.pset(ox + i, oy + j, self.icon_col)
+        draw_pattern(ox, oy, ARROW_UP, self.icon_col)
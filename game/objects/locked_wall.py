@@ -1,8 +1,9 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List
+from typing import ClassVar, Tuple
 
-import pyxel
+from game.core.render import gfx
+from game.core.sprites import LOCK_ICON, draw_pattern
 from game.objects.base import LevelObject, Which, Action
 
 
@@ -17,6 +18,8 @@ class LockedWall(LevelObject):
     border: int = 7  # white border
     icon_col: int = 7  # lock icon color
 
+    STATE_FIELDS: ClassVar[Tuple[str, ...]] = ("is_open",)
+
     def reset(self) -> None:
         self.is_open = False
 
@@ -32,33 +35,16 @@ class LockedWall(LevelObject):
     def draw(self) -> None:
         if self.is_open:
             return  # invisible when open
-        pyxel.rect(self.x, self.y, self.w, self.h, self.fill)
-        pyxel.rectb(self.x, self.y, self.w, self.h, self.border)
+        gfx.rect(self.x, self.y, self.w, self.h, self.fill)
+        gfx.rectb(self.x, self.y, self.w, self.h, self.border)
         self._draw_lock_icon()
 
     def _draw_lock_icon(self) -> None:
         """
-        Tiny padlock drawn pixel-by-pixel using pset.
-        Designed for ~24x24 wall; icon is ~9x10 pixels centered.
-        '#' pixels will be plotted in icon_col.
+        Tiny padlock from the shared sprite cache.
+        Designed for ~24x24 wall; icon is 12x9 pixels centered, drawn in icon_col.
         """
-        pattern: List[str] = [
-            "...######...",
-            "..#......#..",  # shackle top
-            ".#........#.",
-            "############",
-            "####....####",  # body top
-            "####....####",  # keyhole column
-            "#####..#####",
-            "#####..#####",
-            "############",  # body bottom
-        ]
-        iw, ih = len(pattern[0]), len(pattern)
+        iw, ih = len(LOCK_ICON[0]), len(LOCK_ICON)
         cx = self.x + self.w // 2
         cy = self.y + self.h // 2
-        ox = cx - iw // 2
-        oy = cy - ih // 2
-        for j, row in enumerate(pattern):
-            for i, ch in enumerate(row):
-                if ch == "#":
-                    pyxel.pset(ox + i, oy + j, self.icon_col)
+        draw_pattern(cx - iw // 2, cy - ih // 2, LOCK_ICON, self.icon_col)
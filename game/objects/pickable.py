@@ -1,9 +1,43 @@
 # game/objects/pickable.py
-from dataclasses import dataclass
-from typing import Optional, Tuple, ClassVar
-import pyxel
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, ClassVar
+from game.core.render import gfx
+from game.core.sprites import Rect, row_spans
 from game.objects.base import LevelObject, Which, Action
 
+if TYPE_CHECKING:
+    from game.core.inventory import Inventory
+
+DrawList = Tuple[Tuple[Rect, ...], Tuple[Rect, ...]]  # (outline, body)
+
+# Compiled per (class, scale); patterns are ClassVars so this never goes stale
+_DRAW_LISTS: Dict[Tuple[type, int], DrawList] = {}
+
+
+def compile_pattern(pattern: Tuple[str, ...], scale: int) -> DrawList:
+    """
+    Outline = '.' cells touching a '#' (4-neighbourhood), body = '#' cells.
+    Both come back as horizontal spans so a run of cells is a single rect.
+    """
+    rows = len(pattern)
+    outline: List[Rect] = []
+    body: List[Rect] = []
+    for j, row in enumerate(pattern):
+        solid = [ch == "#" for ch in row]
+        edge = [
+            not solid[i]
+            and (
+                (j > 0 and pattern[j - 1][i] == "#")
+                or (j + 1 < rows and pattern[j + 1][i] == "#")
+                or (i > 0 and solid[i - 1])
+                or (i + 1 < len(row) and solid[i + 1])
+            )
+            for i in range(len(row))
+        ]
+        outline.extend(row_spans(edge, scale, j))
+        body.extend(row_spans(solid, scale, j))
+    return tuple(outline), tuple(body)
+
 
 @dataclass(slots=True)
 class Pickable(LevelObject):
@@ -22,12 +56,35 @@ class Pickable(LevelObject):
     spawn_y: int = 0
     spawn_room: str = ""
 
+    # Set by Inventory.track/add; told about every held_by change
+    inventory: Optional["Inventory"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    STATE_FIELDS: ClassVar[Tuple[str, ...]] = ("x", "y", "room_id", "held_by")
+    CACHEABLE: ClassVar[bool] = False  # follows its holder around
+
+    # Subclasses with pixel art set these; draw() renders the compiled spans
+    PATTERN: ClassVar[Tuple[str, ...]] = ()
+    SCALE: ClassVar[int] = 1
+
     def __post_init__(self) -> None:
         if not self.spawn_room:
             self.spawn_x = self.x
             self.spawn_y = self.y
             self.spawn_room = self.room_id
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Explicit base call: zero-arg super() breaks in slots dataclasses
+        if name != "held_by":
+            LevelObject.__setattr__(self, name, value)
+            return
+        old = getattr(self, "held_by", None)
+        LevelObject.__setattr__(self, name, value)
+        inv = getattr(self, "inventory", None)
+        if inv is not None and old != value:
+            inv.moved(self, old)
+
     def reset(self) -> None:
         # Drop item back to its spawn point
         self.held_by = None
@@ -50,8 +107,21 @@ class Pickable(LevelObject):
     def handle_input(self, which: Which, action: Action, px: int, py: int):
         return None, None
 
+    @classmethod
+    def draw_list(cls) -> DrawList:
+        key = (cls, cls.SCALE)
+        dl = _DRAW_LISTS.get(key)
+        if dl is None:
+            dl = _DRAW_LISTS[key] = compile_pattern(cls.PATTERN, cls.SCALE)
+        return dl
+
     def draw(self) -> None:
-        pass
+        outline, body = self.draw_list()
+        x, y = self.x, self.y
+        for dx, dy, w, h in outline:
+            gfx.rect(x + dx, y + dy, w, h, self.border)
+        for dx, dy, w, h in body:
+            gfx.rect(x + dx, y + dy, w, h, self.color)
 
 
 @dataclass(slots=True)
@@ -82,30 +152,3 @@ class Key(Pickable):
         if 0 <= j < len(self.PATTERN) and 0 <= i < len(self.PATTERN[0]):
             return True
         return False
-
-    # game/objects/pickable.py  (Key.draw)
-    def draw(self) -> None:
-        S = self.SCALE
-        pat = self.PATTERN
-
-        # pass 1: white edge on '.' that touches a '#'
-        for j, row in enumerate(pat):
-            for i, ch in enumerate(row):
-                if ch != ".":
-                    continue
-                neigh = (
-                    (j > 0 and pat[j - 1][i] == "#")
-                    or (j + 1 < len(pat) and pat[j + 1][i] == "#")
-                    or (i > 0 and pat[j][i - 1] == "#")
-                    or (i + 1 < len(row) and pat[j][i + 1] == "#")
-                )
-                if neigh:
-                    px, py = self.x + i * S, self.y + j * S
-                    pyxel.rect(px, py, S, S, 7)  # white
-
-        # pass 2: colored body
-        for j, row in enumerate(pat):
-            for i, ch in enumerate(row):
-                if ch == "#":
-                    px, py = self.x + i * S, self.y + j * S
-                    pyxel.rect(px, py, S, S, self.color)
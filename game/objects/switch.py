@@ -1,7 +1,8 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from typing import ClassVar, Tuple
 
-import pyxel
+from game.core.render import gfx
 from game.objects.base import LevelObject, Which, Action
 
 
@@ -16,6 +17,8 @@ class Switch(LevelObject):
     color_on: int = 11  # bright green
     border: int = 7
 
+    STATE_FIELDS: ClassVar[Tuple[str, ...]] = ("flipped",)
+
     def reset(self) -> None:
         # permanent within the level session: do not reset on loop
         pass
@@ -30,5 +33,5 @@ class Switch(LevelObject):
 
     def draw(self) -> None:
         fill = self.color_on if self.flipped else self.color_off
-        pyxel.rect(self.x, self.y, self.w, self.h, fill)
-        pyxel.rectb(self.x, self.y, self.w, self.h, self.border)
+        gfx.rect(self.x, self.y, self.w, self.h, fill)
+        gfx.rectb(self.x, self.y, self.w, self.h, self.border)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Callable, Optional, Tuple
+from typing import Callable, ClassVar, Optional, Tuple
 
-import pyxel
+from game.core.render import gfx
 from game.objects.base import LevelObject, Which, Action
 from game.core.cursor import CursorEvent
 
@@ -19,6 +19,8 @@ class ToggleSwitch(LevelObject):
     border: int = 7
     on_toggle: Optional[Callable[[bool], None]] = None
 
+    STATE_FIELDS: ClassVar[Tuple[str, ...]] = ("is_on",)
+
     def reset(self) -> None:
         self.is_on = False
 
@@ -34,5 +36,5 @@ class ToggleSwitch(LevelObject):
 
     def draw(self) -> None:
         fill = self.color_on if self.is_on else self.color_off
-        pyxel.rect(self.x, self.y, self.w, self.h, fill)
-        pyxel.rectb(self.x, self.y, self.w, self.h, self.border)
+        gfx.rect(self.x, self.y, self.w, self.h, fill)
+        gfx.rectb(self.x, self.y, self.w, self.h, self.border)
@@ -1,12 +1,12 @@
 from __future__ import annotations
-from typing import Callable, Final, List, Tuple, Dict
+from typing import Callable, Final, Tuple, Dict
 
 import pyxel
-import math
 
+from game.core.render import gfx
 from game.core.effects import Effects
-from game.core.timeline import GhostSample, TimelineManager
-from game.core.cursor import CursorCtx, apply_event
+from game.core.simulation import FrameInput, Simulation
+from game.core.sprites import dotted_ring
 from game.levels.level_base import LevelBase
 
 
@@ -18,6 +18,10 @@ class GameplayScene:
     KEY_PASS: Final[int] = pyxel.KEY_P
     KEY_COMMIT_ALT: Final[int] = pyxel.KEY_RETURN
     KEY_BACK_ALT: Final[int] = pyxel.KEY_ESCAPE
+    KEY_FAST: Final[int] = pyxel.KEY_F  # hold to fast-forward
+
+    # Fast-forward: simulated ticks per update(); only the last one is drawn
+    FAST_FORWARD_TICKS: Final[int] = 20
 
     NAV_H: Final[int] = 16
     NAV_GAP: Final[int] = 4
@@ -25,12 +29,12 @@ class GameplayScene:
     NAV_PAD_Y: Final[int] = 3
 
     NUMBER_OF_CIRCLES: Final[int] = 100
+    # Live ripples one ghost can have: 8-frame ripples, a press every other frame
+    RIPPLES_PER_GHOST: Final[int] = 4
 
-    # NEW helper
-    def _maybe_seed_timelines(self):
-        seed = getattr(self._level, "seed_timelines", None)
-        if callable(seed):
-            seed(self._timelines)
+    # Stacked-ghost count badge, relative to the pointer tip
+    BADGE_DX: Final[int] = 11
+    BADGE_DY: Final[int] = 11
 
     def __init__(
         self,
@@ -51,30 +55,17 @@ class GameplayScene:
         self._fps: Final[int] = fps
         self._loop_frames: Final[int] = loop_seconds * fps
 
-        self._timelines = TimelineManager(max_frames=self._loop_frames)
-
-        self._maybe_seed_timelines()
-
-        self._fx_ghost, self._fx_player = Effects(), Effects()
-        self._tick = 0
-        self._render_tick = 0
+        # Ripple rings sized for every ghost clicking as fast as it can
+        self._fx_ghost = Effects(
+            capacity=max(1, level.max_cursors) * self.RIPPLES_PER_GHOST
+        )
+        self._fx_player = Effects(capacity=16)
 
         # Snapshots
         self._mouse_raw_x = 0
         self._mouse_raw_y = 0
-        self._mouse_eff_x = 0
-        self._mouse_eff_y = 0
-
-        # Per-cursor contexts
-        self._player_ctx: CursorCtx = CursorCtx(room=getattr(level, "start_room", "A"))
-        self._ghost_ctxs: List[CursorCtx] = []
-
-        # Cursors (lives)
-        self._max_cursors: int = getattr(level, "max_cursors", 10)
-        self._cursors_left: int = self._max_cursors
 
         self._exit_to_menu = exit_to_menu
-        self._on_level_completed = on_level_completed
 
         self._nav_rects: Dict[str, Tuple[int, int, int, int]] = {}
 
@@ -83,59 +74,45 @@ class GameplayScene:
         self._rewind_total_frames = int(0.5 * self._fps)  # 0.5 sec
         self._time_boost_frames = 0
         self._time_boost_total = self._fps  # 1.0 sec
+        # Fast-forward stopped at a loop boundary; F must be released first
+        self._fast_held_over = False
+        # One baked ring per rewind frame: the ring never shows more steps
+        self._rewind_ring = dotted_ring(
+            radius=12,
+            dot_r=1,
+            dots=max(1, int(self.NUMBER_OF_CIRCLES)),
+            color=7,
+            frames=self._rewind_total_frames,
+        )
 
-        # Start first loop (consumes a cursor)
-        self._consume_and_start_new_loop()
-        # Provide levels with "loops left" (including current loop)
-        if hasattr(self._level, "set_loops_left_provider"):
-            self._level.set_loops_left_provider(lambda: self._cursors_left + 1)
-
-    # ----- lifecycle -----
-    def _restart_full(self) -> None:
-        """Completely restart the level: reset level state, ghosts, and lives."""
-        self._timelines.reset_all()
-        self._level.reset_level()
-        self._maybe_seed_timelines()
-        self._cursors_left = self._max_cursors
-        self._consume_and_start_new_loop()  # starts fresh loop and arms overlays
-
-    def _start_new_loop_core(self) -> None:
-        self._level.on_loop_start()
-        if (
-            hasattr(self._level, "seed_timelines")
-            and len(self._timelines.past_runs) == 0
-        ):
-            self._level.seed_timelines(self._timelines)
-        self._timelines.start_run()
-        self._fx_ghost = Effects()
-        self._fx_player = Effects()
-        self._tick = 0
-        self._render_tick = 0
-        self._player_ctx = CursorCtx(room=getattr(self._level, "start_room", "A"))
-        self._ghost_ctxs = [
-            CursorCtx(room=self._player_ctx.room) for _ in self._timelines.past_runs
-        ]
-
-    def _consume_and_start_new_loop(self) -> None:
-        # If out of cursors, reset level & timelines and refill
-        if self._cursors_left <= 0:
-            self._timelines.reset_all()
-            self._level.reset_level()
-            self._cursors_left = self._max_cursors
-
-        # Consume a cursor, start loop core, and arm overlays (no pause)
-        self._cursors_left -= 1
-        self._start_new_loop_core()
+        # Game logic lives in the headless simulation; this scene only feeds it
+        # pyxel input and draws its state. Creating it starts the first loop.
+        self._sim = Simulation(
+            level,
+            width=width,
+            height=height,
+            fps=fps,
+            loop_seconds=loop_seconds,
+            on_level_completed=on_level_completed,
+            on_click=self._on_click,
+            on_loop_started=self._on_loop_started,
+        )
+
+    # ----- simulation hooks -----
+    def _on_click(self, actor_id: int, x: int, y: int, color: int) -> None:
+        fx = self._fx_player if actor_id < 0 else self._fx_ghost
+        fx.add_click(x, y, color)
+
+    def _on_loop_started(self) -> None:
+        # Recycle effects, and arm overlays (no pause)
+        self._fx_ghost.clear()
+        self._fx_player.clear()
         self._rewind_frames_left = self._rewind_total_frames
         self._time_boost_frames = self._time_boost_total
 
-    def _commit_and_start_next(self) -> None:
-        self._timelines.end_run()
-        self._consume_and_start_new_loop()
-
-    def _restart_discard_current(self) -> None:
-        self._timelines.discard_run()
-        self._consume_and_start_new_loop()
+    def save_replay(self, path: str) -> None:
+        """Save this session's ghost runs (and RNG seed) as a replay file."""
+        self._sim.save_replay(path)
 
     # ----- nav -----
     def _measure_btn(self, label: str) -> int:
@@ -178,7 +155,7 @@ class GameplayScene:
                 getattr(self._level, "loop_seconds", self._loop_frames / self._fps) * t
             )
         # Normal countdown
-        return max(0.0, (self._loop_frames - self._render_tick) / self._fps)
+        return max(0.0, (self._loop_frames - self._sim.render_tick) / self._fps)
 
     def _time_color(self) -> int:
         secs_left = self._display_secs_left()
@@ -192,19 +169,19 @@ class GameplayScene:
         return f"Time: {self._display_secs_left():0.1f}s"
 
     def _cursors_color(self) -> int:
-        return 8 if self._cursors_left == 0 else 7
+        return 8 if self._sim.cursors_left == 0 else 7
 
     def _format_cursors_label(self) -> str:
-        return f"{self._cursors_left + 1}/{self._max_cursors}"
+        return f"{self._sim.cursors_left + 1}/{self._sim.max_cursors}"
 
     def _draw_nav(self) -> None:
-        pyxel.rect(0, 0, self._w, self.NAV_H, 0)
+        gfx.rect(0, 0, self._w, self.NAV_H, 0)
 
         def center_text(x: int, w: int, y: int, txt: str, col: int) -> None:
             tw = len(txt) * 4
             tx = x + (w - tw) // 2
             ty = y + (self.NAV_H - 6) // 2
-            pyxel.text(tx, ty, txt, col)
+            gfx.text(tx, ty, txt, col)
 
         labels = {
             "levels": "[L]evels",
@@ -224,7 +201,7 @@ class GameplayScene:
         }
 
         for key, (x, y, w, h) in self._nav_rects.items():
-            pyxel.rectb(x, y, w, h, 7)
+            gfx.rectb(x, y, w, h, 7)
             center_text(x, w, y, labels[key], colors[key])
 
     def _handle_nav_click(self, mx: int, my: int) -> bool:
@@ -239,10 +216,10 @@ class GameplayScene:
                         self._exit_to_menu()
                         return True
                     if key == "restart":
-                        self._restart_full()
+                        self._sim.restart_full()
                         return True
                     if key == "pass":
-                        self._commit_and_start_next()
+                        self._sim.commit_and_start_next()
                         return True
         return False
 
@@ -258,21 +235,17 @@ class GameplayScene:
             self._exit_to_menu()
             return
         if pyxel.btnp(self.KEY_RESTART):
-            self._restart_full()
+            self._sim.restart_full()
             return
         if pyxel.btnp(self.KEY_PASS) or pyxel.btnp(self.KEY_COMMIT_ALT):
-            self._commit_and_start_next()
+            self._sim.commit_and_start_next()
             return
         if self._exit_to_menu and pyxel.btnp(self.KEY_BACK_ALT):
             self._exit_to_menu()
             return
         if pyxel.btnp(pyxel.KEY_N):
             # Hard reset: refill cursors and reset timelines/level
-            self._timelines.reset_all()
-            self._level.reset_level()
-            self._maybe_seed_timelines()
-            self._cursors_left = self._max_cursors
-            self._consume_and_start_new_loop()
+            self._sim.restart_full()
             return
 
         # Clamp + snapshot raw
@@ -282,13 +255,9 @@ class GameplayScene:
 
         # Nav click (consume)
         if self._handle_nav_click(mx, my):
-            self._timelines.record_frame(mx, my, False, False, False, False)
             self._fx_ghost.update()
             self._fx_player.update()
-            self._render_tick = self._tick
-            self._tick += 1
-            if self._tick >= self._loop_frames:
-                self._commit_and_start_next()
+            self._sim.step_idle(mx, my)
             return
 
         # Overlays: decrement timers (NO pause)
@@ -298,158 +267,99 @@ class GameplayScene:
             self._time_boost_frames -= 1
 
         # Buttons: press + hold
-        left_p = bool(pyxel.btnp(pyxel.MOUSE_BUTTON_LEFT))
-        right_p = bool(pyxel.btnp(pyxel.MOUSE_BUTTON_RIGHT))
-        left_h = bool(pyxel.btn(pyxel.MOUSE_BUTTON_LEFT))
-        right_h = bool(pyxel.btn(pyxel.MOUSE_BUTTON_RIGHT))
-
-        # Record frame (raw)
-        self._timelines.record_frame(mx, my, left_p, right_p, left_h, right_h)
-
-        # --- GHOSTS ---
-        ghosts: List[GhostSample] = self._timelines.ghosts_for_frame(self._tick)
-        while len(self._ghost_ctxs) < len(ghosts):
-            self._ghost_ctxs.append(CursorCtx(room=self._player_ctx.room))
-
-        for idx, g in enumerate(ghosts):
-            ctx = self._ghost_ctxs[idx]
-            gx = max(0, min(self._w - 1, int(g.x) + ctx.offset_x))
-            gy = max(0, min(self._h - 1, int(g.y) + ctx.offset_y))
-
-            # FX only if visible in the same room as the player
-            if (g.left_p or g.right_p) and ctx.room == self._player_ctx.room:
-                self._fx_ghost.add_click(gx, gy, int(g.color))
-
-            # Mark the acting ghost and PROCESS INPUTS FIRST (may change ctx.room)
-            self._level.set_active_actor(idx)
-            if g.left_p:
-                evt = self._level.interact("L", "press", gx, gy, ctx.room)
-                if evt is not None:
-                    apply_event(ctx, evt, int(g.x), int(g.y))
-            if g.right_p:
-                evt = self._level.interact("R", "press", gx, gy, ctx.room)
-                if evt is not None:
-                    apply_event(ctx, evt, int(g.x), int(g.y))
-            if g.left_h:
-                evt = self._level.interact("L", "hold", gx, gy, ctx.room)
-                if evt is not None:
-                    apply_event(ctx, evt, int(g.x), int(g.y))
-            if g.right_h:
-                evt = self._level.interact("R", "hold", gx, gy, ctx.room)
-                if evt is not None:
-                    apply_event(ctx, evt, int(g.x), int(g.y))
-
-            # NOW report final per-actor frame (after any room change)
-            self._level.on_actor_frame(idx, gx, gy, ctx.room)
-
-            # --- PLAYER ---
-        px_eff = max(0, min(self._w - 1, mx + self._player_ctx.offset_x))
-        py_eff = max(0, min(self._h - 1, my + self._player_ctx.offset_y))
-        self._mouse_eff_x, self._mouse_eff_y = px_eff, py_eff
-
-        if left_p or right_p:
-            self._fx_player.add_click(px_eff, py_eff, 7)
-            self._level.set_active_actor(-1)
-            if left_p:
-                evt = self._level.interact(
-                    "L", "press", px_eff, py_eff, self._player_ctx.room
-                )
-                if evt is not None:
-                    apply_event(self._player_ctx, evt, mx, my)
-            if right_p:
-                evt = self._level.interact(
-                    "R", "press", px_eff, py_eff, self._player_ctx.room
-                )
-                if evt is not None:
-                    apply_event(self._player_ctx, evt, mx, my)
-
-        self._level.set_active_actor(-1)
-        if left_h:
-            evt = self._level.interact(
-                "L", "hold", px_eff, py_eff, self._player_ctx.room
-            )
-            if evt is not None:
-                apply_event(self._player_ctx, evt, mx, my)
-        if right_h:
-            evt = self._level.interact(
-                "R", "hold", px_eff, py_eff, self._player_ctx.room
-            )
-            if evt is not None:
-                apply_event(self._player_ctx, evt, mx, my)
-
-        # Report AFTER any room changes this frame
-        self._level.on_actor_frame(-1, px_eff, py_eff, self._player_ctx.room)
+        inp = FrameInput(
+            mouse_x=mx,
+            mouse_y=my,
+            left_p=bool(pyxel.btnp(pyxel.MOUSE_BUTTON_LEFT)),
+            right_p=bool(pyxel.btnp(pyxel.MOUSE_BUTTON_RIGHT)),
+            left_h=bool(pyxel.btn(pyxel.MOUSE_BUTTON_LEFT)),
+            right_h=bool(pyxel.btn(pyxel.MOUSE_BUTTON_RIGHT)),
+        )
+        fast = pyxel.btn(self.KEY_FAST)
+        if not fast:
+            self._fast_held_over = False
+        if fast and not self._fast_held_over:
+            self._fast_forward(inp)
+        else:
+            self._sim.step(inp)
 
         # Update effects
         self._fx_ghost.update()
         self._fx_player.update()
 
-        # Completion?
-        if getattr(self._level, "completed", False) and self._on_level_completed:
-            self._on_level_completed(getattr(self._level, "name", "Level"))
-            return
-
-        # Advance
-        self._render_tick = self._tick
-        self._tick += 1
-        if self._tick >= self._loop_frames:
-            self._commit_and_start_next()
+    def _fast_forward(self, inp: FrameInput) -> None:
+        """
+        Run FAST_FORWARD_TICKS ticks in one update. The real input lands on the
+        first tick; later ticks repeat the position and held buttons (presses are
+        one-shot). Only the last tick, and a tick with a press, feed effects and
+        the ghost snapshot. Stops when the loop ends: nothing is fast-forwarded
+        into the next loop until F is pressed again.
+        """
+        sim = self._sim
+        last = self.FAST_FORWARD_TICKS - 1
+        for i in range(self.FAST_FORWARD_TICKS):
+            tick = sim.tick
+            sim.step(inp, render=(i == last or inp.left_p or inp.right_p))
+            if sim.completed:
+                return
+            if sim.tick <= tick:  # rolled over into a new loop
+                self._fast_held_over = True
+                return
+            if i == 0:
+                inp = FrameInput(
+                    inp.mouse_x, inp.mouse_y, False, False, inp.left_h, inp.right_h
+                )
 
     def draw(self) -> None:
-        pyxel.cls(1)
-        self._level.draw_room(self._player_ctx.room)
+        sim = self._sim
+        room = sim.player_ctx.room
+        gfx.cls(1)
+        self._level.draw_room(room)
         self._fx_ghost.draw()
 
-        ghosts = self._timelines.ghosts_for_frame(self._render_tick)
-        for idx, g in enumerate(ghosts):
-            if idx >= len(self._ghost_ctxs):
-                continue
-            ctx = self._ghost_ctxs[idx]
-            if ctx.room != self._player_ctx.room:
-                continue
-            gx = int(g.x) + ctx.offset_x
-            gy = int(g.y) + ctx.offset_y
-            if 0 <= gx < self._w and 0 <= gy < self._h:
-                self._draw_pointer(int(gx), int(gy), int(g.color), int(0))
+        # Ghosts sharing a position (e.g. finished runs parked on their last
+        # frame) are drawn once with a count badge. Stacks keep the order and
+        # color of their topmost ghost so overlaps look as before.
+        frame = sim.ghost_frame_for(sim.render_tick)
+        stacks: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        for gx, gy, g_room, color, visible in zip(
+            frame.xs, frame.ys, frame.rooms, frame.colors, frame.on_screen
+        ):
+            if visible and g_room == room:
+                count, _ = stacks.pop((gx, gy), (0, 0))
+                stacks[(gx, gy)] = (count + 1, color)
+        for (gx, gy), (count, color) in stacks.items():
+            self._draw_pointer(gx, gy, color, 0)
+            if count > 1:
+                self._draw_stack_badge(gx, gy, count)
 
         self._fx_player.draw()
-        self._draw_pointer(
-            int(self._mouse_eff_x), int(self._mouse_eff_y), int(7), int(0)
-        )
+        self._draw_pointer(int(sim.player_x), int(sim.player_y), int(7), int(0))
         # NEW: top overlays from level (pickables on top)
         if hasattr(self._level, "draw_room_overlay"):
-            self._level.draw_room_overlay(self._player_ctx.room)
+            self._level.draw_room_overlay(room)
 
         self._draw_nav()
 
         # --- Overlays on top (ring follows current mouse) ---
         if self._rewind_frames_left > 0:
             prog = 1.0 - (self._rewind_frames_left / max(1, self._rewind_total_frames))
-            self._draw_rewind_ring(int(self._mouse_eff_x), int(self._mouse_eff_y), prog)
+            self._draw_rewind_ring(int(sim.player_x), int(sim.player_y), prog)
+
+    def _draw_stack_badge(self, x: int, y: int, count: int) -> None:
+        # Just past the arrow's diagonal edge
+        txt = str(count)
+        bx, by = x + self.BADGE_DX, y + self.BADGE_DY
+        gfx.rect(bx - 1, by - 1, len(txt) * 4 + 1, 7, 0)
+        gfx.text(bx, by, txt, 7)
 
     def _draw_rewind_ring(self, cx: int, cy: int, progress: float) -> None:
         """
         Dotted rewind ring:
-        - draws filled, overlapping 10px-diameter circles along a radius
-        - draws only the first N dots based on 'progress' in [0..1]
+        - filled 2px dots on a radius-12 circle around the cursor
+        - only the first N dots are shown, based on 'progress' in [0..1]
         - smoothness controlled by NUMBER_OF_CIRCLES
+        The ring is baked into one sprite per rewind frame up front
+        (see sprites.ProgressFrames), so this is one blt.
         """
-        if progress <= 0.0:
-            return
-        progress = min(1.0, progress)
-
-        R = 12  # distance of ring from cursor
-        DOT_DIAM = 2
-        DOT_R = DOT_DIAM // 2
-        NUM = max(1, int(self.NUMBER_OF_CIRCLES))
-
-        # How many dots to show (ceil so first dot appears immediately)
-        shown = max(1, min(NUM, int(math.ceil(progress * NUM))))
-
-        # Start at top (-90°) and go clockwise
-        start_angle = -math.pi / 2.0
-        for i in range(shown):
-            theta = start_angle + (2.0 * math.pi) * (i / NUM)
-            x = cx + int(round(R * math.cos(theta)))
-            y = cy + int(round(R * math.sin(theta)))
-            pyxel.circ(x, y, DOT_R, 7)  # filled white dot
+        self._rewind_ring.draw(cx, cy, progress)
@@ -1,94 +1,64 @@
 from __future__ import annotations
-from typing import Callable, Final, List
+from typing import Callable, Final
 import random
 import math
 import pyxel
 
+from game.core.render import gfx
+from game.core.effects import FIREWORK_PALETTE, ParticleSystem
 
-class _Particle:
-    __slots__ = ("x", "y", "vx", "vy", "age", "max_age", "color", "radius")
 
+class LevelFinishedScene:
     def __init__(
         self,
-        x: float,
-        y: float,
-        vx: float,
-        vy: float,
-        color: int,
-        max_age: int,
-        radius: int,
+        level_name: str,
+        on_done: Callable[[], None],
+        rng: random.Random | None = None,
     ) -> None:
-        self.x, self.y = x, y
-        self.vx, self.vy = vx, vy
-        self.age = 0
-        self.max_age = max_age
-        self.color = color
-        self.radius = radius
-
-    def update(self) -> bool:
-        # physics: gravity + mild drag for a pleasing arc
-        self.vy += 0.08  # gravity (pull down)
-        self.vx *= 0.995  # slight drag
-        self.vy *= 0.995
-
-        self.x += self.vx
-        self.y += self.vy
-
-        self.age += 1
-        return self.age < self.max_age
-
-    def draw(self) -> None:
-        # shrink over life; switch to pixel at the end for sparkle
-        t = self.age / self.max_age
-        r = max(1, int(self.radius * (1.0 - t)))
-        ix, iy = int(self.x), int(self.y)
-        if 0 <= ix < pyxel.width and 0 <= iy < pyxel.height:
-            if r <= 1:
-                pyxel.pset(ix, iy, self.color)
-            else:
-                pyxel.circ(ix, iy, r, self.color)
-
-
-class LevelFinishedScene:
-    def __init__(self, level_name: str, on_done: Callable[[], None]) -> None:
         self._name = level_name
         self._on_done = on_done
+        # Cosmetic stream for the celebration (pass one in for reproducible output)
+        self._rng = rng if rng is not None else random.Random()
         self._timer = 0
         self._wait_frames: Final[int] = 600  # ~2s at 30fps
 
-        self._parts: List[_Particle] = []
+        # physics: gravity + mild drag for a pleasing arc; small sparks are pixels
+        self._parts = ParticleSystem(capacity=1024, gravity=0.08, drag=0.995)
         self._spawn_cooldown = 0
 
     def _spawn_firework(self) -> None:
+        rng = self._rng
+
         # Pick a random center (keep away from edges a bit)
-        cx = random.randint(24, pyxel.width - 24)
-        cy = random.randint(28, pyxel.height - 24)
+        cx = rng.randint(24, gfx.width - 24)
+        cy = rng.randint(28, gfx.height - 24)
 
         # Base parameters
-        n = random.randint(22, 36)  # number of spokes
-        base_speed = random.uniform(1.3, 2.4)  # initial radial speed
-        max_age = random.randint(22, 34)  # particle lifetime
-        radius0 = random.randint(2, 4)  # initial draw radius
-        palette = [7, 8, 9, 10, 11, 12, 13, 14]
-        base_color = random.choice(palette)
+        n = rng.randint(22, 36)  # number of spokes
+        base_speed = rng.uniform(1.3, 2.4)  # initial radial speed
+        max_age = rng.randint(22, 34)  # particle lifetime
+        radius0 = rng.randint(2, 4)  # initial draw radius
+        palette = FIREWORK_PALETTE
+        base_color = rng.choice(palette)
 
         # Create a circular ring of particles with slight jitter
+        vxs, vys, cols, radii = [], [], [], []
         for i in range(n):
-            theta = (2.0 * math.pi * i / n) + random.uniform(-0.06, 0.06)
-            spd = base_speed * random.uniform(0.9, 1.1)
-            vx = spd * math.cos(theta)
-            vy = spd * math.sin(theta)
-            color = base_color if random.random() < 0.7 else random.choice(palette)
-            pr = radius0 if random.random() < 0.75 else max(1, radius0 - 1)
-            self._parts.append(_Particle(cx, cy, vx, vy, color, max_age, pr))
-
-        # Core flash: short-lived bright puff at the center
-        flash_color = random.choice(palette)
-        for _ in range(6):
-            self._parts.append(_Particle(cx, cy, 0.0, 0.0, flash_color, 8, radius0 + 1))
+            theta = (2.0 * math.pi * i / n) + rng.uniform(-0.06, 0.06)
+            spd = base_speed * rng.uniform(0.9, 1.1)
+            vxs.append(spd * math.cos(theta))
+            vys.append(spd * math.sin(theta))
+            cols.append(base_color if rng.random() < 0.7 else rng.choice(palette))
+            radii.append(radius0 if rng.random() < 0.75 else max(1, radius0 - 1))
+        self._parts.emit(cx, cy, vxs, vys, cols, max_age, radii)
+
+        # Core flash: short-lived bright puff at the center (one particle is
+        # enough; it doesn't move, so extra copies would draw the same pixels)
+        flash_color = rng.choice(palette)
+        self._parts.emit(cx, cy, 0.0, 0.0, flash_color, 8, radius0 + 1)
 
         # Next burst after a short random delay
-        self._spawn_cooldown = random.randint(8, 14)
+        self._spawn_cooldown = rng.randint(8, 14)
 
     def update(self) -> None:
         self._timer += 1
@@ -100,7 +70,7 @@ class LevelFinishedScene:
             self._spawn_cooldown -= 1
 
         # update particles
-        self._parts = [p for p in self._parts if p.update()]
+        self._parts.update()
 
         # exit
         if (
@@ -111,16 +81,15 @@ class LevelFinishedScene:
             self._on_done()
 
     def draw(self) -> None:
-        pyxel.cls(1)
+        gfx.cls(1)
 
         # fireworks behind text
-        for p in self._parts:
-            p.draw()
+        self._parts.draw()
 
         msg = f"Level '{self._name}' finished!"
         tw = len(msg) * 4
-        pyxel.text((pyxel.width - tw) // 2, pyxel.height // 2 - 4, msg, 7)
+        gfx.text((gfx.width - tw) // 2, gfx.height // 2 - 4, msg, 7)
 
         hint = "Click or Enter to continue"
         th = len(hint) * 4
-        pyxel.text((pyxel.width - th) // 2, pyxel.height // 2 + 8, hint, 6)
+        gfx.text((gfx.width - th) // 2, gfx.height // 2 + 8, hint, 6)
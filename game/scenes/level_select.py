@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from typing import Sequence, Tuple, Optional, Type, Callable
 
 import pyxel
+from game.core.render import gfx
 from game.levels.level_base import LevelBase
 
 
@@ -49,7 +50,7 @@ class LevelSelectScene:
     def _center_text(self, x: int, w: int, y: int, text: str, col: int) -> None:
         tw = len(text) * 4
         tx = x + (w - tw) // 2
-        pyxel.text(tx, y, text, col)
+        gfx.text(tx, y, text, col)
 
     def _draw_difficulty_row(self, x: int, w: int, y: int, diff: int) -> None:
         # 0: gray gray gray; 1: green gray gray; 2: yellow yellow gray; 3+: red red red
@@ -66,7 +67,7 @@ class LevelSelectScene:
         start_x = x + (w - total_w) // 2
         for i, col in enumerate(cols):
             px = start_x + i * 8  # 4px char + 4px space
-            pyxel.text(px, y, "O", col)
+            gfx.text(px, y, "O", col)
 
     def update(self) -> None:
         if pyxel.btnp(pyxel.KEY_Q):
@@ -85,7 +86,7 @@ class LevelSelectScene:
                     return
 
     def draw(self) -> None:
-        pyxel.cls(1)
+        gfx.cls(1)
 
         self._center_text(150, 10, 4, "T I M E    L O O P", 12)
         self._center_text(150, 10, 12, "SELECT YOUR LEVEL", 5)
@@ -97,8 +98,8 @@ class LevelSelectScene:
             diff = int(getattr(level_cls, "difficulty", 0))
             done = self._is_completed(name)
 
-            pyxel.rect(x, y, w, h, 11 if done else 0)
-            pyxel.rectb(x, y, w, h, 7)
+            gfx.rect(x, y, w, h, 11 if done else 0)
+            gfx.rectb(x, y, w, h, 7)
 
             self._center_text(x, w, y + h // 2 - 3, str(i + 1), 7)
             self._center_text(x, w, y + h + 6, f"{name}", 6)
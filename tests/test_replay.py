@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from game.core.replay import (
+    _HEADER,
+    _HEADER_V1,
+    MAGIC,
+    VERSION,
+    _decode_varints,
+    _put_varint,
+    _zigzag,
+    dump_replay,
+    load_replay,
+    open_replay,
+    save_replay,
+)
+from game.core.timeline import Timeline, TimelineManager
+
+MAX_FRAMES = 64
+
+
+def _record(tm: TimelineManager, frames) -> None:
+    tm.start_run()
+    for x, y, lp, rp, lh, rh in frames:
+        tm.record_frame(x, y, lp, rp, lh, rh)
+    tm.end_run()
+
+
+def _manager() -> TimelineManager:
+    tm = TimelineManager(max_frames=MAX_FRAMES, max_runs=4)
+    # negative and large deltas (zigzag, multi-byte varints), repeated bits (RLE)
+    _record(
+        tm,
+        [
+            (0, 0, False, False, False, False),
+            (-300, 5, True, False, True, False),
+            (-300, 5, False, False, True, False),
+            (299, -199, False, False, True, False),
+            (299, -199, False, True, False, True),
+            (32767, -32768, False, False, False, False),
+        ],
+    )
+    _record(tm, [(150, 100, False, False, False, False)] * 40)
+    _record(tm, [])
+    return tm
+
+
+def _columns(tl: Timeline):
+    n = len(tl)
+    return list(tl.xs[:n]), list(tl.ys[:n]), bytes(tl.bits[:n])
+
+
+def _assert_same_runs(tm: TimelineManager, runs) -> None:
+    assert len(runs) == len(tm.past_runs)
+    for got, want in zip(runs, tm.past_runs):
+        assert _columns(got) == _columns(want)
+
+
+def test_round_trip_load_replay():
+    tm = _manager()
+    replay = load_replay(dump_replay(tm, "Chase", 30, 1234))
+    assert replay.header.level_name == "Chase"
+    assert replay.header.fps == 30
+    assert replay.header.loop_frames == MAX_FRAMES
+    assert replay.header.version == VERSION
+    assert replay.header.seed == 1234
+    _assert_same_runs(tm, replay.runs)
+
+
+def test_round_trip_open_replay(tmp_path):
+    tm = _manager()
+    path = tmp_path / "run.rpl"
+    save_replay(str(path), tm, "Chase", 30, 1234)
+    replay = open_replay(str(path))
+    _assert_same_runs(tm, replay.runs)
+
+    # apply_to installs the runs as ghosts
+    target = TimelineManager(max_frames=MAX_FRAMES)
+    replay.apply_to(target)
+    batch = target.ghost_batch_for_frame(3)
+    assert batch.x.tolist() == [299, 150, target.player_pos[0]]
+
+
+def test_varint_and_zigzag():
+    values = [0, 1, 127, 128, 300, 16384, 2**35]
+    out = bytearray()
+    for n in values:
+        _put_varint(out, n)
+    assert _decode_varints(np.frombuffer(bytes(out), dtype=np.uint8)).tolist() == (
+        values
+    )
+    assert [_zigzag(n) for n in (0, -1, 1, -2, 2)] == [0, 1, 2, 3, 4]
+
+
+def test_bits_are_run_length_encoded():
+    tm = TimelineManager(max_frames=MAX_FRAMES)
+    _record(tm, [(0, 0, False, False, True, False)] * 50)
+    data = dump_replay(tm, "", 30, 0)
+    # header, run count, frame count, 100 one-byte deltas, one RLE pair
+    assert len(data) == _HEADER.size + 2 + 1 + 100 + 1 + 2
+    _assert_same_runs(tm, load_replay(data).runs)
+
+
+def test_version_1_has_no_seed():
+    tm = _manager()
+    data = dump_replay(tm, "Chase", 30, 1234)
+    # a v1 header is the v2 one without the seed field
+    magic, _, fps, loop_frames, _, name_len = _HEADER.unpack_from(data, 0)
+    v1 = _HEADER_V1.pack(magic, 1, fps, loop_frames, name_len) + data[_HEADER.size :]
+    replay = load_replay(v1)
+    assert replay.header.version == 1
+    assert replay.header.seed is None
+    assert replay.header.level_name == "Chase"
+    _assert_same_runs(tm, replay.runs)
+
+
+def test_bad_magic():
+    data = bytearray(dump_replay(_manager(), "Chase", 30, 1234))
+    data[:4] = b"NOPE"
+    with pytest.raises(ValueError, match="not a replay"):
+        load_replay(bytes(data))
+
+
+def test_unsupported_version():
+    data = bytearray(dump_replay(_manager(), "Chase", 30, 1234))
+    data[len(MAGIC)] = VERSION + 1
+    with pytest.raises(ValueError, match="unsupported replay version"):
+        load_replay(bytes(data))
+
+
+@pytest.mark.parametrize("cut", [0, 3, 12, 15, 20, -40, -1])
+def test_truncated(cut):
+    data = dump_replay(_manager(), "Chase", 30, 1234)
+    with pytest.raises(ValueError):
+        load_replay(data[:cut])
+
+
+def test_chase_seed_asset():
+    replay = open_replay("game/assets/chase_seed.rpl")
+    assert replay.header.version == VERSION
+    assert replay.header.seed == 0
+    assert len(replay.runs) == 1
+    assert len(replay.runs[0]) == replay.header.loop_frames
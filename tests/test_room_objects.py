@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import random
+
+from game.core.room_objects import RoomObjects
+from game.objects.base import LevelObject
+from game.objects.button import Button
+from game.objects.flag import Flag
+
+OPS = (
+    "append",
+    "insert",
+    "extend",
+    "iadd",
+    "set",
+    "set_slice",
+    "del",
+    "del_slice",
+    "pop",
+    "remove",
+    "sort",
+    "reverse",
+    "clear",
+)
+
+
+def _make(rnd: random.Random, i: int) -> LevelObject:
+    # i keeps every object unequal to the others (dataclass equality)
+    x, y = rnd.randint(-10, 290), rnd.randint(-10, 190)
+    if rnd.random() < 0.3:
+        r = rnd.randint(4, 20)
+        return Button(x=x, y=y, w=2 * r, h=2 * r, radius=r, color_off=i)
+    return Flag(x=x, y=y, w=rnd.randint(0, 70), h=rnd.randint(0, 70), label=str(i))
+
+
+def _in_bounds(obj: LevelObject, px: int, py: int) -> bool:
+    x, y, w, h = obj.bounds()
+    return x <= px < x + w and y <= py < y + h
+
+
+def _check(room: RoomObjects, rnd: random.Random) -> None:
+    points = [(rnd.randint(-20, 320), rnd.randint(-20, 220)) for _ in range(60)]
+    points += [(o.x, o.y) for o in room]
+    for px, py in points:
+        near = room.at(px, py)
+        assert [o for o in near if o.contains(px, py)] == [
+            o for o in room if o.contains(px, py)
+        ]
+        # at() keeps draw order and never misses an object whose area is hit
+        assert [o for o in near if _in_bounds(o, px, py)] == [
+            o for o in room if _in_bounds(o, px, py)
+        ]
+
+
+def test_at_matches_brute_force_through_mutations():
+    rnd = random.Random(7)
+    made = 0
+
+    def new() -> LevelObject:
+        nonlocal made
+        made += 1
+        return _make(rnd, made)
+
+    room = RoomObjects(new() for _ in range(8))
+    _check(room, rnd)
+    for _ in range(300):
+        op = rnd.choice(OPS)
+        if op == "append":
+            room.append(new())
+        elif op == "insert":
+            room.insert(rnd.randint(0, len(room)), new())
+        elif op == "extend":
+            room.extend([new(), new()])
+        elif op == "iadd":
+            room += [new()]
+        elif op == "sort":
+            room.sort(key=lambda o: (o.y, o.x))
+        elif op == "reverse":
+            room.reverse()
+        elif op == "clear" and rnd.random() < 0.1:
+            room.clear()
+        elif room:
+            i = rnd.randrange(len(room))
+            if op == "set":
+                room[i] = new()
+            elif op == "set_slice":
+                room[i : i + 2] = [new()]
+            elif op == "del":
+                del room[i]
+            elif op == "del_slice":
+                del room[i : i + 2]
+            elif op == "pop":
+                room.pop(i)
+            elif op == "remove":
+                room.remove(room[i])
+        _check(room, rnd)